@@ -69,6 +69,7 @@ setup(
         "ore_algebra.examples",
     ],
     package_dir = {'': 'src/'},
+    package_data = {"ore_algebra.analytic.examples": ["*.json"]},
     ext_modules = extensions,
     include_dirs = sage.env.sage_include_directories(),
     cmdclass = {'test': TestCommand},
@@ -12,29 +12,60 @@ Custom differential operators
 #
 # http://www.gnu.org/licenses/
 
+import logging
+import weakref
+
 from sage.arith.functions import lcm
 from sage.misc.cachefunc import cached_method
+from sage.misc.misc_c import prod
 from sage.rings.cif import CIF
+from sage.rings.complex_arb import ComplexBallField
 from sage.rings.qqbar import QQbar
 from sage.rings.rational_field import Q as QQ
 from sage.rings.integer_ring import Z as ZZ
 from sage.rings.infinity import infinity
 from sage.rings.number_field import number_field_base
 from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing
+from sage.structure.factorization import Factorization
 
 from ..ore_algebra import OreAlgebra
 from ..differential_operator_1_1 import UnivariateDifferentialOperatorOverUnivariateRing
 
 from .context import dctx
-from .polynomial_root import roots_of_irred
+from .polynomial_root import refine_roots, roots_of_irred
 
 from . import utilities
 
+logger = logging.getLogger(__name__)
+
+def _dop_alg_with_base(Dops, Scalars):
+    Pols = Dops.base_ring()
+    return OreAlgebra(Pols.change_ring(Scalars),
+                      (Dops.variable_name(), {}, {Pols.gen(): Pols.one()}),
+                      check_base_ring=False)
+
+# id(dop) -> (weak reference to dop, wrapper), so that wrapping the same
+# operator several times returns the same PlainDifferentialOperator (along
+# with everything cached on it) as long as the original operator is alive
+_wrappers = {}
+
 def DifferentialOperator(dop):
     if isinstance(dop, PlainDifferentialOperator):
         return dop
-    else:
-        return PlainDifferentialOperator(dop)
+    key = id(dop)
+    entry = _wrappers.get(key)
+    if entry is not None and entry[0]() is dop:
+        return entry[1]
+    wrapper = PlainDifferentialOperator(dop)
+    def forget(ref):
+        if _wrappers.get(key, (None,))[0] is ref:
+            del _wrappers[key]
+    try:
+        ref = weakref.ref(dop, forget)
+    except TypeError:
+        return wrapper
+    _wrappers[key] = (ref, wrapper)
+    return wrapper
 
 class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing):
     r"""
@@ -47,10 +78,26 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
             raise ValueError("operator must be nonzero")
         if not dop.parent().is_D():
             raise ValueError("expected an operator in K(x)[D]")
-        _, _, Scalars, dop = dop.numerator()._normalize_base_ring()
+        Dops = dop.parent()
+        Pols = None
+        if Dops.base_ring().is_field():
+            try:
+                Pols = Dops.base_ring().ring()
+            except AttributeError: # not a fraction field
+                pass
+        if Pols is not None and all(c.denominator().is_one() for c in dop):
+            # Skip the multiplication by the (trivial) common denominator
+            dop = Dops.change_ring(Pols)([c.numerator() for c in dop])
+        else:
+            dop = dop.numerator()
+        _, _, Scalars, dop = dop._normalize_base_ring()
         if isinstance(Scalars, number_field_base.NumberField):
-            den = lcm(utilities.internal_denominator(c)
-                        for pol in dop for c in pol)
+            # Most denominators are repeated (typically equal to one), and
+            # the lcm of small integers first keeps the intermediate results
+            # small
+            dens = set(utilities.internal_denominator(c)
+                       for pol in dop for c in pol)
+            den = lcm(sorted(dens))
             dop *= den
         super().__init__(dop.parent(), dop, check_base_ring=False)
 
@@ -72,6 +119,22 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
 
         return s
 
+    @cached_method
+    def _indicial_polynomial(self, p):
+        r"""
+        Cached version of :meth:`indicial_polynomial`.
+        """
+        return self.indicial_polynomial(p)
+
+    @cached_method
+    def _local_exponents(self, p):
+        r"""
+        Roots in QQbar, without multiplicities, of the indicial polynomial of
+        self at (a root of) ``p``, where ``p`` is an irreducible polynomial
+        or ``1/x``.
+        """
+        return self._indicial_polynomial(p).roots(QQbar, multiplicities=False)
+
     @cached_method
     def _naive_height(self):
         r"""
@@ -172,12 +235,16 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
     def singularities(self, *args):
         raise NotImplementedError("use _singularities()")
 
+    @cached_method
+    def _desingularized(self):
+        return self.desingularize(m=1)
+
     @cached_method
     def split_leading_coefficient(self):
         lc = self.leading_coefficient()
         if lc.base_ring() is not QQ: # not worth the effort
             return lc, lc.parent().one()
-        dlc = self.desingularize(m=1).leading_coefficient()
+        dlc = self._desingularized().leading_coefficient()
         alc, rem = lc.quo_rem(dlc)
         assert rem.is_zero()
         # "Partly apparent" factors go in the non-apparent one
@@ -188,6 +255,54 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
             alc //= g
             dlc *= g
 
+    @cached_method
+    def _lc(self, apparent=None):
+        r"""
+        Exact version of the leading coefficient of self, or of the factor of
+        the leading coefficient selected by ``apparent`` (same convention as in
+        :meth:`_singularities`).
+        """
+        if apparent is None:
+            pol = self.leading_coefficient()
+        else:
+            # The way we are doing this at the moment will likely fail for
+            # inexact operators, even if the leading coefficient is exact, so
+            # let's not even try doing anything clever in this case.
+            dlc, alc = self.split_leading_coefficient()
+            pol = alc if apparent else dlc
+        return utilities.exactify_polynomial(pol)
+
+    @cached_method
+    def _lc_factors(self, apparent=None):
+        r"""
+        Factorization of :meth:`_lc`, computed only once per operator and
+        shared by all calls to :meth:`_singularities`.
+
+        The factorizations for ``apparent=True`` and ``apparent=False`` are
+        coprime and multiply to that for ``apparent=None``, so we derive them
+        from each other when possible instead of factoring again.
+        """
+        if apparent is None:
+            try:
+                fdlc = self._lc_factors.cached(False)
+                falc = self._lc_factors.cached(True)
+            except KeyError:
+                return self._lc(apparent).factor()
+            return Factorization(list(fdlc) + list(falc),
+                                 unit=fdlc.unit()*falc.unit())
+        try:
+            flc = self._lc_factors.cached(None)
+        except KeyError:
+            return self._lc(apparent).factor()
+        pol = self._lc(apparent)
+        facs = [(fac, mult) for fac, mult in flc if fac.divides(pol)]
+        unit = pol // prod(fac**mult for fac, mult in facs)
+        return Factorization(facs, unit=unit.constant_coefficient())
+
+    @cached_method
+    def _roots_of_lc_factor(self, fac):
+        return roots_of_irred(fac)
+
     @cached_method
     def _singularities(self, dom=None, multiplicities=False, apparent=None):
         r"""
@@ -204,6 +319,17 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
           some apparent ones) contained in the subset corresponding to
           ``apparent=False``.
         """
+        if dom is not None and not multiplicities:
+            # Share the conversion to dom with the variant with multiplicities
+            try:
+                sing = self._singularities(dom, multiplicities=True,
+                                           apparent=apparent)
+            except ValueError:
+                if self.base_ring().is_exact():
+                    raise
+                return self._singularities_inexact(dom, multiplicities,
+                                                   apparent)
+            return [s for s, _ in sing]
         if dom is not None or not multiplicities:
             # If possible, memoize the exact roots with multiplicities
             try:
@@ -215,6 +341,8 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
                 return self._singularities_inexact(dom, multiplicities,
                                                    apparent)
             if dom is not None:
+                if isinstance(dom, ComplexBallField):
+                    refine_roots((rt for rt, _ in sing), dom.precision())
                 sing = [(dom(rt), mult) for rt, mult in sing]
             if not multiplicities:
                 sing = [s for s, _ in sing]
@@ -230,19 +358,11 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
                     continue
                 sing += self._singularities(dom, multiplicities, not b)
                 return sing
-            pol = self.leading_coefficient()
-        else:
-            # The way we are doing this at the moment will likely fail for
-            # inexact operators, even if the leading coefficient is exact, so
-            # let's not even try doing anything clever in this case.
-            dlc, alc = self.split_leading_coefficient()
-            pol = alc if apparent else dlc
         # No point in falling back on _singularities_inexact here.
         assert dom is None
-        pol = utilities.exactify_polynomial(pol)
         sing = []
-        for fac, mult in pol.factor():
-            roots = roots_of_irred(fac)
+        for fac, mult in self._lc_factors(apparent):
+            roots = self._roots_of_lc_factor(fac)
             sing.extend((rt, mult) for rt in roots)
         return sing
 
@@ -263,9 +383,21 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
                 raise ValueError("failed to isolate the singularities")
         return lc.roots(dom, multiplicities=False)
 
+    @cached_method
+    def _lc_radical(self):
+        return self.leading_coefficient().radical()
+
     def _sing_as_alg(self, iv):
-        pol = self.leading_coefficient().radical()
-        return QQbar.polynomial_root(pol, CIF(iv))
+        iv = CIF(iv)
+        # Only work with the irreducible factor that can vanish on iv, so that
+        # QQbar does not need to isolate all the other singularities
+        try:
+            candidates = [fac for fac, _ in self._lc_factors()
+                          if fac(iv).contains_zero()]
+        except (TypeError, ValueError):
+            candidates = []
+        pol = candidates[0] if len(candidates) == 1 else self._lc_radical()
+        return QQbar.polynomial_root(pol, iv)
 
     @cached_method
     def est_cvrad(self, IR):
@@ -337,9 +469,13 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
         if all(Scalars.has_coerce_map_from(pt.parent()) for pt in pts):
             return (self,) + pts
         hom, *pts1 = utilities.extend_scalars(Scalars, *pts)
-        Dops1 = OreAlgebra(Pols.change_ring(hom.codomain()),
-                           (Dops.variable_name(), {}, {Pols.gen(): Pols.one()}),
-                           check_base_ring=False)
+        Scalars1 = hom.codomain()
+        Dops1 = self._dop_alg_with_base(Scalars1)
+        if Dops1.base_ring().base_ring() is not Scalars1:
+            # The cache lookup is by equality, and we may have found an algebra
+            # over a field equal but not identical to Scalars1 (see the note in
+            # shift()). Do not reuse it, coercions between the two are slow.
+            Dops1 = _dop_alg_with_base(Dops, Scalars1)
         dop1 = Dops1([pol.map_coefficients(hom) for pol in self])
         dop1 = PlainDifferentialOperator(dop1)
         assert dop1.base_ring().base_ring() is hom.codomain()
@@ -358,25 +494,50 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
             sage: dop = DifferentialOperator(x*Dx - 1)
             sage: dop.shift(Point(RBF(1/2), dop))
             (2*x + 1)*Dx - 2
+            sage: dop.shift(Point(0, dop)) is dop
+            True
         """
+        delta_value = delta.exact().as_sage_value()
+        if delta_value.is_zero():
+            return self
         # NOTE: pushout(QQ[x], K) doesn't handle embeddings well, and creates
         # an L equal but not identical to K. And then other constructors like
         # PolynomialRing(L, x) sometimes return objects over K found in cache,
         # leading to endless headaches with slow coercions.
-        dop_P, ex = self.extend_scalars(delta.exact().as_sage_value())
+        dop_P, ex = self.extend_scalars(delta_value)
         Pols = dop_P.base_ring()
         # Gcd-avoiding shift by an algebraic delta
         deg = dop_P.degree()
         den = utilities.internal_denominator(ex)
         num = den*ex
+        if Pols.base_ring() is QQ:
+            try:
+                from . import taylor_shift
+            except ImportError:
+                utilities.warn_no_cython_extensions(logger, fallback=True)
+            else:
+                shifted = taylor_shift.qq(dop_P.list(), ZZ(num), ZZ(den), deg)
+                return ShiftedDifferentialOperator(dop_P.parent()(shifted),
+                                                   self, delta)
         lin = Pols([num, den])
-        x = Pols.gen()
+        denpow = [den.parent().one()]
+        for _ in range(deg):
+            denpow.append(denpow[-1]*den)
         def shift_poly(pol):
-            pol = (pol.reverse(deg)(den*x)).reverse(deg)
+            # den^deg·pol(x/den), computed coefficient-wise instead of by
+            # composition of reversed polynomials
+            pol = Pols([c*denpow[deg-i] for i, c in enumerate(pol)])
             return pol(lin)
         shifted = dop_P.map_coefficients(shift_poly)
         return ShiftedDifferentialOperator(shifted, self, delta)
 
+    @cached_method
+    def _dop_alg_with_base(self, Scalars):
+        # Analytic continuation typically extends the scalars of the same
+        # operator to the same field at each step, so it is worth avoiding the
+        # pushout and constructor overhead.
+        return _dop_alg_with_base(self.parent(), Scalars)
+
     @cached_method
     def _theta_alg_with_base(self, Scalars):
         Dop = self.parent()
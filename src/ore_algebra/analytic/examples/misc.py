@@ -27,8 +27,8 @@ equation::
 An example provided by Steve Melczer which used to trigger an issue with the
 numerical analytic continuation code::
 
-    sage: from ore_algebra.analytic.examples.misc import melczer1
-    sage: rts = melczer1.leading_coefficient().roots(QQbar, multiplicities=False)
+    sage: from ore_algebra.analytic.examples.misc import melczer1, melczer1_singularities
+    sage: rts = melczer1_singularities()
     sage: melczer1.numerical_transition_matrix([0, rts[1]])[0, 0]
     [4.6419124068...] + [-0.0159612280...]*I
     sage: melczer1.local_basis_expansions(rts[1])
@@ -116,1233 +116,1172 @@ Melczer, An Invitation to Analytic Combinatorics (2021), (2.14)::
     [ -4.00 ...I   0.0269 + 3.14*I    1.36 - 9.43*I    1.05 - 8.66*I]
     [  8.00 ...I     1.67 - 6.28*I   -4.45 + 18.9*I   -4.09 + 17.3*I]
 """
-import collections
+import json
+import os
 
+from typing import NamedTuple
+
+from sage.misc.cachefunc import cached_function
 from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing
 from sage.rings.number_field.number_field import NumberField
 from sage.rings.integer_ring import Z as ZZ
 from sage.rings.rational_field import Q as QQ
-from sage.rings.qqbar import AA
+from sage.rings.qqbar import AA, QQbar
 from sage.rings.real_mpfi import RIF
 from sage.rings.real_mpfr import RR
 from ore_algebra import DifferentialOperators
 
-IVP = collections.namedtuple("IVP", ["dop", "ini"])
+class IVP(NamedTuple):
+    dop: object
+    ini: object
 
-DiffOps_a, a, Da = DifferentialOperators(QQ, 'a')
-koutschan1 = IVP(
-    dop = (1315013644371957611900*a**2+263002728874391522380*a+13150136443719576119)*Da**3
-        + (2630027288743915223800*a**2+16306169190212274387560*a+1604316646133788286518)*Da**2
-        + (1315013644371957611900*a**2-39881765316802329075320*a+35449082663034775873349)*Da
-        + (-278967152068515080896550+6575068221859788059500*a),
-    ini = [ QQ(5494216492395559)/3051757812500000000000000000000,
-            QQ(6932746783438351)/610351562500000000000000000000,
-            1/QQ(2) * QQ(1142339612827789)/19073486328125000000000000000 ]
-)
+_path = os.path.dirname(__file__)
 
-y, z = PolynomialRing(QQ, ['y', 'z']).gens()
-salvy1_pol = (16*y**6*z**2 + 8*y**5*z**3 + y**4*z**4 + 128*y**5*z**2 + 48*y**4*z**3 +
-        4*y**3*z**4 + 32*y**5* z + 372*y**4*z**2 + 107*y**3*z**3 + 6*y**2*z**4 +
-        88*y**4*z + 498*y**3*z**2 + 113*y**2*z**3 + 4*y*z**4 + 16*y**4 + 43*y**3*z +
-        311*y**2*z**2 + 57*y*z**3 + z**4 + 24*y**3 - 43*y**2*z + 72*y*z **2 + 11*z**3 +
-        12*y**2 - 30*y*z - z**2 + 2*y)
 DiffOps_z, z, Dz = DifferentialOperators(QQ, 'z')
-salvy1_dop = ((71820*z**41 + 22638420*z**40 + 706611850*z**39 - 27125189942*z**38 -
-        1014313164418*z**37 - 2987285491626*z**36 + 143256146804484*z**35 +
-        595033302717820*z**34 - 8471861990006953*z**33 + 22350994766224977*z**32 +
-        199821041784996648*z**31 - 11402401137364528368*z**30 -
-        20097653091034863945*z**29 + 779360354402528630973*z**28 -
-        176989790944223286690*z**27 - 21147240812021497949406*z**26 +
-        142998531993721111599972*z**25 + 80316114769669665621696*z**24 -
-        5307473733185494433298552*z**23 + 7203584446884104208728712*z**22 +
-        35801597981121411452825952*z**21 + 3263398824907862040304272*z**20 -
-        36655644766584223667752320*z**19 - 150953800574563497880271616*z**18 +
-        119544860701204579715524608*z**17 + 71974080926245507955960832*z**16 +
-        25422428208418632702600192*z**15
-        - 97009343834279788623234048*z**14 + 30442156869153615816081408*z**13
-        - 4512522437805042635751424*z**12 + 661786684296532253081600*z**11 -
-        82017873705407751913472*z**10 + 4174868398581661827072*z**9 -
-        3478618055343341568*z**8 - 1261658236927344640*z**7 -
-        44373111021240320*z**6 + 3246995275776000*z**5)*Dz**6
-    + (1508220*z**40 + 491150520*z**39 + 14150735900*z**38 - 696715582428*z**37
-        - 22217607684928*z**36 - 11824861415940*z**35 + 3377569342519110*z**34 +
-        6363032094643108*z**33 - 175716240466949786*z**32 +
-        855613611427762866*z**31 - 4551321215387777004*z**30 -
-        265500396363760299360*z**29 + 186683361500557485642*z**28 +
-        16074356319671937220698*z**27 + 1234135482266536513710*z**26 -
-        387762937754593628456160*z**25 + 759404763793204572495792*z**24 +
-        2261325034838887233477504*z**23 - 41274301561246646794131000*z**22 +
-        75859287634577872636047648*z**21 + 345933336032358635561167920*z**20
-        - 75770662035007030703670816*z**19 - 548127759327893237397045888*z**18 -
-        1984770925517181472514114304*z**17 + 2091936018809166141930723840*z**16 +
-        1192632549738707598170489856*z**15 + 267266923340533902381029376*z**14 -
-        1868900638964812073735000064*z**13 + 613553965698628256330317824*z**12 -
-        77607719946919803394113536*z**11 + 7371455721053484707217408*z**10 -
-        791442539759097593987072*z**9 + 39762980090782414798848*z**8 -
-        28949523235501768704*z**7 - 13194933109050572800*z**6 -
-        635602009587712000*z**5 + 43834436222976000*z**4)*Dz**5
-    + (9759540*z**39 + 3300863160*z**38 + 87137559810*z**37 - 5407470459530*z**36 -
-        148017196969880*z**35 + 327169577099540*z**34 + 23855226876775400*z**33 -
-        15119864088662770*z**32 - 1068958213416098195*z**31 +
-        10070733194952785265*z**30 - 94203687357400320315*z**29 -
-        2119128812313514338075*z**28 + 6015947971641580585500*z**27 +
-        118902572901421890849600*z**26 - 66475503708341321459130*z**25 -
-        2664998571913084998527400*z**24 - 1442947621702924546389360*z**23 +
-        21374730535662210377732400*z**22 - 5972229387165285508315080*z**21 +
-        125324729687473129775650560*z**20 + 536692069128654755907333840*z**19 -
-        674002019392465324114334880*z**18
-        - 1471372065391435603680706560*z**17 - 5677072446499749526066892160*z**16
-        + 9542146757872199793164052480*z**15 + 5120843179458923410892014080*z**14
-        - 122923795202985634324869120*z**13 - 10745729910232387237212733440*z**12
-        + 3764895058887333176234557440*z**11 - 429936803911646516743127040*z**10
-        + 21020383360468725284864000*z**9 - 1290297906707895746560000*z**8 +
-        54129401362049463746560*z**7 + 268284667125091532800*z**6 -
-        28728185968268410880*z**5 - 2622325933641564160*z**4 +
-        156577327742976000*z**3)*Dz**4
-    + (22056720*z**38 + 7800834720*z**37 + 187099626630*z**36 -
-            14489632628200*z**35 - 340288650977140*z**34 + 1821599039970040*z**33
-            + 56668655708213950*z**32 - 193347619586203760*z**31 -
-            1779712936449988285*z**30 + 34782281241372628470*z**29 -
-            457152676877903439975*z**28 - 5949470068797299899140*z**27 +
-            32822481515490323168580*z**26 + 323679970477791577786560*z**25 -
-            753142149501904588308120*z**24 - 6944123449957281404877120*z**23 +
-            1249683063497933229678000*z**22 + 64983819922455028829947680*z**21 +
-            152023062017110121268050880*z**20 - 162585001615506352297680000*z**19
-            - 658948691616877006273697280*z**18 -
-            904838325157075863153976320*z**17 +
-            1665021268927495995942858240*z**16 - 81968505388096146560432640*z**15
-            + 8375791947054942984297768960*z**14 +
-            3676564359591337510548602880*z**13 -
-            5230040870261114310516203520*z**12 -
-            20479559361125449192901713920*z**11 +
-            7895429046279773990603980800*z**10 - 870059015693328423026688000*z**9
-            + 18132153175565342597447680*z**8 + 948962653419194086850560*z**7 -
-            88684921159591080755200*z**6 + 1632614837720459509760*z**5 -
-            4520478397872209920*z**4 - 3596953162423992320*z**3 +
-            140342351364096000*z**2)*Dz**3
-    + (13693680*z**37 + 5111346240*z**36 + 110337277050*z**35 -
-            10616572896900*z**34 - 212616907355220*z**33 + 1907197694065680*z**32
-            + 35086470242555490*z**31 - 230830962691484460*z**30 -
-            119801336414582715*z**29 + 26838037841767027380*z**28 -
-            560160775489343242545*z**27 - 4198797970570866711510*z**26 +
-            42743928885060777438960*z**25 + 224466018637260564654120*z**24 -
-            1268908050017507124479400*z**23
-            - 4379979463524457535039760*z**22 + 15155482733928330881828400*z**21
-            + 40794045636529987278102720*z**20 - 37644049223426983435911360*z**19
-            - 58823741580795635845155840*z**18 -
-            448474984893359633937991680*z**17 + 41591801685730020441454080*z**16
-            + 3162304645220555725940812800*z**15 +
-            2319883018843619208638315520*z**14 -
-            8393145340874982467702722560*z**13 -
-            6681520568322378041767096320*z**12 -
-            8252703629920220034552053760*z**11 -
-            9629037566950972555498291200*z**10 +
-            4387995986890067861013135360*z**9 - 461514254064285343458263040*z**8
-            + 522858309517567202426880*z**7 + 634546595151770875330560*z**6 -
-            28049016515447614341120*z**5 + 777846307956562329600*z**4 -
-            7008788477714104320*z**3 - 1553682343196098560*z**2 +
-            2164663517184000*z)*Dz**2
-    + (- 41879040*z**33 - 1416307200*z**32 + 148941814560*z**31 +
-            3270298516800*z**30 - 11477419141440*z**29 - 2594539713258240*z**28 -
-            51745363970093280*z**27 + 745698123298307520*z**26 +
-            22802877042886843920*z**25 + 14050350666949553280*z**24 -
-            2048447965484252604240*z**23 - 2228764713877225222560*z**22 +
-            89453205322869720983040*z**21 - 46789880409365742501120*z**20 -
-            2123767277799444443439360*z**19 + 724858375756050858078720*z**18 +
-            6269080959998916108537600*z**17 + 88970832949842762649989120*z**16 +
-            134828145628568403921400320*z**15 - 526784933100386618307394560*z**14
-            - 2464815884998450540389719040*z**13 -
-            3504246799326542509131878400*z**12 -
-            3785383718150451876235284480*z**11 -
-            1818465489663730171421736960*z**10 + 155064625280607257421742080*z**9
-            + 47441424650557360135864320*z**8 + 43137927034599581118627840*z**7
-            - 11239734089998880546488320*z**6 + 504783801825732109271040*z**5 +
-            10521549814703849472000*z**4 - 811692880841649684480*z**3 -
-            1636617689235456000*z**2 - 141564870855229440*z -
-            2164663517184000)*Dz
-    + (- 3697966841856000 + 41879040*z**32 + 544427520*z**31 - 162356006400*z**30
-            - 251676096000*z**29 - 3285830607360*z**28 + 570977399938560*z**27 +
-            40948236792921600*z**26 - 493076168891343360*z**25 -
-            15680703841739688960*z**24 + 34853169398214896640*z**23 +
-            1282924695185330964480*z**22 - 2634867247875329986560*z**21 -
-            31543463403883538657280*z**20 + 112726502509909108838400*z**19 -
-            197290858158049402183680*z**18 + 1743747637921540472586240*z**17 -
-            6464161036183311324610560*z**16 + 7279692122187953521459200*z**15 +
-            3140449849104166786498560*z**14 - 6705947281208374709452800*z**13
-            - 14304923501365693808640000*z**12 + 33533652518766896672931840*z**11
-            - 23650577729697452583813120*z**10 + 3923835475521556599275520*z**9 +
-            2256201135091492721786880*z**8 - 235487576779477147975680*z**7
-            - 585638701894459069562880*z**6 - 27312208046701695467520*z**4 +
-            972607606705430200320*z**3 - 248157347732520960*z +
-            212916818855030905896960*z**5 + 21162675253133967360*z**2))
+DiffOps_t, t, Dt = DifferentialOperators(QQ, 't')
 
+# The examples below are constructed on first access (see __getattr__() at the
+# end of this file), so that importing one of them does not require building
+# all the others.
 
-DiffOps_z, z, Dz = DifferentialOperators(QQ, 'z')
-melczer1 = ((81*z**5 + 14*z**4 + z**3)*Dz**5 + (1296*z**4 + 175*z**3 + 9*z**2)*Dz**4
-        + (6075*z**3 + 594*z**2 + 19*z)*Dz**3 + (9315*z**2 + 573*z + 8)*Dz**2
-        + (3726*z + 102)*Dz + 162)
+def _build_koutschan1():
+    DiffOps_a, a, Da = DifferentialOperators(QQ, 'a')
+    return IVP(
+        dop = (1315013644371957611900*a**2+263002728874391522380*a+13150136443719576119)*Da**3
+            + (2630027288743915223800*a**2+16306169190212274387560*a+1604316646133788286518)*Da**2
+            + (1315013644371957611900*a**2-39881765316802329075320*a+35449082663034775873349)*Da
+            + (-278967152068515080896550+6575068221859788059500*a),
+        ini = [ QQ(5494216492395559)/3051757812500000000000000000000,
+                QQ(6932746783438351)/610351562500000000000000000000,
+                1/QQ(2) * QQ(1142339612827789)/19073486328125000000000000000 ]
+    )
 
-DiffOps_t, t, Dt = DifferentialOperators(QQ, 't')
-quadric_slice_dop = (
-    (35455700309983592533417744099905363494688202476910195730746335282444258347782682854683010156780151250853377962302085751627136885420318494414664932421208934767993057968128000000000000000000*t**24
-    + 183743006357878979518046666696461665071123893294231978284059467449308725727516519248088035316044671849661660034807330227198140819822786998271566436383740207038259317964800000000000000000000*t**23
-    + 267694295245149885348165882745489849846930999728179354283457037377100597880196763264091785729057103535668036090421346186841593455682139345197400774785223732549560972487363133440000000000000000*t**22
-    - 101604797315115834564652779588062595214081779697000001825404607633713411386353531319877363207805975122698029488480377527277106665971434706252274125864276900351027498188800000000000000000*t**21
-    - 53817449542337782886977339159173466034190754869546505132089114276507082879157865450232854200435200694764172424962432878405986086652484713556740608893086167740951158726642892800000000000000*t**20
-    - 2191692175042043358651823129876458606923493588135305149167996702398834221893314747936533888282112547037238268580916459184984428932947825297076570519228831642096618967188635648000000000000000*t**19
-    - 1197311080010871526191634264666828148535479561720110485898333332547653100856304210563454916808402268653307947575567508989980677433072602755500730329295442866372442765905353968189440000000000000*t**18
-    + 30861632751905794676768113433513589524043450443374798609717001263480155863079656943205546795929255159808114820619681010202800736594417332960016637732261081706920016368107520000000000000*t**17
-    - 20038010835061025828258399136798588125870212719387874991932198394622858332287852402257387498062021589638012472078983113897371959547109526664716358334670598369459011842651654717440000000000*t**16
-    + 6317445601608200555154090815372991847602523919928132278424380998337071828527509126151034320064142794376727357645310083917246319408916579183156878609008485607009985147478576254156800000000000*t**15
-    + 2115642945353762177017453544402441083129875300220924158642284305727240187248663033899377149847436324698889556685850050279761989417070879448487424960113959958597107785429536298564688281600000000*t**14
-    + 138716162665874865183307696881149716907710539132517726848315427677246881842890378903516942916590248767558568296802546620096480451432875960323493764385590356866415297976600625152000000000*t**13
-    + 35920573405251958260134382622729618757540075040676160358968816397713335137728167262922651867053533457537696336902784031537737621585614957825554915788992333591706881291989110415687680000000*t**12
-    - 7650516600995580591264110012476507195336359999521038644947099800706086422859541078698843183928572318787529569994348866362744261767977697315256222806961534131000944827889648148760494080000000*t**11
-    - 1839975067790668452773195296323137570808316526662226906516054094066416347095608430971233614878809594094980353340249419297829457526441063342825812528245405500915879911038207140612149723791360000*t**10
-    + 13314950547652067993694027616372584897140872637197804974940777436447070870962206428542159666375956896953445696019809950408889022896675374569705668791958916923686709820001219510272000000*t**9
-    + 22016359241391892852959642357125951665829837143595535301971057971769421260540636295877015673710412089326820708296480566875675946532432728963266094091995706201228239059530525612930655846400*t**8
-    + 4196684206795659136602902503498803903243561876278234438614135611352452507224905425957849184425724157550825478306837098583396602805039288461734017863203192003475324382731380274402240233472000*t**7
-    + 783794266002056350401068965516474047196349467597469748646400183630267865129581614766507221550483874858031171224573943628112522715735015646714664068572733399285601990013654264593041525208776704*t**6
-    - 63704306660621822813750777164660172689968650392581337957397311285476945627298526192848799933316809509436104202068249376594019447751266286494702216771155811177407338452310940026016890880*t**5
-    - 15264106456766461801484004995243152877656180990731167114614093188233781136969555467873512033685203234436150289584156908107230808223805669445641270410591271343717066751134708493421065011200*t**4
-    - 855664172066205115184869178614506992796538655497608441854046879802264702297281214969987135157446011047905855180982133413210367405213742449793058319180631758092534952784510494517841887232000*t**3
-    - 129845358610956056287000650007937640391470625684621776067336800343276276068146586183088417414884518562806107378518510868258643429066502391216505767639578884043111192568355034803798496735133696*t**2
-    - 17602447618579642360746304302896568922473468561453248248521698540038243324730405579952222676069765374667816652405419574274064762254991961148567916606995001266619465406501067272549075840*t
-    - 4273003203310758459654485180581104081043203177521949588206876665305064419303902151239496508132054035540715225648781158272364891170654421575359430829271867155879780830417556326968135519625)*Dt**4
-    + (212734201859901555200506464599432180968129214861461174384478011694665550086696097128098060940680907505120267773812514509762821312521910966487989594527253608607958347808768000000000000000000*t**23
-    + 1286201044505152856626326666875231655497867253059623847988416272145161080092615634736616247212312702947631620243651311590386985738759508987900965054686181449267815225753600000000000000000000*t**22
-    + 2141554361961199082785327061963918798775447997825434834267656299016804783041574106112734285832456828285344288723370769494732747645457114761579206198281789860396487779898905067520000000000000000*t**21
-    - 43544913135049643384851191252026826520320762727285715068030546128734319165580084851376012803345417909727726923634447511690188571130614874108117482513261528721868927795200000000000000000*t**20
-    + 523589691867602130195889575392148270199588697308956804468131659742968991993586444064710089745569079398481554187550999756271342047164371249473308435743547586249906265499107328000000000000000*t**19
-    - 12054220603518250269464653732387175001096631306514330031394188355243887045312139180886889784175020467709041136214824166072207576005027722424031950219533473673634096337658052608000000000000000*t**18
-    - 6385376546930558092810532341362698499706785821350040568831307112424522970332218070883634165618142400647778119154421884470697636043707333750908300750345176365213059089035753905192960000000000000*t**17
-    - 1926194728994118957684031952349532941923865782632061242113883737845116190024883982466316508446592741779207635075767877601390901385925119700131772027286058598583141201178787840000000000000*t**16
-    - 871343693052303424690969063293900773508927108528420778648214260742617804547143006531882477584190376455973455076505644520402520427925981420735942342166036861573237098208800024821760000000000*t**15
-    + 20694112656369695087910512955421048241891195010017603028956490400565692455412201423547846875694669453050143250338431652814600800563741043723603583472725408114458221410201664225280000000000000*t**14
-    + 6081933034997360552216207404525030266820927834169840987778576029817802584230249373747701638870457394582362431662233739949560931314639688063211759986345253351168174197127612950795360665600000000*t**13
-    - 168939856339231446562820760478601984418528304319462472532050698987154793703301324712374023272453675860957253613167432366183219219871744535454533538291952048788603142601279799296000000000*t**12
-    - 462333656714529699277353638473013021795202918772585031737390003268887172973440313905796683409596508742440496287896615129478503922921838997522538576261960026468708919829274323499089920000000*t**11
-    - 8948754973452953280106012508180391032609469331497379404701475376760867324423970985085340598801864394087420226289092848348350502301170555531914436263941437679348874694542774785665925120000000*t**10
-    - 1314050676225585028142969835026640598957758379677257700048396998421564180689092290368908315778245005071689456747293132165527046747845950450525222709312365050958317369749487174886122061824000000*t**9
-    + 1572599822623593801209957082786018957112563108048522158240523812509945704207582170960083107679806854441487446332660345178229991187975903090700112231404885294592165921963015661420544000000*t**8
-    + 413438326908186204017108692037376677641336476718711827066008020650837967701364871912018398541718715271317660484354328444905668078318917462514824100733862141122233005173154915381492370636800*t**7
-    - 2474975935169773456006314167294019265203207123360344072796766164343322190764974032931472836751227381898824455486939785838209549204696638575589431542712634946406542100586779828486987055104000*t**6
-    - 783750455026915804199560376334733641171699517878379913083882028602940215356816418568717019805859560212524390184088842639821436335577587832190016809308434425353508837885812498773319603877576704*t**5
-    + 553071122703780231313054537520403529367677950491631525147301590046567050482338436510990141300934045520731118221411031181991974915440589844537814044400641096415354215158035146688010649600*t**4
-    + 184034467055733932195398666499571352798472212931123068691896646489416426350146975341556559819887434362155251765274939059977697619170129201242344441207091023183619693521730641168725494988800*t**3
-    + 1497406322592845600247691655776399945493133475632849873521965796637449287204523557722467092555113005907655554120239174484681067266625945383476339205358432866497477911747849412090460635136000*t**2
-    + 259690717111729495474567807493485027910042496965948846103467466523221687161754396482262680842792907122032578428132855220201663708515146056828957520687966630028467553450527715059960333103398912*t
-    - 17595924359225494719513218237688506459338262612311093733982382583582248143050355103303391458918425519488483783693233432162390143209370498538499084743283450174741619904455115344268613760)*Dt**3
-    + (106367100929950777600253232299716090484064607430730587192239005847332775043348048564049030470340453752560133886906257254881410656260955483243994797263626804303979173904384000000000000000000*t**22
-    + 734972025431515918072186666785846660284495573176927913136237869797234902910066076992352141264178687398646640139229320908792563279291147993086265745534960828153037271859200000000000000000000*t**21
-    + 1338471476225749426740829413727449249234654998640896771417285186885502989400983816320458928645285517678340180452106730934207967278410696725987003873926118662747804862436815667200000000000000000*t**20
-    + 130634739405148930154553573756080479560962288181857145204091638386202957496740254554128038410036253729183180770903342535070565713391844622324352447539784586165606783385600000000000000000*t**19
-    + 262277937499426222527306966927181794049550314140391167750068083033075448298680250146569984849372271942982062745830897081764799509315431448770764612536633865681628704531074252800000000000000*t**18
-    - 4967689337328904074609769395906615792207855518487629462792745080767934586545834325506822002030010201725614411435356267517770522527922491734922935676701990264880867204543807488000000000000000*t**17
-    - 2261295134094058575619385291100314225736671409954765576706294792205917324179002260793218691615140684345520896401825264186960184168723531555924407415061731428582652701797306823868416000000000000*t**16
-    + 3233426192295911975407956595586979207061174075051385034600095252177159980136168537255229032086271012958674894257703964118625820772251016991758205791798855563430800743423016960000000000000*t**15
-    + 3079921002018621084193305980344427111543911053713350691074662508802246251813568554833638206813500046988233057947335261282829878825573662698239710639045638615045678012751858095882240000000000*t**14
-    + 5990715441211684746878075340751086505605362240280694280823274432038972663055565168592658078930838391293344533667161503186737293054609978321629778762098615018936560302970380484608000000000000*t**13
-    + 1851644851163696096270484906686976884744904510171383168324213917837718466308649790386312832012072486593213278745908673932622735058694438494395525168158964853463591724949581046391557324800000000*t**12
-    - 6466684737197205752690982752390913607808941815163425131502549938239951053070729898084069886978034710886978718206768602947377509568078939249006530782677411313354283617851105345536000000000*t**11
-    - 2109047566194185168668539118502273006341006725710438628315138076440649728429444628183911262343872601540118208228063333227015554826319028993245980658032888547759023590989744715474141184000000*t**10
-    - 6425098840311784835332421061910559570457354610154269965443443341596269470502663077930958180020603779426538874941553533427580677933307930816404031778117474465734791071221545443356835840000000*t**9
-    - 2234996846496597086035130686960938605544352315044355712176772205873438786697234682494693071442902554373360537862070750614430018006533804677798459821091636198026425472816309082828877395394560000*t**8
-    - 3195511972357765014813308521255536743212705411024313169815203301622285351817504744070647977610303810954736968624269552745626025028301699236366399340535727320876907745505433381083545600000*t**7
-    - 1461765583396832571595631692757555697810328667818514663259395467765845438375412916807217259810310809421499777341272714580342923018018053486040143416992943090312954839862151333731532118425600*t**6
-    + 4340310860027487785599932121448926924400976936515815179441503694400333009399654191636518641605326479432820214935283935045466966672523016778294430436351701905083661285815278857069917110272000*t**5
-    + 1306294571067696174396706234911284718418105212643692927409952234261070887958992724184258055851826839008743582100650556605982806588537012787710638616659181891266667758891515697542927294136320000*t**4
-    + 782823383117881420221079021189827067903556484679165880008285450980197653943259238207997341531381192635489498896490403812485859662636027666587125056142493147610607336704170322087116800000*t**3
-    + 156402795059376713833578934550382714366821794214900132111483097927473005052239376001252248236466954596422030321438439029868181356419843941545341058166865577417576721347269921607878967296000*t**2
-    + 285213419429212807282822847890275580949778469145327285713512310192921020781007168406003179418936996999411249576423279615264912034764063941432374404739689024644780533622275269177284493312000*t
-    - 8240807548602207679663929444803680793672825101783654994886245739561829971537127539744790010273187986495799916341656083849048303407690114310122383265132735703532652244962591866880000)*Dt**2
-    + (-106367100929950777600253232299716090484064607430730587192239005847332775043348048564049030470340453752560133886906257254881410656260955483243994797263626804303979173904384000000000000000000*t**21
-    - 734972025431515918072186666785846660284495573176927913136237869797234902910066076992352141264178687398646640139229320908792563279291147993086265745534960828153037271859200000000000000000000*t**20
-    - 1338471476225749426740829413727449249234654998640896771417285186885502989400983816320458928645285517678340180452106730934207967278410696725987003873926118662747804862436815667200000000000000000*t**19
-    - 101604797315115834564652779588062595214081779697000001825404607633713411386353531319877363207805975122698029488480377527277106665971434706252274125864276900351027498188800000000000000000*t**18
-    - 261977052237683650106727901088919292494260202462613574783980313802627123116368655957167114325290927780034732898223566167809625475096437365687489839312547717182160504349314252800000000000000*t**17
-    + 5990488573651521585020888461608964691445402891393223165800680979646364587483119038736205383806165824665928452512772425118601736999954107658482578707130136985683388712049704960000000000000000*t**16
-    + 3325591476770598043844541109237311554163090835214620141094152374429578805501919297931077693780276192973293901112817526309698928873232083582433633404962339794400842698791481939853312000000000000*t**15
-    - 1733692442328173609866692489623210737477710266523826979778302626518716157725579535844547161461168984664578504654221962504527926921405105749621810755563210693340354242936832000000000000000*t**14
-    - 1611053060741127305174731015470789457946882621419918287407469686758187171961753619055835022191908547321863562653683798949682325934456524794869115061522135050912634796365182633246720000000000*t**13
-    - 8894904953391250457055371664819028533872167683367560381633786468688776720672969415683170018957386884763191070055660028675240684285572600614157722046485524593113308781854125457408000000000000*t**12
-    - 2908967472615532929369507415529385528735137308720545662458568241560107766019920920738971345404769169402650339803151690541478389177622417866930678650204006494653760860836360118388706508800000000*t**11
-    + 1857459774333051771174665796667248203771691882304107091643696345291989693740330880223399090218617464825959993844523608060454267178780443163473134655341923025564651738086678462464000000000*t**10
-    + 332854686599403676528155549732182666815515083419924703008802658575062191392853813296222036618918114369873338392030506243160767081508253368079994308036411638453462146292625596292792320000000*t**9
-    + 4113993925557436826715830270030143915207215118196764786435914796025063407096569410103807656922735351714988405685134657167597609351458607734175082488631970231559531536364349395849707520000000*t**8
-    + 920020591037834122805076790688620215844244031994434847343475726966783037095602979281061368740533363857606460282261598879268972860677280011877970984562907231746302365222972152454213439324160000*t**7
-    + 1307257792490263412009680550183758191604981783239960414171302976105445424244694569208547260352761022664683781540315366576727061034255989327513119208415351606929137366424765377963622400000*t**6
-    + 479596728316819176654576972736416078191700935373850087424828618491774464362082436568326155070912739895807197626510998492001862806354347657479572941370868805811401011015634923172035926425600*t**5
-    - 179352881527446833727923347828234512133081651346495550522866842208994036817462367079574174191453828029890231033657960236568386577505932746410436636763487070954599968156562504189151805440000*t**4
-    - 251568270025211201955389171860338579171675714868104052152789880989805712726614197574887246767925108246607970007160940134370673529705101398997875679835167365081669374673539993436160000*t**3
-    - 141772430429024326881509616736177148212059744813752208473666088996700368688933789363560771135161864201721524861419389136852260702560567771393655430337183040528733205980885277265100800000*t**2
-    - 25817606346086956476758470208850883766420383787607030339022713274189365873405154695767797745935894060883806800961601773820707673481632102376182116930107064769426021006200320503617211596800*t
-    + 34918206405098505823938790072675572231488655998026261577866691497637535623661745400444768148106948876570405151317417742685700849593772165309178580940805695949542187927076864000)*Dt)
-quadric_slice_pol = (
-    4980990673427087034113103774848375913397675011396681161337606780457883155824640000000000*t**12
-    - 16313074573215242896867677175985719375664055250377801991087546344967331905536000000000*t**9
-    - 14852779293587242300314544658084523021409425155052443959294262319432698489552764928000000*t**8
-    + 18694126910889886952945780127491545129704079293214429569400282861674612412907520000*t**6
-    + 32429224374768702788524801575483580065598417846595577296275963028007688596147404800000*t**5
-    + 14763130935033327878568955564665179022508855828282305094488782847988800598441515915673600*t**4
-    - 7447056930374930458107131157447569387299331973073657492405996702806537404416000*t**3
-    - 18581243794708202636835504417848386599346688512251081679746508518773002589362454528*t**2
-    - 16116744082275656666424675660780874575937043631040306492377025123023286892432343685120*t
-    - 4891341219838850087826096307272910719484535278552470341569283855964428449539674077056375)
-quadric_slice_crit = AA.polynomial_root(quadric_slice_pol, RIF(-0.999,-0.998))
+def _build_salvy1_pol():
+    Pol = PolynomialRing(QQ, ['y', 'z'])
+    # (exponent of y, exponent of z): coefficient
+    return Pol({
+        (6, 2): 16, (5, 3): 8, (4, 4): 1, (5, 2): 128, (4, 3): 48, (3, 4): 4,
+        (5, 1): 32, (4, 2): 372, (3, 3): 107, (2, 4): 6, (4, 1): 88,
+        (3, 2): 498, (2, 3): 113, (1, 4): 4, (4, 0): 16, (3, 1): 43,
+        (2, 2): 311, (1, 3): 57, (0, 4): 1, (3, 0): 24, (2, 1): -43,
+        (1, 2): 72, (0, 3): 11, (2, 0): 12, (1, 1): -30, (0, 2): -1, (1, 0): 2,
+    })
 
-aa = AA.polynomial_root(AA.common_polynomial(t**2 - t - 6256320), RIF(-RR(2500.7637305969961), -RR(2500.7637305969956)))
-K, a = NumberField(t**2 - t - 6256320, 'a', embedding=aa).objgen()
-DiffOps_x, x, Dx = DifferentialOperators(K, 'x')
-iint_quadratic_alg = IVP(
-    dop = (
-        (8680468749131953125000000000000000000000*x**13
-        + (34722222218750000000000000000000*a
-        - 8680555572048611109375000000000000000000)*x**12
-        - 43419899820094632213834375000000000000000*x**11
-        + (
-        -173681336093739466250000000000000*a
-        + 43420334110275534609369733125000000000000)*x**10
-        + 86874920665761352031076792873375000000000*x**9
-        + (347503157694622354347850650000000*a
-        - 86875789597407167434273839673925325000000)*x**8
-        - 86910050568035794059326480970966757245000*x**7
-        + (
-        -347643678708930265539961323497102*a
-        + 86910919851054405739455463644256161748551)*x**6
-        + 43472594673506295255760083321808514490000*x**5
-        + (173892117615201333036370696994204*a
-        - 43473029490746392066693340766736348497102)*x**4
-        - 8698033700269174138676020224216757245000*x**3
-        + (
-        -34792482725903955594260023497102*a
-        + 8698120698872230261516983671405511748551)*x**2)*Dx**3
-        + (60763281243923671875000000000000000000000*x**12
-        + (208333333312500000000000000000000*a
-        - 52083333432291666656250000000000000000000)*x**11
-        - 234477992673174567319171875000000000000000*x**10
-        + (
-        -764240013812457865000000000000000*a
-        + 191060003835234473156228932500000000000000)*x**9
-        + 330156310115926628448399128620125000000000*x**8
-        + (973135289153552641195701300000000*a
-        - 243283822774955804875701645597850650000000)*x**7
-        - 191233733487755068298811316717716757245000*x**6
-        + (
-        -417298904667923776195701300000000*a
-        + 104324726375630396382887213097850650000000)*x**5
-        + 26094101100810161155908042873375000000000*x**4
+def _build_salvy1_dop():
+    # The j-th entry is a pair (v, c) where v is the valuation of the
+    # coefficient of Dz^j and c is the dense list of its coefficients starting
+    # from z^v
+    with open(os.path.join(_path, "salvy1_dop.json")) as f:
+        coeffs = json.load(f)
+    Pol = DiffOps_z.base_ring()
+    return DiffOps_z([Pol(c).shift(v) for v, c in coeffs])
+
+def _build_melczer1():
+    return ((81*z**5 + 14*z**4 + z**3)*Dz**5 + (1296*z**4 + 175*z**3 + 9*z**2)*Dz**4
+            + (6075*z**3 + 594*z**2 + 19*z)*Dz**3 + (9315*z**2 + 573*z + 8)*Dz**2
+            + (3726*z + 102)*Dz + 162)
+
+@cached_function
+def melczer1_singularities():
+    r"""
+    The roots in QQbar of the leading coefficient of ``melczer1``.
+    """
+    lc = _example("melczer1").leading_coefficient()
+    return tuple(lc.roots(QQbar, multiplicities=False))
+
+def _build_quadric_slice_dop():
+    return (
+        (35455700309983592533417744099905363494688202476910195730746335282444258347782682854683010156780151250853377962302085751627136885420318494414664932421208934767993057968128000000000000000000*t**24
+        + 183743006357878979518046666696461665071123893294231978284059467449308725727516519248088035316044671849661660034807330227198140819822786998271566436383740207038259317964800000000000000000000*t**23
+        + 267694295245149885348165882745489849846930999728179354283457037377100597880196763264091785729057103535668036090421346186841593455682139345197400774785223732549560972487363133440000000000000000*t**22
+        - 101604797315115834564652779588062595214081779697000001825404607633713411386353531319877363207805975122698029488480377527277106665971434706252274125864276900351027498188800000000000000000*t**21
+        - 53817449542337782886977339159173466034190754869546505132089114276507082879157865450232854200435200694764172424962432878405986086652484713556740608893086167740951158726642892800000000000000*t**20
+        - 2191692175042043358651823129876458606923493588135305149167996702398834221893314747936533888282112547037238268580916459184984428932947825297076570519228831642096618967188635648000000000000000*t**19
+        - 1197311080010871526191634264666828148535479561720110485898333332547653100856304210563454916808402268653307947575567508989980677433072602755500730329295442866372442765905353968189440000000000000*t**18
+        + 30861632751905794676768113433513589524043450443374798609717001263480155863079656943205546795929255159808114820619681010202800736594417332960016637732261081706920016368107520000000000000*t**17
+        - 20038010835061025828258399136798588125870212719387874991932198394622858332287852402257387498062021589638012472078983113897371959547109526664716358334670598369459011842651654717440000000000*t**16
+        + 6317445601608200555154090815372991847602523919928132278424380998337071828527509126151034320064142794376727357645310083917246319408916579183156878609008485607009985147478576254156800000000000*t**15
+        + 2115642945353762177017453544402441083129875300220924158642284305727240187248663033899377149847436324698889556685850050279761989417070879448487424960113959958597107785429536298564688281600000000*t**14
+        + 138716162665874865183307696881149716907710539132517726848315427677246881842890378903516942916590248767558568296802546620096480451432875960323493764385590356866415297976600625152000000000*t**13
+        + 35920573405251958260134382622729618757540075040676160358968816397713335137728167262922651867053533457537696336902784031537737621585614957825554915788992333591706881291989110415687680000000*t**12
+        - 7650516600995580591264110012476507195336359999521038644947099800706086422859541078698843183928572318787529569994348866362744261767977697315256222806961534131000944827889648148760494080000000*t**11
+        - 1839975067790668452773195296323137570808316526662226906516054094066416347095608430971233614878809594094980353340249419297829457526441063342825812528245405500915879911038207140612149723791360000*t**10
+        + 13314950547652067993694027616372584897140872637197804974940777436447070870962206428542159666375956896953445696019809950408889022896675374569705668791958916923686709820001219510272000000*t**9
+        + 22016359241391892852959642357125951665829837143595535301971057971769421260540636295877015673710412089326820708296480566875675946532432728963266094091995706201228239059530525612930655846400*t**8
+        + 4196684206795659136602902503498803903243561876278234438614135611352452507224905425957849184425724157550825478306837098583396602805039288461734017863203192003475324382731380274402240233472000*t**7
+        + 783794266002056350401068965516474047196349467597469748646400183630267865129581614766507221550483874858031171224573943628112522715735015646714664068572733399285601990013654264593041525208776704*t**6
+        - 63704306660621822813750777164660172689968650392581337957397311285476945627298526192848799933316809509436104202068249376594019447751266286494702216771155811177407338452310940026016890880*t**5
+        - 15264106456766461801484004995243152877656180990731167114614093188233781136969555467873512033685203234436150289584156908107230808223805669445641270410591271343717066751134708493421065011200*t**4
+        - 855664172066205115184869178614506992796538655497608441854046879802264702297281214969987135157446011047905855180982133413210367405213742449793058319180631758092534952784510494517841887232000*t**3
+        - 129845358610956056287000650007937640391470625684621776067336800343276276068146586183088417414884518562806107378518510868258643429066502391216505767639578884043111192568355034803798496735133696*t**2
+        - 17602447618579642360746304302896568922473468561453248248521698540038243324730405579952222676069765374667816652405419574274064762254991961148567916606995001266619465406501067272549075840*t
+        - 4273003203310758459654485180581104081043203177521949588206876665305064419303902151239496508132054035540715225648781158272364891170654421575359430829271867155879780830417556326968135519625)*Dt**4
+        + (212734201859901555200506464599432180968129214861461174384478011694665550086696097128098060940680907505120267773812514509762821312521910966487989594527253608607958347808768000000000000000000*t**23
+        + 1286201044505152856626326666875231655497867253059623847988416272145161080092615634736616247212312702947631620243651311590386985738759508987900965054686181449267815225753600000000000000000000*t**22
+        + 2141554361961199082785327061963918798775447997825434834267656299016804783041574106112734285832456828285344288723370769494732747645457114761579206198281789860396487779898905067520000000000000000*t**21
+        - 43544913135049643384851191252026826520320762727285715068030546128734319165580084851376012803345417909727726923634447511690188571130614874108117482513261528721868927795200000000000000000*t**20
+        + 523589691867602130195889575392148270199588697308956804468131659742968991993586444064710089745569079398481554187550999756271342047164371249473308435743547586249906265499107328000000000000000*t**19
+        - 12054220603518250269464653732387175001096631306514330031394188355243887045312139180886889784175020467709041136214824166072207576005027722424031950219533473673634096337658052608000000000000000*t**18
+        - 6385376546930558092810532341362698499706785821350040568831307112424522970332218070883634165618142400647778119154421884470697636043707333750908300750345176365213059089035753905192960000000000000*t**17
+        - 1926194728994118957684031952349532941923865782632061242113883737845116190024883982466316508446592741779207635075767877601390901385925119700131772027286058598583141201178787840000000000000*t**16
+        - 871343693052303424690969063293900773508927108528420778648214260742617804547143006531882477584190376455973455076505644520402520427925981420735942342166036861573237098208800024821760000000000*t**15
+        + 20694112656369695087910512955421048241891195010017603028956490400565692455412201423547846875694669453050143250338431652814600800563741043723603583472725408114458221410201664225280000000000000*t**14
+        + 6081933034997360552216207404525030266820927834169840987778576029817802584230249373747701638870457394582362431662233739949560931314639688063211759986345253351168174197127612950795360665600000000*t**13
+        - 168939856339231446562820760478601984418528304319462472532050698987154793703301324712374023272453675860957253613167432366183219219871744535454533538291952048788603142601279799296000000000*t**12
+        - 462333656714529699277353638473013021795202918772585031737390003268887172973440313905796683409596508742440496287896615129478503922921838997522538576261960026468708919829274323499089920000000*t**11
+        - 8948754973452953280106012508180391032609469331497379404701475376760867324423970985085340598801864394087420226289092848348350502301170555531914436263941437679348874694542774785665925120000000*t**10
+        - 1314050676225585028142969835026640598957758379677257700048396998421564180689092290368908315778245005071689456747293132165527046747845950450525222709312365050958317369749487174886122061824000000*t**9
+        + 1572599822623593801209957082786018957112563108048522158240523812509945704207582170960083107679806854441487446332660345178229991187975903090700112231404885294592165921963015661420544000000*t**8
+        + 413438326908186204017108692037376677641336476718711827066008020650837967701364871912018398541718715271317660484354328444905668078318917462514824100733862141122233005173154915381492370636800*t**7
+        - 2474975935169773456006314167294019265203207123360344072796766164343322190764974032931472836751227381898824455486939785838209549204696638575589431542712634946406542100586779828486987055104000*t**6
+        - 783750455026915804199560376334733641171699517878379913083882028602940215356816418568717019805859560212524390184088842639821436335577587832190016809308434425353508837885812498773319603877576704*t**5
+        + 553071122703780231313054537520403529367677950491631525147301590046567050482338436510990141300934045520731118221411031181991974915440589844537814044400641096415354215158035146688010649600*t**4
+        + 184034467055733932195398666499571352798472212931123068691896646489416426350146975341556559819887434362155251765274939059977697619170129201242344441207091023183619693521730641168725494988800*t**3
+        + 1497406322592845600247691655776399945493133475632849873521965796637449287204523557722467092555113005907655554120239174484681067266625945383476339205358432866497477911747849412090460635136000*t**2
+        + 259690717111729495474567807493485027910042496965948846103467466523221687161754396482262680842792907122032578428132855220201663708515146056828957520687966630028467553450527715059960333103398912*t
+        - 17595924359225494719513218237688506459338262612311093733982382583582248143050355103303391458918425519488483783693233432162390143209370498538499084743283450174741619904455115344268613760)*Dt**3
+        + (106367100929950777600253232299716090484064607430730587192239005847332775043348048564049030470340453752560133886906257254881410656260955483243994797263626804303979173904384000000000000000000*t**22
+        + 734972025431515918072186666785846660284495573176927913136237869797234902910066076992352141264178687398646640139229320908792563279291147993086265745534960828153037271859200000000000000000000*t**21
+        + 1338471476225749426740829413727449249234654998640896771417285186885502989400983816320458928645285517678340180452106730934207967278410696725987003873926118662747804862436815667200000000000000000*t**20
+        + 130634739405148930154553573756080479560962288181857145204091638386202957496740254554128038410036253729183180770903342535070565713391844622324352447539784586165606783385600000000000000000*t**19
+        + 262277937499426222527306966927181794049550314140391167750068083033075448298680250146569984849372271942982062745830897081764799509315431448770764612536633865681628704531074252800000000000000*t**18
+        - 4967689337328904074609769395906615792207855518487629462792745080767934586545834325506822002030010201725614411435356267517770522527922491734922935676701990264880867204543807488000000000000000*t**17
+        - 2261295134094058575619385291100314225736671409954765576706294792205917324179002260793218691615140684345520896401825264186960184168723531555924407415061731428582652701797306823868416000000000000*t**16
+        + 3233426192295911975407956595586979207061174075051385034600095252177159980136168537255229032086271012958674894257703964118625820772251016991758205791798855563430800743423016960000000000000*t**15
+        + 3079921002018621084193305980344427111543911053713350691074662508802246251813568554833638206813500046988233057947335261282829878825573662698239710639045638615045678012751858095882240000000000*t**14
+        + 5990715441211684746878075340751086505605362240280694280823274432038972663055565168592658078930838391293344533667161503186737293054609978321629778762098615018936560302970380484608000000000000*t**13
+        + 1851644851163696096270484906686976884744904510171383168324213917837718466308649790386312832012072486593213278745908673932622735058694438494395525168158964853463591724949581046391557324800000000*t**12
+        - 6466684737197205752690982752390913607808941815163425131502549938239951053070729898084069886978034710886978718206768602947377509568078939249006530782677411313354283617851105345536000000000*t**11
+        - 2109047566194185168668539118502273006341006725710438628315138076440649728429444628183911262343872601540118208228063333227015554826319028993245980658032888547759023590989744715474141184000000*t**10
+        - 6425098840311784835332421061910559570457354610154269965443443341596269470502663077930958180020603779426538874941553533427580677933307930816404031778117474465734791071221545443356835840000000*t**9
+        - 2234996846496597086035130686960938605544352315044355712176772205873438786697234682494693071442902554373360537862070750614430018006533804677798459821091636198026425472816309082828877395394560000*t**8
+        - 3195511972357765014813308521255536743212705411024313169815203301622285351817504744070647977610303810954736968624269552745626025028301699236366399340535727320876907745505433381083545600000*t**7
+        - 1461765583396832571595631692757555697810328667818514663259395467765845438375412916807217259810310809421499777341272714580342923018018053486040143416992943090312954839862151333731532118425600*t**6
+        + 4340310860027487785599932121448926924400976936515815179441503694400333009399654191636518641605326479432820214935283935045466966672523016778294430436351701905083661285815278857069917110272000*t**5
+        + 1306294571067696174396706234911284718418105212643692927409952234261070887958992724184258055851826839008743582100650556605982806588537012787710638616659181891266667758891515697542927294136320000*t**4
+        + 782823383117881420221079021189827067903556484679165880008285450980197653943259238207997341531381192635489498896490403812485859662636027666587125056142493147610607336704170322087116800000*t**3
+        + 156402795059376713833578934550382714366821794214900132111483097927473005052239376001252248236466954596422030321438439029868181356419843941545341058166865577417576721347269921607878967296000*t**2
+        + 285213419429212807282822847890275580949778469145327285713512310192921020781007168406003179418936996999411249576423279615264912034764063941432374404739689024644780533622275269177284493312000*t
+        - 8240807548602207679663929444803680793672825101783654994886245739561829971537127539744790010273187986495799916341656083849048303407690114310122383265132735703532652244962591866880000)*Dt**2
+        + (-106367100929950777600253232299716090484064607430730587192239005847332775043348048564049030470340453752560133886906257254881410656260955483243994797263626804303979173904384000000000000000000*t**21
+        - 734972025431515918072186666785846660284495573176927913136237869797234902910066076992352141264178687398646640139229320908792563279291147993086265745534960828153037271859200000000000000000000*t**20
+        - 1338471476225749426740829413727449249234654998640896771417285186885502989400983816320458928645285517678340180452106730934207967278410696725987003873926118662747804862436815667200000000000000000*t**19
+        - 101604797315115834564652779588062595214081779697000001825404607633713411386353531319877363207805975122698029488480377527277106665971434706252274125864276900351027498188800000000000000000*t**18
+        - 261977052237683650106727901088919292494260202462613574783980313802627123116368655957167114325290927780034732898223566167809625475096437365687489839312547717182160504349314252800000000000000*t**17
+        + 5990488573651521585020888461608964691445402891393223165800680979646364587483119038736205383806165824665928452512772425118601736999954107658482578707130136985683388712049704960000000000000000*t**16
+        + 3325591476770598043844541109237311554163090835214620141094152374429578805501919297931077693780276192973293901112817526309698928873232083582433633404962339794400842698791481939853312000000000000*t**15
+        - 1733692442328173609866692489623210737477710266523826979778302626518716157725579535844547161461168984664578504654221962504527926921405105749621810755563210693340354242936832000000000000000*t**14
+        - 1611053060741127305174731015470789457946882621419918287407469686758187171961753619055835022191908547321863562653683798949682325934456524794869115061522135050912634796365182633246720000000000*t**13
+        - 8894904953391250457055371664819028533872167683367560381633786468688776720672969415683170018957386884763191070055660028675240684285572600614157722046485524593113308781854125457408000000000000*t**12
+        - 2908967472615532929369507415529385528735137308720545662458568241560107766019920920738971345404769169402650339803151690541478389177622417866930678650204006494653760860836360118388706508800000000*t**11
+        + 1857459774333051771174665796667248203771691882304107091643696345291989693740330880223399090218617464825959993844523608060454267178780443163473134655341923025564651738086678462464000000000*t**10
+        + 332854686599403676528155549732182666815515083419924703008802658575062191392853813296222036618918114369873338392030506243160767081508253368079994308036411638453462146292625596292792320000000*t**9
+        + 4113993925557436826715830270030143915207215118196764786435914796025063407096569410103807656922735351714988405685134657167597609351458607734175082488631970231559531536364349395849707520000000*t**8
+        + 920020591037834122805076790688620215844244031994434847343475726966783037095602979281061368740533363857606460282261598879268972860677280011877970984562907231746302365222972152454213439324160000*t**7
+        + 1307257792490263412009680550183758191604981783239960414171302976105445424244694569208547260352761022664683781540315366576727061034255989327513119208415351606929137366424765377963622400000*t**6
+        + 479596728316819176654576972736416078191700935373850087424828618491774464362082436568326155070912739895807197626510998492001862806354347657479572941370868805811401011015634923172035926425600*t**5
+        - 179352881527446833727923347828234512133081651346495550522866842208994036817462367079574174191453828029890231033657960236568386577505932746410436636763487070954599968156562504189151805440000*t**4
+        - 251568270025211201955389171860338579171675714868104052152789880989805712726614197574887246767925108246607970007160940134370673529705101398997875679835167365081669374673539993436160000*t**3
+        - 141772430429024326881509616736177148212059744813752208473666088996700368688933789363560771135161864201721524861419389136852260702560567771393655430337183040528733205980885277265100800000*t**2
+        - 25817606346086956476758470208850883766420383787607030339022713274189365873405154695767797745935894060883806800961601773820707673481632102376182116930107064769426021006200320503617211596800*t
+        + 34918206405098505823938790072675572231488655998026261577866691497637535623661745400444768148106948876570405151317417742685700849593772165309178580940805695949542187927076864000)*Dt)
+
+def _build_quadric_slice_pol():
+    return (
+        4980990673427087034113103774848375913397675011396681161337606780457883155824640000000000*t**12
+        - 16313074573215242896867677175985719375664055250377801991087546344967331905536000000000*t**9
+        - 14852779293587242300314544658084523021409425155052443959294262319432698489552764928000000*t**8
+        + 18694126910889886952945780127491545129704079293214429569400282861674612412907520000*t**6
+        + 32429224374768702788524801575483580065598417846595577296275963028007688596147404800000*t**5
+        + 14763130935033327878568955564665179022508855828282305094488782847988800598441515915673600*t**4
+        - 7447056930374930458107131157447569387299331973073657492405996702806537404416000*t**3
+        - 18581243794708202636835504417848386599346688512251081679746508518773002589362454528*t**2
+        - 16116744082275656666424675660780874575937043631040306492377025123023286892432343685120*t
+        - 4891341219838850087826096307272910719484535278552470341569283855964428449539674077056375)
+
+def _build_quadric_slice_crit():
+    return AA.polynomial_root(_example("quadric_slice_pol"), RIF(-0.999,-0.998))
+
+def _build_iint_quadratic_alg():
+    aa = AA.polynomial_root(AA.common_polynomial(t**2 - t - 6256320), RIF(-RR(2500.7637305969961), -RR(2500.7637305969956)))
+    K, a = NumberField(t**2 - t - 6256320, 'a', embedding=aa).objgen()
+    DiffOps_x, x, Dx = DifferentialOperators(K, 'x')
+    return IVP(
+        dop = (
+            (8680468749131953125000000000000000000000*x**13
+            + (34722222218750000000000000000000*a
+            - 8680555572048611109375000000000000000000)*x**12
+            - 43419899820094632213834375000000000000000*x**11
+            + (
+            -173681336093739466250000000000000*a
+            + 43420334110275534609369733125000000000000)*x**10
+            + 86874920665761352031076792873375000000000*x**9
+            + (347503157694622354347850650000000*a
+            - 86875789597407167434273839673925325000000)*x**8
+            - 86910050568035794059326480970966757245000*x**7
+            + (
+            -347643678708930265539961323497102*a
+            + 86910919851054405739455463644256161748551)*x**6
+            + 43472594673506295255760083321808514490000*x**5
+            + (173892117615201333036370696994204*a
+            - 43473029490746392066693340766736348497102)*x**4
+            - 8698033700269174138676020224216757245000*x**3
+            + (
+            -34792482725903955594260023497102*a
+            + 8698120698872230261516983671405511748551)*x**2)*Dx**3
+            + (60763281243923671875000000000000000000000*x**12
+            + (208333333312500000000000000000000*a
+            - 52083333432291666656250000000000000000000)*x**11
+            - 234477992673174567319171875000000000000000*x**10
+            + (
+            -764240013812457865000000000000000*a
+            + 191060003835234473156228932500000000000000)*x**9
+            + 330156310115926628448399128620125000000000*x**8
+            + (973135289153552641195701300000000*a
+            - 243283822774955804875701645597850650000000)*x**7
+            - 191233733487755068298811316717716757245000*x**6
+            + (
+            -417298904667923776195701300000000*a
+            + 104324726375630396382887213097850650000000)*x**5
+            + 26094101100810161155908042873375000000000*x**4
+            + (
+            -69514669437478911188520046994204*a
+            + 17378667394127062515869467342811023497102)*x**3
+            + 8698033700269174138676020224216757245000*x**2
+            + (69584965451807911188520046994204*a
+            - 17396241397744460523033967342811023497102)*x)*Dx**2
+            + (78124218742187578125000000000000000000000*x**11
+            + (208333333312500000000000000000000*a
+            - 52083333432291666656250000000000000000000)*x**10
+            - 251856486245875973569171875000000000000000*x**9
+            + (
+            -625316012437468398750000000000000*a
+            + 156329003422025105906234199375000000000000)*x**8
+            + 295416870168264228344991085746750000000000*x**7
+            + (695111652889255253097850650000000*a
+            - 173777913569869639719090289048925325000000)*x**6
+            - 156459163637812954018800921493500000000000*x**5
+            + (
+            -417193460646419731793551950000000*a
+            + 104298365370201663271597853396775975000000)*x**4
+            + 43472594673506295255760083321808514490000*x**3
+            + (208649452333940788630630720491306*a
+            - 52162363187809923324628074438141860245653)*x**2
+            - 8698033700269174138676020224216757245000*x
+            - 69584965451807911188520046994204*a
+            + 17396241397744460523033967342811023497102)*Dx),
+        ini = [
+            0,
+            0,
+            -25025281000000000000000000000000*a/187499999962462078501878794067386883
+            + ZZ(4379635063042987000000000000000)/62499999987487359500626264689128961]
+    )
+
+def _build_rodriguez_villegas_dop():
+    return ((t**8 - t**7)*Dt**8 + (ZZ(32)*t**7 - ZZ(49)/2*t**6)*Dt**7 +
+            (ZZ(16051)/45*t**6 - ZZ(8893)/45*t**5)*Dt**6 + (ZZ(8582)/5*t**5 - ZZ(5695)/9*t**4)*Dt**5
+            + (ZZ(485956093)/135000*t**4 - ZZ(4332716)/5625*t**3)*Dt**4 +
+            (ZZ(49681093)/16875*t**3 - ZZ(530324)/1875*t**2)*Dt**3 +
+            (ZZ(25631450719)/36450000*t**2 - ZZ(30232)/1875*t)*Dt**2 +
+            (ZZ(404509399)/18225000*t - ZZ(8)/1875)*Dt + ZZ(215656441)/656100000000)
+
+def _build_pichon1_dop():
+    return ((t**15 + ZZ(3267)/1400*t**14 + ZZ(48672657)/24010000*t**13 +
+        ZZ(6278215311)/8403500000*t**12 + ZZ(79377403869)/1470612500000*t**11 -
+        ZZ(17235373023)/588245000000*t**10 + ZZ(29962394991)/7353062500000*t**9 +
+        ZZ(5338482309)/840350000000*t**8 + ZZ(10097379)/9191328125*t**7 -
+        ZZ(2864486673)/29412250000000*t**6 - ZZ(889809381)/11764900000000*t**5 +
+        ZZ(90876411)/4705960000000*t**4 + ZZ(845522631)/117649000000000*t**3 -
+        ZZ(62178597)/47059600000000*t**2 + ZZ(14348907)/470596000000000)*Dt**2 +
+        (3*t**14 + ZZ(31401)/4900*t**13 + ZZ(126844299)/24010000*t**12 +
+        ZZ(657355581)/300125000*t**11 + ZZ(703082466369)/1470612500000*t**10 -
+        ZZ(1845720837)/294122500000*t**9 - ZZ(283373025777)/7353062500000*t**8 +
+        ZZ(3389156721)/735306250000*t**7 + ZZ(2044099233)/294122500000*t**6 -
+        ZZ(1193911731)/14706125000000*t**5 - ZZ(4345238763)/11764900000000*t**4
+        + ZZ(4782969)/235298000000*t**3 + ZZ(2029573179)/117649000000000*t**2 -
+        ZZ(52612659)/23529800000000*t)*Dt + t**13 + ZZ(4707)/2450*t**12 +
+        ZZ(35142903)/24010000*t**11 + ZZ(2766902841)/4201750000*t**10 +
+        ZZ(593733702753)/2941225000000*t**9 + ZZ(14712825987)/1176490000000*t**8 -
+        ZZ(345893523777)/29412250000000*t**7 + ZZ(25743087333)/11764900000000*t**6 +
+        ZZ(30646431)/14706125000*t**5 - ZZ(6916783347)/117649000000000*t**4 -
+        ZZ(398757897)/5882450000000*t**3 + ZZ(4782969)/588245000000*t**2 +
+        ZZ(314081631)/117649000000000*t - ZZ(4782969)/23529800000000)
+
+def _build_pichon2_dop():
+    return ((746157370383607780268281787734832000000000000000*t**33 +
+         2937050189908953187944625603639845600000000000000*t**32 +
+         469614865672237485915623241731317320000000000000*t**31 -
+         365184827397029140016231993816849080000000000000*t**30 +
+         110944774151836196348314877983386106200000000000*t**29 -
+         11380341540557560556900515965975083160000000000*t**28 +
+         5064439243887202292010728648909404445000000000*t**27 -
+         1257366926607543085231861810404128061600000000*t**26 +
+         266146971712866146293945515884764461375000000*t**25 -
+         30727177685920656488195236985819228112500000*t**24 +
+         5783647712598587658657435695965039010250000*t**23 -
+         733105444202421221958628321148482481025000*t**22 +
+         163417761394888242929209807518319266625000*t**21 -
+         20378463375663565406211173369225860395000*t**20 +
+         1805157036345454035393109299941656496250*t**19 -
+         28734209344143631924881835050371753000*t**18 +
+         42191369445010838383447992684269030250*t**17 -
+         5360344410627430782674972070613881300*t**16 -
+         40258023852298772812352637379009600*t**15 +
+         37111809497228991021946609632678900*t**14 +
+         4334864661210906233297226375950580*t**13 -
+         312878014166242099768112705306800*t**12 -
+         49434309305312895032999402122710*t**11 +
+         1504030910378965552181064104388*t**10 - 397299245405596011331869091600*t**9
+         + 3327976536313852822430288280*t**8 - 240759907263780773101826316*t**7 +
+         1575766589616228276528456*t**6 + 1169405659078502871984*t**5 -
+         340219010078729784*t**4 + 156714342084432*t**3 - 21417073920*t**2 +
+         622080*t)*Dt**3 +
+        (6715416333452470022414536089613488000000000000000*t**32 +
+         29755160852192889930740886867553449600000000000000*t**31 +
+         6703255647071249864685703759989520200000000000000*t**30 -
+         4052139294094246546254720348410180796000000000000*t**29 +
+         1241065582328571821499713534648881961400000000000*t**28 -
+         163196842186158463282585978936836346020000000000*t**27 +
+         63824476638232032420290639211571864149000000000*t**26 -
+         13785898136559538213978911377306571894900000000*t**25 +
+         2847953065059374251896276216239598034575000000*t**24 -
+         396071339990518123924277542870899236287500000*t**23 +
+         42614438601869182599937747947700173230250000*t**22 -
+         2454215657499554993921670489046274323950000*t**21 +
+         1017901086065890148770308441654711898462500*t**20 -
+         181857106281754828556126415249228425610000*t**19 +
+         1143702227463189379619431567289324895000*t**18 +
+         1598346995868752007300352629111634267875*t**17 +
+         74956697413052845193859411733795459875*t**16 -
+         19009744037099873086654117489150359900*t**15 -
+         1769661892221081184316938007496859800*t**14 +
+         242073073096515996873127906411971225*t**13 -
+         21514911402775466364729961255386120*t**12 +
+         456731785408596776374082377536360*t**11 -
+         168728174891880986938758501309120*t**10 +
+         3503716141052046383571037616232*t**9
+         - 1944354950752544812874534896140*t**8 + 8680838712106318390653108576*t**7
+         - 1663621982793785651293745004*t**6 + 6421982376427828690835844*t**5 +
+         7450062275095400595264*t**4 - 1544849327918133432*t**3 +
+         1070363538490536*t**2 - 105353706240*t + 1555200)*Dt**2 +
+        (13430832666904940044829072179226976000000000000000*t**31 +
+         66153739990410402339960286604696577600000000000000*t**30 +
+         21808994341302809802524747159269876080000000000000*t**29 -
+         10494379635032296254230549081675732976000000000000*t**28 +
+         3351440178890540800815777396270518827200000000000*t**27 -
+         493244319490828472051231560598848374120000000000*t**26 +
+         197432320170564988345926862262800727784000000000*t**25 -
+         39199167987105367019442720607675455634800000000*t**24 +
+         8082452230871963946782251015587290001300000000*t**23 -
+         1209791553981598308416867514796298164545000000*t**22 +
+         65575252087816890810286074571350240594750000*t**21 +
+         3788041998837180480754255000770969837825000*t**20 +
+         1531038434507430028335364818140247745987500*t**19 -
+         350844906897995446012789621065444818827500*t**18 +
+         38874250135016862758086141555614157500*t**17 +
+         3319699766911425228191442756799983650250*t**16 -
+         121295286994558504901225276352588301875*t**15 -
+         3892067362357152828849722920376464725*t**14 -
+         4832494322865985902539250227743717200*t**13 +
+         351449832918258832272304814511779400*t**12 -
+         81646266466068623687920541962080495*t**11 +
+         3382953254222440421013414499338030*t**10 +
+         178320447565960421098685130093780*t**9
+         - 7871255523535193680931879265690*t**8 -
+         1311791688836056834661981767230*t**7
+         - 3669863408357320502760733152*t**6 - 2403891527286727339025203200*t**5 +
+         2807257775803823829618600*t**4 + 8891137706804799161184*t**3 -
+         998237574816002208*t**2 + 1491736909495824*t -
+         79629350400)*Dt +
+        (4476944222301646681609690726408992000000000000000*t**30 +
+         24265719425478341606146266491428752000000000000000*t**29 +
+         11220172241193734988647079089678739600000000000000*t**28 -
+         4570045467602020790920717963155178632000000000000*t**27 +
+         1532165007321635948937607298448236738400000000000*t**26 -
+         233870672524729278014397960296819893920000000000*t**25 +
+         100022671036825272943014986160387177324000000000*t**24 -
+         19061654045997315248659934271106385493600000000*t**23 +
+         3961739284577245096348384563441157390500000000*t**22 -
+         597242944044341560732374936441365854530000000*t**21 +
+         14483430034599451505816999462594350961250000*t**20 +
+         4295342296819006913834694896110668041625000*t**19 +
+         477403310573621828149265748306716019562500*t**18 -
+         108216095686050487957016667578535772687500*t**17 +
+         8637394028509341984237208612605013500000*t**16 +
+         42587660570256279655146221279710987500*t**15 -
+         28611804464649770076381911915952725625*t**14 +
+         2934356991343942799367795341136729375*t**13 -
+         1597034015069033996566956048370515000*t**12 +
+         93576657857695983056094413771076750*t**11 -
+         12374427701734959744900622658131875*t**10 +
+         866991661859599207762843955727750*t**9 +
+         210020629670556904170406600704000*t**8 -
+         6136397383839339671781116411250*t**7
+         + 197510661491382703853208257250*t**6 - 3035452408093341561475782000*t**5 -
+         519648757562045120861574000*t**4 - 751682276841743291160000*t**3 +
+         1210231098479921400000*t**2 + 65719530407520000*t + 287329939200000))
+
+def _build_pichon3_dop():
+    return (
+        (- 369768354845847942096160222348407025779969976884345215420614382641410412316102492160*t**66
+         - 1194425701390398654775163698064074141928556415215471042015715518906053552862801690624*t**65
+         - 2237812216099771728721378672571168763459359209952428249042997292285635221759420268544*t**64
+         - 3053206657475693757172536627525916655359978313191845702106940577202951476459637309440*t**63
+         - 3382819092067510822518755025876273219629181184812319449409792767583195608345956450304*t**62
+         - 3248464104200736811985507190402096222843616560246782239629093878773966583641286180864*t**61
+         - 2892704675628419233899165483477375041802856764051139228799378016140112044605748674560*t**60
+         - 2476861300049294368259251457949707309756665521660626103090725329760378974976904855552*t**59
+         - 2055641292224998611775727091848444998971967505449385720683480345769607349069144211456*t**58
+         - 1621890525353242697716201044369784535909234418024033275710603549548209198174727942144*t**57
+         - 1180864011118263734585946103073546387860392996635002350726489957584937341778235770880*t**56
+         - 776902534820768235403619870936330292002373843426284102414728735612342640379511429120*t**55
+         - 454794659128206634019583477502681830830636083885047168418966415970751087904126073856*t**54
+         - 234064834591378307616008122254981843743712498676068342160927379305175659623177918464*t**53
+         - 104328405020419814559328305416196229154698458881934059808004255391660966723409427200*t**52
+         - 39023339829132177873652749720209353602628992346805110210396958461728509019885557248*t**51
+         - 11273375752763496722325348016480321714704960357625576631388170688616727978156857824*t**50
+         - 1719377712772277526551594570697984257636935973298224789900892041134220097307747432*t**49
+         + 592900882057478450620844990832865414592678420345863929022104967889664696220783124*t**48
+         + 682147909728114031767235435246657385404085683855178213709638778125159578608671444*t**47
+         + 378532299505771935441111753566308766170968572045253421314925658332371950469802510*t**46
+         + 156508396491466141399616406460449977116869029596904791120346557346975917289575513*t**45
+         + 51406897536633885149684648751434448439587706859166220331205621976536324475199375*t**44
+         + 12918430729714219105266683820428072227475712211728611538012319066631597474456681*t**43
+         + 1912078282744560327756627966501389581206634138932619899559379642589760082180888*t**42
+         - 263333946788867901752926234237964697026140992885426859042903742075427563167127*t**41
+         - 336070701308436922742269441840746210706503580982031229792364595777163566200342*t**40
+         - 156063816319519403560163732076535193147936175566363627560382224425491102233834*t**39
+         - 51523716006319723670936697798354487841951888134700225909110078200878104193955*t**38
+         - 12886931238531102078089222807048690497483173051985760206177414707253806048325*t**37
+         - 2192104733897075271167750433788819295620647343256035578967648046701123559704*t**36
+         - 56740473747853140692978595175968391696261771439518955321288764382880010032*t**35
+         + 135945883965112499407138954979285052839413429329192512610316745856004945972*t**34
+         + 66652549523463771910120799065671988050943333735294334169014852855943660198*t**33
+         + 20765679824851193180637478015365274664525558941472492019970167604941365182*t**32
+         + 4819207323894301789264211010164067008873863450761250860521763628967656106*t**31
+         + 793001103474612328334411580754178385202924277879538158896160325460728912*t**30
+         + 50695263148288646267687558349982688301225677569569516434419641189997406*t**29
+         - 22868466095100444586519975105548519303042816403195880370700439020652436*t**28
+         - 11791646839248312546244175344669711991179739974294272947962936168629272*t**27
+         - 3427812800750555890196759498953265794977585202872371303502358832251102*t**26
+         - 753036244851989994509830310226454280094770940044943658388708342745106*t**25
+         - 125791196174617345116936237115566950801134644591832951563570451708172*t**24
+         - 14409812464003979833923442146023422808320226933435219869668762837848*t**23
+         - 34030937267623179419453403898045740874018471001671658694679681522*t**22
+         + 509420509731891845757927905803929972300475728415255762912880650409*t**21
+         + 179619020831902634890524687575028476339224193112339069296130952995*t**20
+         + 42244562679357761540862416873198052927322033636453531711517544125*t**19
+         + 8370618610651423165352913799720908665974592410964827899219487944*t**18
+         + 1411293566185114777862545715172918816393455767849913515238965201*t**17
+         + 216721315865340018497718745550917289518282103174418178144004762*t**16
+         + 29328922291182147428899969541208906975044155350849596619669450*t**15
+         + 3694701087474884340687467675796378521154882375551372282331313*t**14
+         + 410979967222688690935418698735234222924456447335000979251119*t**13
+         + 42959508971252203860576182059717246468207742632561622184160*t**12
+         + 3902157729468485876196917864681038524241191655332029528300*t**11
+         + 334496236786123222047193613259121400818312536092889958400*t**10
+         + 23998027540156348985955854381522120246952774141553664000*t**9
+         + 1617855414155599359169622438006300739878820076978176000*t**8
+         + 84373482152770962948701784318653904925641367879680000*t**7
+         + 3957755050323579727877374951115663907134835261440000*t**6
+         + 116226287458370788144177452933082655366735462400000*t**5
+         + 1671616841564766644643154984087423948318310400000*t**4
+         - 46771814431588362057862541068856442067353600000*t**3)*Dt**4
         + (
-        -69514669437478911188520046994204*a
-        + 17378667394127062515869467342811023497102)*x**3
-        + 8698033700269174138676020224216757245000*x**2
-        + (69584965451807911188520046994204*a
-        - 17396241397744460523033967342811023497102)*x)*Dx**2
-        + (78124218742187578125000000000000000000000*x**11
-        + (208333333312500000000000000000000*a
-        - 52083333432291666656250000000000000000000)*x**10
-        - 251856486245875973569171875000000000000000*x**9
+         - 4437220258150175305153922668180884309359639722612142585047372591696924947793229905920*t**65
+         - 13603136689829916466666846516791479005478742860950772957709222000947407714174395482112*t**64
+         - 23336040345362998270306760461714372271845369552746858609799473868752719280417266466816*t**63
+         - 28770343969699235315429157379927299899220524783361023284133140408341793815317403402240*t**62
+         - 29295936763732059225004343168283905191711001945906692987806796145914851902639805825024*t**61
+         - 26890503621599869321898740335323531769357645875459014014359950872697558071636184465408*t**60
+         - 24605638000016118270456806206963332068712459382893129379008068652727108525371843870720*t**59
+         - 22764733279245348799667857920147845633266832460129950647617484982939710602858230611968*t**58
+         - 20388664916630435117593206300866636003804606174006563255604198740305995430634543022080*t**57
+         - 16762837811846273146400347761140670923951015875256845794166275797104118483056922210304*t**56
+         - 12195616033173022165083964425229185897152701246991311008910215096006025039908950609920*t**55
+         - 7731711061783851626356940628603257441754921300211213269686282146696959367031780925440*t**54
+         - 4224399258809068466104567835897781329007925586139924365058281727155374443170733809664*t**53
+         - 1959206947301989270577338194950423187325014632629469451856014704568991229373233653760*t**52
+         - 745641749046200609971117675758209065487784276996168035420413873038586635575294288640*t**51
+         - 210027290800506469824380946685285798478295199334043874949677169607787628836315760256*t**50
+         - 24011986401901664235188252125215273355393428328265452946126245335160915468233284352*t**49
+         + 18448618411408104139960464440440772359952344530947204085664216008633280104950497432*t**48
+         + 17124406228334806024715833365136569471465175484887728683895542429060292818876085600*t**47
+         + 9109402299926395185317165155639572194211993996075537996589647841126035188094645644*t**46
+         + 3716072872589488992298697078997499386166932640031822679439720600184536065305855120*t**45
+         + 1227933001300999284387681419759979659563348880081327960470961479064559664612226079*t**44
+         + 324226530387115459772673684281618886423457532854145993885887236123021724356358550*t**43
+         + 61328483780959862856588303994119668670847957156126772436013571843384761358413795*t**42
+         + 3672955358368521282141442313365836475347429161851206671402467620629707110824193*t**41
+         - 3145532026172473951409635326552275719286317594954132756481788903735714464733484*t**40
+         - 1785197574689323870922236785752964755275077435986007092714259961110860850506581*t**39
+         - 599712256919799649317685961429824699032478038530476323470593162536143684741961*t**38
+         - 149188971682396127251184213429532474323185206814660505206769162143396674980460*t**37
+         - 28137379562110490608315691947944810330212222119061554703791417720229391724280*t**36
+         - 3887288267103525475570720810545187836013845754073786460658359653320416207843*t**35
+         - 448615253087548981291687602898893044714772762649135748922450096771846255291*t**34
+         - 126197387036773175378973748658649822017860632923626576422525483130701373702*t**33
+         - 68232659902788698689101721884022588994331813815682554632514423661359313975*t**32
+         - 26975485636234120363822697204056909347455207386351651262190182324286470483*t**31
+         - 7034502527510501734740736879235192558628328078099131005086152530238656108*t**30
+         - 877641022632570110276109374131607786036124919856492431674275495162204799*t**29
+         + 212289332056828278305351630785484518601532616670447985685629238459884479*t**28
+         + 178133789457312115825023651183034208299814628780316692678310143299933400*t**27
+         + 68513587426509391600992310340773265105053787956978526233597759335956403*t**26
+         + 18980338314385913027436578020143472812130950816064269843709287602882471*t**25
+         + 4119640471476035618206498794297924441533180610855730407947920341884902*t**24
+         + 657991561711277325112937192020865997361010110693689295721168076566007*t**23
+         + 58152108660627849962386341520332005943099010594514589773918938121995*t**22
+         - 9367532525796808000226381997753385315107363267588137613743600801042*t**21
+         - 5951673682850341272393552897186223123248508556146164146916605955132*t**20
+         - 1870021573335937942265775362482991019860557557057405440194492279695*t**19
+         - 437449788695102142098016781572619343024494239837663145522909778015*t**18
+         - 88846568082606869639573440921800219978548492899746040892870075310*t**17
+         - 15514073515720167019956079870108601287136789720040255069836770199*t**16
+         - 2482728472088112418333463217851477954321378917953635409917182571*t**15
+         - 350446010920555060344037506611695609837730540345760712633399710*t**14
+         - 46133877865993450388169147799247511644637456143098295243087783*t**13
+         - 5353429972590576172902735819527228672601338074438274331941390*t**12
+         - 584274491609073714658539273007056501077937008471603227825440*t**11
+         - 55229177907065627597974001551268208497040716365083471772000*t**10
+         - 4933040999393223464240257718073911519671721406131402796800*t**9
+         - 366681229583812268841858458035075261112522017359998208000*t**8
+         - 25696055020239668082619213802912460936648994882437120000*t**7
+         - 1378537822199995288610304276377497864997160499937280000*t**6
+         - 66952748561627250421254836260679800626790237470720000*t**5
+         - 2000889649486692213803719420633429414780285747200000*t**4
+         - 27662756300685406111193055015812142121510502400000*t**3
+         + 701577216473825430867938116032846631010304000000*t**2)*Dt**3
         + (
-        -625316012437468398750000000000000*a
-        + 156329003422025105906234199375000000000000)*x**8
-        + 295416870168264228344991085746750000000000*x**7
-        + (695111652889255253097850650000000*a
-        - 173777913569869639719090289048925325000000)*x**6
-        - 156459163637812954018800921493500000000000*x**5
+         -13311660774450525915461768004542652928078919167836427755142117775090774843379689717760*t**64
+         - 38619494888925147228095185970442204923444426217947680233689573325066518381985512030208*t**63
+         - 60738043349941102526726490781474236897930330804352021497505374562788989104394021634048*t**62
+         - 67964392701072296873915757225400637684694148572402160063141772096208445953064181956608*t**61
+         - 65952759371737409256054212381235723527925538055123983997312804111313103478058827120640*t**60
+         - 62651916006424728515744889440353296566437992227660544128535138931500880331370332422144*t**59
+         - 64214506719316835507062946391513424102075253014614435001118090854485771274938174406656*t**58
+         - 65667554263809750176563156490721191796391513281375728068891024541231860708063481167872*t**57
+         - 60864490782776641257921901103370857968103080908767895571092546787865960957291529011200*t**56
+         - 48794919950100399473580062350435835531052235626303093095995034543994765685440417275904*t**55
+         - 33121245393951169051355319176690238157374893922728464493753354742582785049695904006144*t**54
+         - 18876528220494846499512453470545937245953164336350871619110184082494598655499210530816*t**53
+         - 8863652227416076055465649632886981573085877089862500031506877113196959662207533641728*t**52
+         - 3239659287970034816213223143052016281827891481786471860526463778782019461416864227328*t**51
+         - 731221326882706340980594690500516502638132020437397530837631818752955828604408583168*t**50
+         + 96913601056074686974545137902579679911912367783337272194804672073358829964477452800*t**49
+         + 229730022760093735937301604955503108174744556637432442690811340231333876813567650304*t**48
+         + 164086739209565064572643720800715518878005269312975683508987239538815660952990642800*t**47
+         + 85535184908991390956201804643069762370521104026409099737746206738421724952565958656*t**46
+         + 36763962758244391089982316669261271656671192756935610394270472247404851716415601072*t**45
+         + 13482498693642609597450063421257595054466158799562724591782437849073278066444019812*t**44
+         + 4216301197366129469494099185297945622599524159564852053291669194029700376216559940*t**43
+         + 1081683581708188014261826220132303195965267591268619898820795446579035392345376876*t**42
+         + 194876085553394655398449018730666138002499340378782161156588400205338826996972514*t**41
+         + 2066170014956714880412668737533140400917132930455192515901929319772810819378324*t**40
+         - 18428043805465766712198157285167869249825274610307044293824874626745173245332708*t**39
+         - 10621687189467130298067087527776612123653515594750383597904592826978599864101746*t**38
+         - 4166873383450683326837581588869301779968647635126870622353476044036039269714060*t**37
+         - 1304480293765802947074024678304451336464818188356246232041998141794682126557256*t**36
+         - 330654897580009487963984093334903148606302231538414172801479753213093398279782*t**35
+         - 62561357105274117592403070642656706708156628958915909495888020413841048494852*t**34
+         - 5083744423685799013093709799848426551513422650081376113015893396670197441770*t**33
+         + 2319072699132560185000830755946960507104758866640847563417739980731269550074*t**32
+         + 1509145549631956207825539567444063659747841887945015170057563803988374180508*t**31
+         + 547806835926372403610949621207624893410144930548905583162262927316066348286*t**30
+         + 150356434416366562997573124907458305561813535402139892794382862708853221754*t**29
+         + 31865259131462480592266010625330751359653805150735987038659644105128914436*t**28
+         + 4668737998996904321824689817073414119207993085878040137494385582435244370*t**27
+         + 106675960005874575030480721398857729239377409579250318107849180829294634*t**26
+         - 217186370392098244455660134737148084632560286629636233862569962017197364*t**25
+         - 94173210271224504566618542809757279926652571267082168287323975482174078*t**24
+         - 26432754085996140367528731021024914854084254659810456809182073914763562*t**23
+         - 5702131803503873853514109900504160087767767349937323984519271900642348*t**22
+         - 964850396476907530201363829556787095906836685730253547099842493744126*t**21
+         - 108597017295959062522981910461415671487080414032464256241071983224646*t**20
+         - 707138018387031804872080198999867537650551943950981817466338574944*t**19
+         + 4111168717733819811381946523200855972278930423398764864586847225342*t**18
+         + 1406706515615016887308591745365852407240049542394706470145799385612*t**17
+         + 343980255819887868945534460990394715968395127660341613658309651336*t**16
+         + 67010045191968971504517619565923906515767297752284026481640125834*t**15
+         + 11629417304909894379572402667339572701842197537110313498537549920*t**14
+         + 1742028000862544572749838900861580473456889417366499797421819456*t**13
+         + 241216998397301379414548555423200933431862154708481635360744814*t**12
+         + 29136759713911093488718438773149176324863088910656904327275720*t**11
+         + 3298999676517724999977797985692655123894044687456471844549840*t**10
+         + 321282090567084708770063842359098355188527462683523109310000*t**9
+         + 29548233438451576299376226528937577149919769118260783756800*t**8
+         + 2246932671895571818199991210767886232120131227381875200000*t**7
+         + 161423396253555751671423678710607479480631468827443200000*t**6
+         + 8798232021893213374027412558410914259563454774640640000*t**5
+         + 437392069766494836355979387215064357519719158251520000*t**4
+         + 13121430656472734659679608647068093245886457446400000*t**3
+         + 176330552512968062433341251112875984316006400000000*t**2
+         - 4209463298842952585207628696197079786061824000000*t)*Dt**2
         + (
-        -417193460646419731793551950000000*a
-        + 104298365370201663271597853396775975000000)*x**4
-        + 43472594673506295255760083321808514490000*x**3
-        + (208649452333940788630630720491306*a
-        - 52162363187809923324628074438141860245653)*x**2
-        - 8698033700269174138676020224216757245000*x
-        - 69584965451807911188520046994204*a
-        + 17396241397744460523033967342811023497102)*Dx),
-    ini = [
-        0,
-        0,
-        -25025281000000000000000000000000*a/187499999962462078501878794067386883
-        + ZZ(4379635063042987000000000000000)/62499999987487359500626264689128961]
-)
+         -8874440516300350610307845336361768618719279445224285170094745183393849895586459811840*t**63
+         - 24286386472240363370793221593673315220301749235362027729500987098193875747631891742720*t**62
+         - 35167337814098736920925506934370290487813065331081169313245840927916907848510530912256*t**61
+         - 36175812934369890917174237734873082341460530938674735026983697072883078367318408953856*t**60
+         - 35473524165347443293542321952318000522601662367109994766101936526622595619838964006912*t**59
+         - 37346818305097511807380229979406222561147681038314056593398221313950302825619195166720*t**58
+         - 42693740009983192829555160552509157977891132971704092596544135378315239011068899885056*t**57
+         - 45080601483231681159866683246062238972320024212211855541352240433116176439855522906112*t**56
+         - 40276873906566706364796959829136899193710051809468889018846900428471784811098269155328*t**55
+         - 29882924546196711378487080000314036242211172624938521654311992862301414357142459867136*t**54
+         - 18191618706270145075575892805004518236911380974575386607230381177794611366384203341824*t**53
+         - 8966985220214787671101985270091689876010409488880415097746245828888323608589048365056*t**52
+         - 3405494619900323925931110561971801349553421880445799416352936739506718053665039540224*t**51
+         - 804747594365899845026269055082438488512057023265165206070945352495744039675036325888*t**50
+         + 83268126152532669709950172420132797603585891516472970531346405639484045318115704320*t**49
+         + 234337131489316223667205993891132495954686782633711451280646844726826515966198457344*t**48
+         + 168392565434651997395149033044418858670792872828729088304377470320031928913395941632*t**47
+         + 86118516214042148641518761998609730574978538404039268205390137407602138441398388816*t**46
+         + 34951993140674293322366863663486364057914957740631828219610927938929524959499639904*t**45
+         + 11246062414224363876395112385261173542178042526680671249870548490814694099146599472*t**44
+         + 2570590082574616222434853218590589803897025008214730646000240536888398763702778392*t**43
+         + 147027602710150550125163374163333534901200351536854761270802513063820926345407532*t**42
+         - 241540126235580012706241970739100774434070602266475856550012122344116708154717272*t**41
+         - 167037388590988168993181889781840531338346576092109363939634473529142970888432558*t**40
+         - 70967394597715090405918240656275682747392642874590436167780476457072664420703992*t**39
+         - 22147461546695635636735569894536928466386956319617855562537457374493420195880088*t**38
+         - 4718715530981908186434127090129982229393309421795390883739018912615274785120302*t**37
+         - 231063437634844383707256614532171427730370685985704824414585616793917693283016*t**36
+         + 373810743065678612352335445586349132831329375361322352850751137608433843923896*t**35
+         + 227914107860088090983696688510059459567339016049174728757394722086437874888110*t**34
+         + 84996951200505712823244609150877550260066901531455431289135337883931948432680*t**33
+         + 23025959851619380675736882315837302142029634270481602916149302784786820327354*t**32
+         + 4145744934628857356245056447768449848809197823295982464251647803446090571690*t**31
+         + 105060706295942880095670712601918807331092282377475449952247703580710176576*t**30
+         - 282934127033286564775682537017808158818710105419397036301390020647166700654*t**29
+         - 141693214524298597179793530857153782232463569126788484375723365783290372550*t**28
+         - 44427809096024793367506832553334009556325233929492451935680686388810259120*t**27
+         - 10146105464499334659225911462378408039406128795206810195194940276341006570*t**26
+         - 1519297000627126324173173347547861041447188982523258595939718296031933206*t**25
+         - 20804858574382854374986627710671646344327428124882744436705201752546496*t**24
+         + 80039306735270307921316024262487073452731896411076292217731889063154742*t**23
+         + 33421441104291890028332348169421957646719278494722619332208212819645310*t**22
+         + 8979728147087954427678931656106854663354619948398383040232027915516824*t**21
+         + 1826468690203584370296067453917413110147553021038473088637393790327102*t**20
+         + 267849389519060032152966023828027614405850930001557900945067840394550*t**19
+         + 20268465970524699096325576025588381723931371796837615216826005492612*t**18
+         - 3984533436450269626831398033129064399399418005212955313505962580450*t**17
+         - 2096106615023773404123490270343190339880146958764398228370617656516*t**16
+         - 592965743158312278686285362592575501243178287273916967000417253320*t**15
+         - 124905572979200928979886646643461808581555001175601877974704692758*t**14
+         - 22960021093439324034120496010904325048096293579052106463684126532*t**13
+         - 3584677611051328797871989586584588662618599132839273359420268936*t**12
+         - 514369633395871503711675137858539889448757189045464791479103190*t**11
+         - 63877025832403081016667724182560260654899325847108312780250100*t**10
+         - 7420210598494822844225709128083701483980683662162819391885200*t**9
+         - 737445277683050578413510273851773885598264270243427362923200*t**8
+         - 69198794569067413914266829688158087954957947314074279232000*t**7
+         - 5342307109897280118858156969543359800162679831079360000000*t**6
+         - 390302880490206274872628372043170084580976201800908800000*t**5
+         - 21487168828144092528793514335963093358767486021140480000*t**4
+         - 1085442892292637156419355023269332494613456774758400000*t**3
+         - 32562937540132076310974301998656837255830700032000000*t**2
+         - 428694647045018188621434454293382516048920576000000*t
+         + 9822081030633556032151133624459852834144256000000)*Dt)
 
-DiffOps_t, t, Dt = DifferentialOperators(QQ, 't')
-rodriguez_villegas_dop = ((t**8 - t**7)*Dt**8 + (ZZ(32)*t**7 - ZZ(49)/2*t**6)*Dt**7 +
-        (ZZ(16051)/45*t**6 - ZZ(8893)/45*t**5)*Dt**6 + (ZZ(8582)/5*t**5 - ZZ(5695)/9*t**4)*Dt**5
-        + (ZZ(485956093)/135000*t**4 - ZZ(4332716)/5625*t**3)*Dt**4 +
-        (ZZ(49681093)/16875*t**3 - ZZ(530324)/1875*t**2)*Dt**3 +
-        (ZZ(25631450719)/36450000*t**2 - ZZ(30232)/1875*t)*Dt**2 +
-        (ZZ(404509399)/18225000*t - ZZ(8)/1875)*Dt + ZZ(215656441)/656100000000)
+def _build_chyzak1_dop():
+    return (
+        (213389150665220554752000*z**12 - 10296026519596891766784000*z**11 +
+         200057885757776176865280000*z**10 - 1940574581694161851576320000*z**9 +
+         8994973242873027938935680000*z**8 - 10013228426390161817373984000*z**7 -
+         51543188099268387678749502000*z**6 + 54238320642946709844109080000*z**5 +
+         263915013549573215569467000000*z**4 + 308408735241758795421960000000*z**3 +
+         172220211080001126888300000000*z**2 + 48009834126799014178800000000*z +
+         5389705040141512818000000000)*Dz**6 +
+        (3201133633798676683161600*z**11 - 190531011046581094256640000*z**10 +
+         4469054045609470781528064000*z**9 - 52161414033763915600906368000*z**8 +
+         301863545726534821660955688000*z**7 - 611107937995277406352823536200*z**6 -
+         1151622739633762942567519065750*z**5 + 3174559640700237012877279762500*z**4
+         + 7537063031976946306202432250000*z**3 +
+         5976551521879011124233682500000*z**2 + 2124832092752015320038592500000*z +
+         288257663760671095961925000000)*Dz**5 +
+        (-197493353102517071719956480*z**10 + 7675446041099220359162880000*z**9 -
+         121043173861957361636282572800*z**8 + 989813839013583208406938195200*z**7 -
+         4341641379034242564542878108800*z**6 + 8108165175475712904368544945310*z**5
+         + 8086265826295046627593092498125*z**4 -
+         38628205152161046126572407085000*z**3
+         - 59452687393668436047876748325000*z**2 -
+         30272726890752142713437794000000*z
+         - 5289486623712670795599842750000)*Dz**4 +
+        (-2576572854278463486119116800*z**9 + 137171086334090826929883095040*z**8 -
+         2799535109950319511589271147520*z**7 +
+         29625586808198205412409053464960*z**6
+         - 178865122211497895762174942794480*z**5 +
+         563768579061926146070811724662440*z**4 -
+         263229245629094699613339773048775*z**3 -
+         2325216515338618439437020928602250*z**2 -
+         1892868986535543261556995472652500*z -
+         443975878066962431269934147475000)*Dz**3 +
+        (32510603484980591048329789440*z**8 - 1194151252545365997211732500480*z**7 +
+         16809833441633789089573050055680*z**6 -
+         92350201721356744371569280581760*z**5
+         - 108766621251672394586496043264560*z**4 +
+         2916339527592661176322885903051520*z**3 -
+         5913425235106539686432812931802150*z**2 -
+         10835000127456450424493664475839000*z -
+         3743204311158826432236930927055000)*Dz**2 +
+        (205628051009128307145304965120*z**7 - 25421990604988989669504965001216*z**6
+         + 606361997942150806801455943504896*z**5 -
+         6141760282654986152715391672929792*z**4 +
+         27987012918572513876751486535488528*z**3 -
+         49754424680571511972950797738733840*z**2 +
+         54978732390993528795482387345156550*z +
+         61626305072646847828883948195647500)*Dz -
+        (2191308486183838996428352389120*z**6 -
+         73951325877379936401191010189312*z**5 +
+         3629071829430379236923500349251584*z**4 -
+         38364090847724191369158954804748032*z**3 +
+         175754333087675380498581210544395264*z**2 -
+         423475168947727036937419895487740640*z +
+         594802540714259678423325565341211200))
 
-pichon1_dop = ((t**15 + ZZ(3267)/1400*t**14 + ZZ(48672657)/24010000*t**13 +
-    ZZ(6278215311)/8403500000*t**12 + ZZ(79377403869)/1470612500000*t**11 -
-    ZZ(17235373023)/588245000000*t**10 + ZZ(29962394991)/7353062500000*t**9 +
-    ZZ(5338482309)/840350000000*t**8 + ZZ(10097379)/9191328125*t**7 -
-    ZZ(2864486673)/29412250000000*t**6 - ZZ(889809381)/11764900000000*t**5 +
-    ZZ(90876411)/4705960000000*t**4 + ZZ(845522631)/117649000000000*t**3 -
-    ZZ(62178597)/47059600000000*t**2 + ZZ(14348907)/470596000000000)*Dt**2 +
-    (3*t**14 + ZZ(31401)/4900*t**13 + ZZ(126844299)/24010000*t**12 +
-    ZZ(657355581)/300125000*t**11 + ZZ(703082466369)/1470612500000*t**10 -
-    ZZ(1845720837)/294122500000*t**9 - ZZ(283373025777)/7353062500000*t**8 +
-    ZZ(3389156721)/735306250000*t**7 + ZZ(2044099233)/294122500000*t**6 -
-    ZZ(1193911731)/14706125000000*t**5 - ZZ(4345238763)/11764900000000*t**4
-    + ZZ(4782969)/235298000000*t**3 + ZZ(2029573179)/117649000000000*t**2 -
-    ZZ(52612659)/23529800000000*t)*Dt + t**13 + ZZ(4707)/2450*t**12 +
-    ZZ(35142903)/24010000*t**11 + ZZ(2766902841)/4201750000*t**10 +
-    ZZ(593733702753)/2941225000000*t**9 + ZZ(14712825987)/1176490000000*t**8 -
-    ZZ(345893523777)/29412250000000*t**7 + ZZ(25743087333)/11764900000000*t**6 +
-    ZZ(30646431)/14706125000*t**5 - ZZ(6916783347)/117649000000000*t**4 -
-    ZZ(398757897)/5882450000000*t**3 + ZZ(4782969)/588245000000*t**2 +
-    ZZ(314081631)/117649000000000*t - ZZ(4782969)/23529800000000)
+def _build_large_irregular_dop():
+    return ((4621860730951414426976009691548526877605888000000000*z**32
+    - 834890121311347773958990647645149199093832089600000000*z**31
+    + 71887411723271363917292543590304267463270649036800000000*z**30
+    - 3924794785949193728955849597285101280085697605140480000000*z**29
+    + 152453427667616651495126864787564858503094106463404032000000*z**28
+    - 4480725820607212866482905093994622440768157554515598376960000*z**27
+    + 103440125438423941492678430520530026083764926555127663296512000*z**26
+    - 1921554273322850961177136980747233086700426650353665468006400000*z**25
+    + 29182623543192745623665790740497861131433745494081853952884736000*z**24
+    - 365956239033682325321604964421050124829728322908241211563442176000*z**23
+    + 3809101740755860192372035805828402630093491011110223017707995136000*z**22
+    - 32931069082083405033155982581027345726991790809303457078623141888000*z**21
+    + 235430403405222388607435820012405129090956827559957282583976359936000*z**20
+    - 1375910076825097973022689558499875525451869918939969705690466880512000*z**19
+    + 6418580692488376619225015572683386027004367899299024024700985429632000*z**18
+    - 22703380113091899585974369404118345290965499267887262829462660168832000*z**17
+    + 52826033971805184969236950202545493444089596958047689713440778203360000*z**16
+    - 29453761233425326104879900560617065314588258867818651555955784660672000*z**15
+    - 343002663826900008974587872454791459592134366829189714408349939576904000*z**14
+    + 1521967034915632361650461472026658959117155403303987736632905047989624000*z**13
+    - 2635123437697871136370299835016145243192072559884063135991854289939014000*z**12
+    - 1733602635328700792249037012025766054381915645656762285109969146574100000*z**11
+    + 18499783627048559856570990471611018384192137206995962279052771216988486000*z**10
+    - 31734592681115773183253124079425932809599844092345515096565645131272128000*z**9
+    - 17008554601633235425446501789907285916087907570348791052659831439823002000*z**8
+    + 137988449157086997655688692563882953313050522624107663407065126192374812000*z**7
+    - 127593154297095129553924578655467136424292746803158275956436704156276542000*z**6
+    - 212798337815953043120693924569398843960164468447386013572325668191672768000*z**5
+    + 440892164352540966179387912083308694596102739310775003761450272740822528000*z**4
+    + 79045543677302259767285743819743566291725588369977447190339477058322432000*z**3
+    - 599322513175083835856016220613506740924842517445803437297582219230052352000*z**2
+    + 79163613308136746658456715294810889113884217826335457635175661796589568000*z
+    + 351010350628615368876845980097750853702139105414399157450620373185855488000)*Dz**6
+    + (-129526599694591340076977998861208874844013199360000000*z**31
+    + 23991625470414660721450602645635013252729192579072000000*z**30
+    - 2113933512609720193382951607624010541048608302563328000000*z**29
+    + 117907357549164338114212771761577301386997992787646873600000*z**28
+    - 4672864976762745258123889430661939616350748548764679536640000*z**27
+    + 139997660456528180294331846380188034787388929742233782137651200*z**26
+    - 3292884654245957317036066087282775616090333683848851114782883840*z**25
+    + 62324171790307953725546856127170023259402161214268959625618391040*z**24
+    - 964947330544403555438211293529277861646114413438691856755593052160*z**23
+    + 12353003293084425187941818076765957015953712482555373226326483271680*z**22
+    - 131572756542682060153505919464768857115525573747935373447479166976000*z**21
+    + 1168511786106601251178381654774450191503804382100128970882975757967360*z**20
+    - 8635217495041004713490322256244513811542933132178333894677208337198080*z**19
+    + 52703885462380566492139906991580111916815685731458346709754064319749120*z**18
+    - 261506726234225134602881869826610942467925412660263324076611446980733760*z**17
+    + 1021892972206171468896813577291530627584155462130194000380510044520837600*z**16
+    - 2925649393923624441168537872453750946893541548512635482822553710848984800*z**15
+    + 4820268315542106755961311263525870160407033386861468543551407708647842640*z**14
+    + 3251081541148591682653804880011257594225970553308415417682296265686136540*z**13
+    - 47348143298390515745700996742188122752758285164286493023956048843942677770*z**12
+    + 137479563855731203503031657887516916840614806808898271093119489071158791200*z**11
+    - 137616521221829049387246437085021414786120071551429899058186930711270363950*z**10
+    - 318459994689728915604187679644274770085319445132718096581986550526363381220*z**9
+    + 1281710417922995911724666897173500432922030469726988882045545766815890628730*z**8
+    - 1271861170066829588563768189250468778107580352706171337081497735113647934440*z**7
+    - 1902073902156977232062446642126501558275276035278588636922379735160055795250*z**6
+    + 5845084262474174022232252261244044894064101351519654631276307842337581592240*z**5
+    - 2430740167566986279171071561286751885866823761963053096122212886448107060480*z**4
+    - 7788667640322759643450006323146552039839043848258549822619998548140633825280*z**3
+    + 8490600841360323311080447766548493384912397612148250587536434558508776816640*z**2
+    + 3194999785540654329218636603873524539415723992357898909749274037456968089600*z
+    - 6178549659141363071309867829532718180527382131955016343885240187440657858560)*Dz**5
+    + (-4193826489635454920481908226764202701440665255936000000*z**30
+    + 659384104953144494114385421490150496495337659904819200000*z**29
+    - 49309663059946003240266246258486663531849118868570112000000*z**28
+    + 2333740772714851621858751369129256922533520854355814645760000*z**27
+    - 78465032532470068091505860313598376234710252210595696738304000*z**26
+    + 1994049291275184019060863260120194527841272010272053282073477120*z**25
+    - 39785429658732876086649746259684617658058935301382864919749197824*z**24
+    + 638960999020694295859592807638344905596655297239219207951923806208*z**23
+    - 8401466793285410509287855403966478763009813932998313548330069622784*z**22
+    + 91499556598022842754344275702346864644031689198585093344213782781952*z**21
+    - 831908271342063734772499035739445101421851222238932386692652708913152*z**20
+    + 6346521432933807976621950003294289393184058049683901781148241768455168*z**19
+    - 40752727419436291915121997814795542546890110510413500911693682410283136*z**18
+    + 220665741771291883807983919428702760728140904760948342686859469593639968*z**17
+    - 1008518278560690190818010476288787515159446807789720129663848457980214544*z**16
+    + 3887756039322807571924753448597592522350366700099526646282261949419816304*z**15
+    - 12550633157830597511955659613741366911145838983701572310162225123562926784*z**14
+    + 32904814697527357485605326093882714199657892696047382546145100125650048378*z**13
+    - 62355622950093752925304059995448314599006310850202934075316155321463719409*z**12
+    + 39479430609687011405695140637361666129303087273020678015409569148292969582*z**11
+    + 268032036399005209187002346931303974247285716110727335451590819400801905413*z**10
+    - 1229734965861408387250694738681632441638282135754338841751740969696129725108*z**9
+    + 2397719769814858820905999069485775523244350232840055927387718527383781976121*z**8
+    - 503858714023737292478378652491817900839815584359155816007090563199882844618*z**7
+    - 8693706698627133992089351438538715046492958382994500835470663659701487839101*z**6
+    + 17804702938692831811609541530292473271495900833213560670516908291178861847526*z**5
+    - 2527372759776124853381835027018704748376866713104510231459398528205688795232*z**4
+    - 36056646385076991994057308377482756687119049278479536460653232602668997272576*z**3
+    + 36427250195477126775525261993518967268588090386479256945682026379296593952768*z**2
+    + 19693874449199177329458287989133313674942698399607756489051275336600065540096*z
+    - 35646981444038723453276700615198600918787566089295147828371989302456757518336)*Dz**4
+    + (30224821967004224834194934821280007049877976514560000000*z**29
+    - 5901109966117548354257330459215231450658507324601139200000*z**28
+    + 535203200677618672749463997491385253579507123128107008000000*z**27
+    - 30399966099396624486247838761237379392613315043903815024640000*z**26
+    + 1223263814899621885968670465267649671217116183592143137275904000*z**25
+    - 37270726212242148908655800359044624698824669519514041502348083200*z**24
+    + 895395401408166609151484264099386803815293814541612576920648024064*z**23
+    - 17411916787175302380343721664184012463882904066479007191633564270592*z**22
+    + 278896277552361856256013382543216834141270567557954368306566347472896*z**21
+    - 3722744642552040694595526815897805829216343103981838355405306610720768*z**20
+    + 41722916342240582404163687128569953187193007259396284563427273259770880*z**19
+    - 394319530364831942035491936279004274091299457908086331519634497590407168*z**18
+    + 3147244823046709120421628388947892408752744461609386988668059125738415104*z**17
+    - 21184228290576951240686622470504317362938860743811633817899613925372509152*z**16
+    + 119663124519213139299888528221060873169666462793786017984225577057174245696*z**15
+    - 561622568389283678110097699058646144975325521266356804553544553164609544720*z**14
+    + 2149829750358886018604615750860541716878054168177783050410831087338618491584*z**13
+    - 6472645827900099395412809330222139217521946314558503005613020509690325997142*z**12
+    + 14084161334236732551121567174769764431451167709248712443768279160289192760736*z**11
+    - 16144670937850494938960587077202691171333310065330086561001372223010041025598*z**10
+    - 19844236368840309604307606234552748927025581524427205645082444069450332485060*z**9
+    + 139905262276439860520565299527637786235302952256178625096447281088677347608998*z**8
+    - 305664724340495089829482349991940262643635454220511917205609217832840366825384*z**7
+    + 246686355215248586976054729053211189432464128409980323200657343284065028364342*z**6
+    + 386035413373525912913488609115604504713442578323604241744310621748451761972844*z**5
+    - 1285164481422991799227828755391372583237506016596499248414407335274828745775160*z**4
+    + 1176235021594475927183320730994188194553289437126593901805267242224005239687232*z**3
+    + 464602504460630695434485566784880979716705570824700932187882198422161019925504*z**2
+    - 1732422664002149731740089052235015024906047932259444745996724820304236993134592*z
+    + 1018799466936350330065369220491368555752822907462434310489827137114721733574656)*Dz**3
+    + (592865515704428102230721368742266600963550950195200000000*z**28
+    - 82211241378048684417973119959806520815797451979803852800000*z**27
+    + 5179975555434053567906991125886831580014013839264668712960000*z**26
+    - 192135183351989471429366910585628921020269109483528769241088000*z**25
+    + 4393581913972770168961963614736425785781237244528581274396262400*z**24
+    - 50141894070207819234749041316295218978176454535185555217234001920*z**23
+    - 458332456930094207718665551552577210147535836620441405049040273408*z**22
+    + 35641924555006449233323256727839106532731626043724076346955156488192*z**21
+    - 924231197674941530364013075503950191293209265945503558022379024809984*z**20
+    + 16227694364352743908120396487218361803690905867188662204224865753190400*z**19
+    - 217957958598822761493724075546395754232558970027103390511091410543001600*z**18
+    + 2344645166349642768919708108849223933755161233363220396725108508076502016*z**17
+    - 20646791833141458550464659128406074267857831910385327225756052493998843264*z**16
+    + 150423512009872139539941488538805327997238053141300317571297399882946847968*z**15
+    - 909988448171961901829110436180706420353817412162640103551365780732824332400*z**14
+    + 4560432758235971552868732623606439584318762716413385663570249391020203228360*z**13
+    - 18761241082996839721864939587939528869656325630659800868884048737315305641228*z**12
+    + 62132820462376326089663377443843777844173740145034145596261544144828020063992*z**11
+    - 159082183162767708683253567194385934572640134965124480603536886015847533133044*z**10
+    + 285017227909748174854564770856177257787421121960837136256773512448602430882560*z**9
+    - 231733402185575209732928935690896622456684861258981175902493030673195915725460*z**8
+    - 459799808070341152729237842551646899516714201413242452813307025268357253707976*z**7
+    + 2042902244587225555364223557691887087308191374298133401191948234655720709941924*z**6
+    - 3459800230111987747134243000973531949103394716849556217024187436333329539638968*z**5
+    + 2216103941820751962391130662296066346489298679156189155438584113540517592974560*z**4
+    + 2528542059656637297452752333696488337097626149748002225940248089313078116191200*z**3
+    - 6726613290864118266565038659113535637435235570426850949598771844747946025914624*z**2
+    + 5715671605551754548959171964648020136593272856600196595288530324763702443442176*z
+    - 1774119440203727180383718277323992736720152072272168944386843255167540374863872)*Dz**2
+    + (75700048061143838615245684603555734092854780231680000000*z**27
+    + 171496756517788849102244248223532898546525460824798003200000*z**26
+    - 23189506738412464751955123509331627228552748370298824294400000*z**25
+    + 1531799521267205966727789644049646225596273307837396571652096000*z**24
+    - 66498459852772987847632987316252967699566328923161961503496601600*z**23
+    + 2123117254769551439950376967870429737375058054797563121721378078720*z**22
+    - 52778362719359688450936252352206037000256130475637628420226536701952*z**21
+    + 1056583346055079251405393307410617856680452883202286849473135857172480*z**20
+    - 17413984715047093357067666956545746109562182272963798901247066493730816*z**19
+    + 239916176311824708118585552502087876880550726241010113538134123256754176*z**18
+    - 2792551763598100656065903147428927587235913683510880388357948211808495616*z**17
+    + 27657248064957372824697064283474189535530703011146416615745034878095920640*z**16
+    - 234053104626845349181767622348590830353870345121994861547935625052588324736*z**15
+    + 1695348887243593476769878932983763151738400586505599537489266791727366200768*z**14
+    - 10504405137852478182454084523412080899000242996202411926890403854607498679008*z**13
+    + 55506806429266607026950041232804520541260929790921347584159605007432025585168*z**12
+    - 248705853776944100256848933228108304796969027574414542347492014651265631256160*z**11
+    + 936074118654379542449559953908985854009600364507806049464685607725335423999488*z**10
+    - 2915371828470162229992751264281414351315968330883223127214759593376245010449184*z**9
+    + 7325847258597662043976772656046491325760794686650998664570538500243162502264944*z**8
+    - 14151735108576434290553132828048735368462585137398871282403765417700429452881504*z**7
+    + 18626464573191254974093764374227685657913936873257005161743946341440736186809440*z**6
+    - 8803812753979324834997353522670782677068545204012220420552927443974642167458944*z**5
+    - 26623518419751278249115539279751196551037037944480515886536298140811443280371168*z**4
+    + 77668440992660279229944291346328927383968500435102092175006866953800109316222528*z**3
+    - 105127188400428033776897941406220974900429620063673931411217730512364846556259008*z**2
+    + 78993955477459987717025372409689576860846422119529475463774349522272195152036992*z
+    - 26664319335246028384715398922836832340835838835431151368467008971658170742171648)*Dz
+    - 2928653991511444390968588077149718911983337812787200000000*z**26
+    + 31191660855519886926561266556176650667139650733421363200000*z**25
+    + 23333440889365781736501232666970214322997679030714205470720000*z**24
+    - 2789624326233220958798931813363169784961061502349076932329472000*z**23
+    + 175053094963709762255720491681608690447723182519674700147195904000*z**22
+    - 7231145521323573513480930854513073315539348549736788962178315059200*z**21
+    + 216326992103026799702659727515670232725241698188584094875848827207680*z**20
+    - 4962882027148374211374168953438479371317095093904167852334174111662080*z**19
+    + 90675022192448698844014701803501143399841308789438123827170976289259520*z**18
+    - 1353863240942817569723907447175901582578381442331830755849697992868290560*z**17
+    + 16815459242756174730401973850085789020228657191281164363055029526959257600*z**16
+    - 175855626507136013100171041840913597079762600413490910365513566206610700800*z**15
+    + 1561051042131911672280728144973838013451906935277584258951553195113443405440*z**14
+    - 11821579423581305252908698884407455665033316848448136181690639694847593308160*z**13
+    + 76575173717544710855440040102244131196641050091431518748178774667574993219680*z**12
+    - 424563365625353210026099017375299660685130776453729420427495686476888212161600*z**11
+    + 2012390622586102294254725961518847795485507447769363129849041780415973497139200*z**10
+    - 8128631491247291094855779677620077082261445496668015030741053337635677024315520*z**9
+    + 27828805417729020293172817296853049068823121615168533232368140825843186678162080*z**8
+    - 80085572890186216186238287036652031196701332227847285118262429309468214237135040*z**7
+    + 191414959509727095424937954446134891878185747295484715841720487415246103220081600*z**6
+    - 373448332445086362188481946999716185565915340693505354667847719062792758881792000*z**5
+    + 579828272085091452305977998727064747877942985206319037511020428352527146135015360*z**4
+    - 689336758413079100390714686265212653373082027588831809524627339126312836001200640*z**3
+    + 589254912781899178191259063683684769748151409157504050945974628750956574040421120*z**2
+    - 322222095782617401107314270163466274507822510946133149523197255205611266100630400*z
+    + 84544499988587861233277458064634659416710963970109229791076790401592336911678720)
 
-pichon2_dop = ((746157370383607780268281787734832000000000000000*t**33 +
-     2937050189908953187944625603639845600000000000000*t**32 +
-     469614865672237485915623241731317320000000000000*t**31 -
-     365184827397029140016231993816849080000000000000*t**30 +
-     110944774151836196348314877983386106200000000000*t**29 -
-     11380341540557560556900515965975083160000000000*t**28 +
-     5064439243887202292010728648909404445000000000*t**27 -
-     1257366926607543085231861810404128061600000000*t**26 +
-     266146971712866146293945515884764461375000000*t**25 -
-     30727177685920656488195236985819228112500000*t**24 +
-     5783647712598587658657435695965039010250000*t**23 -
-     733105444202421221958628321148482481025000*t**22 +
-     163417761394888242929209807518319266625000*t**21 -
-     20378463375663565406211173369225860395000*t**20 +
-     1805157036345454035393109299941656496250*t**19 -
-     28734209344143631924881835050371753000*t**18 +
-     42191369445010838383447992684269030250*t**17 -
-     5360344410627430782674972070613881300*t**16 -
-     40258023852298772812352637379009600*t**15 +
-     37111809497228991021946609632678900*t**14 +
-     4334864661210906233297226375950580*t**13 -
-     312878014166242099768112705306800*t**12 -
-     49434309305312895032999402122710*t**11 +
-     1504030910378965552181064104388*t**10 - 397299245405596011331869091600*t**9
-     + 3327976536313852822430288280*t**8 - 240759907263780773101826316*t**7 +
-     1575766589616228276528456*t**6 + 1169405659078502871984*t**5 -
-     340219010078729784*t**4 + 156714342084432*t**3 - 21417073920*t**2 +
-     622080*t)*Dt**3 +
-    (6715416333452470022414536089613488000000000000000*t**32 +
-     29755160852192889930740886867553449600000000000000*t**31 +
-     6703255647071249864685703759989520200000000000000*t**30 -
-     4052139294094246546254720348410180796000000000000*t**29 +
-     1241065582328571821499713534648881961400000000000*t**28 -
-     163196842186158463282585978936836346020000000000*t**27 +
-     63824476638232032420290639211571864149000000000*t**26 -
-     13785898136559538213978911377306571894900000000*t**25 +
-     2847953065059374251896276216239598034575000000*t**24 -
-     396071339990518123924277542870899236287500000*t**23 +
-     42614438601869182599937747947700173230250000*t**22 -
-     2454215657499554993921670489046274323950000*t**21 +
-     1017901086065890148770308441654711898462500*t**20 -
-     181857106281754828556126415249228425610000*t**19 +
-     1143702227463189379619431567289324895000*t**18 +
-     1598346995868752007300352629111634267875*t**17 +
-     74956697413052845193859411733795459875*t**16 -
-     19009744037099873086654117489150359900*t**15 -
-     1769661892221081184316938007496859800*t**14 +
-     242073073096515996873127906411971225*t**13 -
-     21514911402775466364729961255386120*t**12 +
-     456731785408596776374082377536360*t**11 -
-     168728174891880986938758501309120*t**10 +
-     3503716141052046383571037616232*t**9
-     - 1944354950752544812874534896140*t**8 + 8680838712106318390653108576*t**7
-     - 1663621982793785651293745004*t**6 + 6421982376427828690835844*t**5 +
-     7450062275095400595264*t**4 - 1544849327918133432*t**3 +
-     1070363538490536*t**2 - 105353706240*t + 1555200)*Dt**2 +
-    (13430832666904940044829072179226976000000000000000*t**31 +
-     66153739990410402339960286604696577600000000000000*t**30 +
-     21808994341302809802524747159269876080000000000000*t**29 -
-     10494379635032296254230549081675732976000000000000*t**28 +
-     3351440178890540800815777396270518827200000000000*t**27 -
-     493244319490828472051231560598848374120000000000*t**26 +
-     197432320170564988345926862262800727784000000000*t**25 -
-     39199167987105367019442720607675455634800000000*t**24 +
-     8082452230871963946782251015587290001300000000*t**23 -
-     1209791553981598308416867514796298164545000000*t**22 +
-     65575252087816890810286074571350240594750000*t**21 +
-     3788041998837180480754255000770969837825000*t**20 +
-     1531038434507430028335364818140247745987500*t**19 -
-     350844906897995446012789621065444818827500*t**18 +
-     38874250135016862758086141555614157500*t**17 +
-     3319699766911425228191442756799983650250*t**16 -
-     121295286994558504901225276352588301875*t**15 -
-     3892067362357152828849722920376464725*t**14 -
-     4832494322865985902539250227743717200*t**13 +
-     351449832918258832272304814511779400*t**12 -
-     81646266466068623687920541962080495*t**11 +
-     3382953254222440421013414499338030*t**10 +
-     178320447565960421098685130093780*t**9
-     - 7871255523535193680931879265690*t**8 -
-     1311791688836056834661981767230*t**7
-     - 3669863408357320502760733152*t**6 - 2403891527286727339025203200*t**5 +
-     2807257775803823829618600*t**4 + 8891137706804799161184*t**3 -
-     998237574816002208*t**2 + 1491736909495824*t -
-     79629350400)*Dt +
-    (4476944222301646681609690726408992000000000000000*t**30 +
-     24265719425478341606146266491428752000000000000000*t**29 +
-     11220172241193734988647079089678739600000000000000*t**28 -
-     4570045467602020790920717963155178632000000000000*t**27 +
-     1532165007321635948937607298448236738400000000000*t**26 -
-     233870672524729278014397960296819893920000000000*t**25 +
-     100022671036825272943014986160387177324000000000*t**24 -
-     19061654045997315248659934271106385493600000000*t**23 +
-     3961739284577245096348384563441157390500000000*t**22 -
-     597242944044341560732374936441365854530000000*t**21 +
-     14483430034599451505816999462594350961250000*t**20 +
-     4295342296819006913834694896110668041625000*t**19 +
-     477403310573621828149265748306716019562500*t**18 -
-     108216095686050487957016667578535772687500*t**17 +
-     8637394028509341984237208612605013500000*t**16 +
-     42587660570256279655146221279710987500*t**15 -
-     28611804464649770076381911915952725625*t**14 +
-     2934356991343942799367795341136729375*t**13 -
-     1597034015069033996566956048370515000*t**12 +
-     93576657857695983056094413771076750*t**11 -
-     12374427701734959744900622658131875*t**10 +
-     866991661859599207762843955727750*t**9 +
-     210020629670556904170406600704000*t**8 -
-     6136397383839339671781116411250*t**7
-     + 197510661491382703853208257250*t**6 - 3035452408093341561475782000*t**5 -
-     519648757562045120861574000*t**4 - 751682276841743291160000*t**3 +
-     1210231098479921400000*t**2 + 65719530407520000*t + 287329939200000))
+def _build_vandove1_dop():
+    return (
+        (21025869743887779611255086936606133610945*z**43 +
+         537071342355488337816397142254361959288755*z**42 -
+         94401467240274372586076586195903929964173949*z**41 -
+         3224026827981455148890307303593051960810778015*z**40 -
+         11691304539722989814310925516216358667305799744*z**39 +
+         176712075730836781804313194025383464696105558384*z**38 +
+         1821002740941250093090302525284898819555149207424*z**37 +
+         10407911280182716336365536203001516962942564037376*z**36 +
+         26690320466149995337814149143053234882096214676992*z**35 -
+         68320752156843982521322520127614610377937747949056*z**34 -
+         944323010799794787028509149093433163529691164895744*z**33 -
+         5441727726044684355381015927248094386448235566276096*z**32 -
+         20386380090665086868040859504835081870091073365106688*z**31 -
+         23407835145170254773619140245202246280323965020798976*z**30 +
+         223173051007785228762624303121180467505914986245455872*z**29 +
+         1462571140259884023792038867557269190948837641278947328*z**28 +
+         4168423685960502083689949691925251445075084755474513920*z**27 +
+         3968321855003093933568592622845735884615770257592090624*z**26 -
+         17323994045541822891629175075176750258532900800861110272*z**25 -
+         94925012601298405268869792661445083668208997645646757888*z**24 -
+         254432196150950327738101051646698180085259663023225700352*z**23 -
+         435940823606980115287123264471499578228110421790368464896*z**22 -
+         395642115569327912611965107442762058569308478462287151104*z**21 +
+         315497868018455217265802071140082462199866931850936057856*z**20 +
+         2174767531431120152402829788918339652710662636993425440768*z**19 +
+         5313931687336594901446132457923278366853464261420721897472*z**18 +
+         9184467309406367683866603210718780822438321794408899411968*z**17 +
+         12610420309663096352820801592508668838611005311423929647104*z**16 +
+         14342818081171459775929564537319680156690126406259098779648*z**15 +
+         13776958450187689516874924574965940943614245931902958567424*z**14 +
+         11284671810744912757996455702504896487552745239063388225536*z**13 +
+         7918014611745316282500373725305169734003392225878673981440*z**12 +
+         4765125025152640437929730034231551217409285414271265538048*z**11 +
+         2456356688736864964589897924368377051665252698894375059456*z**10 +
+         1080640092662729938091000383640830766008789679665896751104*z**9 +
+         403262213337709823047431129463223299745359594847329058816*z**8 +
+         126501540558459078109691254518436879646594696234494066688*z**7 +
+         32935877868428475043946897056128856953213313519133392896*z**6 +
+         6990591120945975588450916863969134414393457054561861632*z**5 +
+         1178799569106878150268380705391773645204477995143659520*z**4 +
+         151937898265876848124698628881154460971766435272458240*z**3 +
+         14061401646232139953907871226766048088665048242716672*z**2 +
+         832087977741892966427740011175705408161821195501568*z +
+         23652794104299968303456916474329042883412758626304)*Dz**4 +
+        (462569134365531151447611912605334939440790*z**42 +
+         17640749385331874961360477120354618066918960*z**41 -
+         1705547856828046875685188942884729532265033146*z**40 -
+         64185556945772639691321876254638083970582767324*z**39 -
+         209722379316259645789574877209607143229772173144*z**38 +
+         3165666438013833005898657929596823735443682142288*z**37 +
+         36126282806845693865574234767028305884869839523936*z**36 +
+         249703890522908424375576604067480759516189432250048*z**35 +
+         921640403295813361487925035189721753238706727426432*z**34 +
+         818434826823235626436001923043220906210275274246912*z**33 -
+         11929131561929825841391560535391677891824891115531776*z**32 -
+         112929594066474340245164363435155997633559530159938560*z**31 -
+         573930674568018328739485472863950205853514847706142720*z**30 -
+         1409737839954786838102365937330977420642492572526964736*z**29 +
+         1324341234947137572566670787502137886804558062134206464*z**28 +
+         23739300519735793461089004202213933095010430762148839424*z**27 +
+         91312363493791790840964287999792214595699645402300317696*z**26 +
+         180538341797299628299789897474728109245701251904028868608*z**25 +
+         68964076213544314943972901555096119118809785950035509248*z**24 -
+         828854310696116047257584059918266943640935615467785551872*z**23 -
+         3366474590580194069680055408741099364656648226597822791680*z**22 -
+         7970619249959040363045100396828262128325551352178483920896*z**21 -
+         13395804480044731286128923952997554239249848958195666518016*z**20 -
+         15880209097602275723512531454994226647256894378705762123776*z**19 -
+         10248370917380863548716197189256605969560445806732457803776*z**18 +
+         6574896522135995392019081449765310498614164290991646834688*z**17 +
+         31861775084392816242833372093286031829871916181329113251840*z**16 +
+         56918901413470053580048988185617474558883576276738176450560*z**15 +
+         71778681792206102271096395667108074434085836467375091744768*z**14 +
+         71396759703401558396901217388106528481033097971996502786048*z**13 +
+         58258223770064646536900059815256482015352489681113797623808*z**12 +
+         39667206882605060328589832245080628759974280726258166792192*z**11 +
+         22698956755743910000726754771184814630339120024166938443776*z**10 +
+         10931734925185753673284479910120505891295511329907236929536*z**9 +
+         4418184337822220252199877289953586153900101937179085766656*z**8 +
+         1488425531158810654876469026048768904013276383118413004800*z**7 +
+         413332775654828180778330118770484672091001540172713033728*z**6 +
+         93043890772386727998848523756754854628399185266930089984*z**5 +
+         16561544928692877553545399212205710139796766044037578752*z**4 +
+         2244258639985142804427106310045105247599428512736346112*z**3 +
+         217618301549713332359151838717734506153578915386359808*z**2 +
+         13453059455682673243921998051140008405729786151829504*z +
+         398494468369771856960811022833171815648747958829056)*Dz**3 +
+        (3153880461583166941688263040490920041641750*z**41 +
+        162130131634815947820900747830538283877290050*z**40 -
+        8977008887459628788767870292294413411588255590*z**39 -
+        390033592086369962200127359713958985964795968490*z**38 -
+        1090875902121032033559154536975862801258596691344*z**37 +
+        16641957643532784149091436351880597254098403899720*z**36 +
+        219865832189560637664470729106762413742117542522784*z**35 +
+        1792036562172598185218900481082000410282551439729312*z**34 +
+        8044147670800618630877997351547195830370319552755200*z**33 +
+        19087936065088611467782990771314970658533557336157056*z**32 -
+        24027122492178438456746753205942654592726558013253120*z**31 -
+        680134878203694019211665906396364458134864451512580608*z**30 -
+        4388028264643083060391086732486567231300922762534490112*z**29 -
+        14151735523227899102572961767662748674118702962373416960*z**28 -
+        12399330243712553330745278742490545710307025467137597440*z**27 +
+        97945826664100185370947266867979619385441561834258391040*z**26 +
+        535577312261685634169399781933146044736715021130138386432*z**25 +
+        1456945221332324532189170579964633650660271041836106153984*z**24 +
+        2276310191231776688685600575105751989351651552112781557760*z**23 +
+        571203285580459634136770110039474934466508461957075173376*z**22 -
+        8430661977911598284445290711721730202194309737561456640000*z**21 -
+        29932503389781944486274216908484408086139943186180714004480*z**20 -
+        64340899882980402707525147639501460754545599940223939117056*z**19 -
+        101800270742404623951585737896892621924056898656386930442240*z**18 -
+        123249015646287203935014289528458707795411212452006018940928*z**17 -
+        111536421879884780876937747554684402443436255624657947852800*z**16 -
+        65594069269667774229209113239049447203378723862928619995136*z**15 -
+        4191796946739472951528183498763528042522250697456887005184*z**14 +
+        46078729711122076681952818507309562666748918752087994531840*z**13 +
+        68400894701258397403788148889742970769884094315353698467840*z**12 +
+        63751449441242786723054790277243130983171465977898844815360*z**11 +
+        44964289904164156911222594363328304983984165992916366393344*z**10 +
+        25300459101048281151133049130183515195378006239861756919808*z**9 +
+        11570136180590635356479703882835752571171013140261204131840*z**8 +
+        4317727700381206800171663902848339974898484664285750362112*z**7 +
+        1308345116142687220093377447235929234956747121928217559040*z**6 +
+        317785415437401559368456248323815163330305058209183825920*z**5 +
+        60507180697821736538871092627551366613049363077674303488*z**4 +
+        8710608655302343741408875523252107763519092731727052800*z**3 +
+        892305492200345525694664072852844352104283870936956928*z**2 +
+        58007047913679124075075211948800832553167384173608960*z +
+        1799929014614743756791063221193967369073416149663744)*Dz**2 +
+        (7569313107799600660051831297178208099940200*z**40 +
+        496390334289249487037447983705122927461785200*z**39 -
+        14789990408814100049978386386474780326991495660*z**38 -
+        816613609191987300726202222901063093214600609360*z**37 -
+        1774660173877508982423491123725447696048220827152*z**36 +
+        27418527839909325165280568000968724301601596597120*z**35 +
+        458545830288976181957658556382988965641716957179712*z**34 +
+        4358580369014308481169943186831708085252781208635648*z**33 +
+        22202525964940205564830615693474568098539271098394368*z**32 +
+        71701642188111226116467479361030655444411826158756864*z**31 +
+        59850639800799310764228527610989402249686043989926912*z**30 -
+        1421584917293721457363023176640128463765352140620623872*z**29 -
+        11410387592989449948709855632025095118033710170559049728*z**28 -
+        43781489211798022495673770135126667879735759542552117248*z**27 -
+        80857180041108239811053787371096729275243000171081220096*z**26 +
+        60184651453648120112088527485756272896990025124247830528*z**25 +
+        913608156062934619358979950140102819739949843976060207104*z**24 +
+        3286527181878233302568194757836496076052467086981141364736*z**23 +
+        7334932157974462731916332653741068532609793486853361893376*z**22 +
+        10513586254605655483726588714582383388781775874064583229440*z**21 +
+        5621234440240557965350252398333063278011643657269316419584*z**20 -
+        17768348106044135944926978173416116573745553417197307559936*z**19 -
+        65867474236648370881982870209515388383157650737400029118464*z**18 -
+        130798610963433968459731847886529414161323631445524824981504*z**17 -
+        188618723107954926430492879302418356386776704741835907530752*z**16 -
+        212003114828151230207973026370847753355018967800070941966336*z**15 -
+        189548892645884334492038318439391370113267988966516052721664*z**14 -
+        134150841466931334063815769602440521150682795382194114134016*z**13 -
+        72520527110978195469528061424102279519226313729309163913216*z**12 -
+        26507165396150975710367247262223802832315925403770491502592*z**11 -
+        2690774324502642520943446603835354908731345803988827111424*z**10 +
+        4583780380332041638448481566269415667192424427277210615808*z**9 +
+        4211267604338932851552846402540883508280043603448354045952*z**8 +
+        2213678948630537860401436176907077313515150305170829606912*z**7 +
+        836537615776136322818266892891908025203676863386773094400*z**6 +
+        238587684316523535240047103521536692127045858358709977088*z**5 +
+        51489640650213487931748383378599819024141276047420162048*z**4 +
+        8210499442352846460301440485304853976965670346405445632*z**3 +
+        916800362030570007190579327882855090252192580445929472*z**2 +
+        64206307220320701466979026282646180442538676362149888*z +
+        2127225595878252930296285917577647942701526472982528)*Dz +
+        5046208738533067106701220864785472066626800*z**39 +
+        408708703121893783329260633158616154529060800*z**38 -
+        4994207780110793094844481194449737190714787020*z**37 -
+        459877700430033845356263833091387791715737111580*z**36 -
+        604529200324465871116020281987016720752366940288*z**35 +
+        8974484811932508451377639701168036364174109793760*z**34 +
+        250810620816377399866622386425817833560481908820864*z**33 +
+        2814868204072151970093177264452202154819820599049472*z**32 +
+        15770043143289585772158334543338519444546806394640896*z**31 +
+        60081240357934004365867683962763158656797735746617344*z**30 +
+        98593879223928989870558031769123800683021704018790400*z**29 -
+        860076429337875697975052148943984934090884950362548224*z**28 -
+        8301647506738393447611198203556485359861386010565763072*z**27 -
+        36098438372934160729928526180311986523715870853230084096*z**26 -
+        90314534308026344186480736164127593266750019083925716992*z**25 -
+        92193706118146942159383587903232205566002181236972912640*z**24 +
+        272072262696245853071582127397809365088206375221304885248*z**23 +
+        1655791485481320194379453278530547553644827429811002015744*z**22 +
+        4788453977665300377595416635379870469581046364766311022592*z**21 +
+        9511908671274789076417074847665955212094916860091639791616*z**20 +
+        13440180812533805502041043475784805791082043392646667304960*z**19 +
+        11781678833684844489735496945559408053234698268223511461888*z**18 -
+        11322704809810447708835223709954885461090245619876888576*z**17 -
+        21700362351484636191663978885983147403302413677401586270208*z**16 -
+        46084242088155968538939343303496177004935716845924261036032*z**15 -
+        62613466204752310437978872139479265831452296494962693898240*z**14 -
+        64530636528283573270092423828761623247694796032328123547648*z**13 -
+        53146880049758256183959420637451158464327870773800042758144*z**12 -
+        35714312020856573197889450649715253834398390483738439974912*z**11 -
+        19732260439286687782645701021723525617709420162606887337984*z**10 -
+        8962337617788906622984354084261481075290207915068054568960*z**9 -
+        3324856757942578961389531136482856859468139963298258878464*z**8 -
+        994127863830460643550708545827871629755829599952156229632*z**7 -
+        234141564927980478090088132176262873946240446081758396416*z**6 -
+        41755830026207951542547564204253333388144994933631090688*z**5 -
+        5222684548237372887812766167942049939008357336906465280*z**4 -
+        374127800039813393794579538517870520896676853515812864*z**3 -
+        715679698626450227151163048501275661570953153871872*z**2 +
+        2348203067116583373055774642175689752692461796327424*z +
+        146091866025238619101386610380037914092502226305024)
 
-pichon3_dop = (
-    (- 369768354845847942096160222348407025779969976884345215420614382641410412316102492160*t**66
-     - 1194425701390398654775163698064074141928556415215471042015715518906053552862801690624*t**65
-     - 2237812216099771728721378672571168763459359209952428249042997292285635221759420268544*t**64
-     - 3053206657475693757172536627525916655359978313191845702106940577202951476459637309440*t**63
-     - 3382819092067510822518755025876273219629181184812319449409792767583195608345956450304*t**62
-     - 3248464104200736811985507190402096222843616560246782239629093878773966583641286180864*t**61
-     - 2892704675628419233899165483477375041802856764051139228799378016140112044605748674560*t**60
-     - 2476861300049294368259251457949707309756665521660626103090725329760378974976904855552*t**59
-     - 2055641292224998611775727091848444998971967505449385720683480345769607349069144211456*t**58
-     - 1621890525353242697716201044369784535909234418024033275710603549548209198174727942144*t**57
-     - 1180864011118263734585946103073546387860392996635002350726489957584937341778235770880*t**56
-     - 776902534820768235403619870936330292002373843426284102414728735612342640379511429120*t**55
-     - 454794659128206634019583477502681830830636083885047168418966415970751087904126073856*t**54
-     - 234064834591378307616008122254981843743712498676068342160927379305175659623177918464*t**53
-     - 104328405020419814559328305416196229154698458881934059808004255391660966723409427200*t**52
-     - 39023339829132177873652749720209353602628992346805110210396958461728509019885557248*t**51
-     - 11273375752763496722325348016480321714704960357625576631388170688616727978156857824*t**50
-     - 1719377712772277526551594570697984257636935973298224789900892041134220097307747432*t**49
-     + 592900882057478450620844990832865414592678420345863929022104967889664696220783124*t**48
-     + 682147909728114031767235435246657385404085683855178213709638778125159578608671444*t**47
-     + 378532299505771935441111753566308766170968572045253421314925658332371950469802510*t**46
-     + 156508396491466141399616406460449977116869029596904791120346557346975917289575513*t**45
-     + 51406897536633885149684648751434448439587706859166220331205621976536324475199375*t**44
-     + 12918430729714219105266683820428072227475712211728611538012319066631597474456681*t**43
-     + 1912078282744560327756627966501389581206634138932619899559379642589760082180888*t**42
-     - 263333946788867901752926234237964697026140992885426859042903742075427563167127*t**41
-     - 336070701308436922742269441840746210706503580982031229792364595777163566200342*t**40
-     - 156063816319519403560163732076535193147936175566363627560382224425491102233834*t**39
-     - 51523716006319723670936697798354487841951888134700225909110078200878104193955*t**38
-     - 12886931238531102078089222807048690497483173051985760206177414707253806048325*t**37
-     - 2192104733897075271167750433788819295620647343256035578967648046701123559704*t**36
-     - 56740473747853140692978595175968391696261771439518955321288764382880010032*t**35
-     + 135945883965112499407138954979285052839413429329192512610316745856004945972*t**34
-     + 66652549523463771910120799065671988050943333735294334169014852855943660198*t**33
-     + 20765679824851193180637478015365274664525558941472492019970167604941365182*t**32
-     + 4819207323894301789264211010164067008873863450761250860521763628967656106*t**31
-     + 793001103474612328334411580754178385202924277879538158896160325460728912*t**30
-     + 50695263148288646267687558349982688301225677569569516434419641189997406*t**29
-     - 22868466095100444586519975105548519303042816403195880370700439020652436*t**28
-     - 11791646839248312546244175344669711991179739974294272947962936168629272*t**27
-     - 3427812800750555890196759498953265794977585202872371303502358832251102*t**26
-     - 753036244851989994509830310226454280094770940044943658388708342745106*t**25
-     - 125791196174617345116936237115566950801134644591832951563570451708172*t**24
-     - 14409812464003979833923442146023422808320226933435219869668762837848*t**23
-     - 34030937267623179419453403898045740874018471001671658694679681522*t**22
-     + 509420509731891845757927905803929972300475728415255762912880650409*t**21
-     + 179619020831902634890524687575028476339224193112339069296130952995*t**20
-     + 42244562679357761540862416873198052927322033636453531711517544125*t**19
-     + 8370618610651423165352913799720908665974592410964827899219487944*t**18
-     + 1411293566185114777862545715172918816393455767849913515238965201*t**17
-     + 216721315865340018497718745550917289518282103174418178144004762*t**16
-     + 29328922291182147428899969541208906975044155350849596619669450*t**15
-     + 3694701087474884340687467675796378521154882375551372282331313*t**14
-     + 410979967222688690935418698735234222924456447335000979251119*t**13
-     + 42959508971252203860576182059717246468207742632561622184160*t**12
-     + 3902157729468485876196917864681038524241191655332029528300*t**11
-     + 334496236786123222047193613259121400818312536092889958400*t**10
-     + 23998027540156348985955854381522120246952774141553664000*t**9
-     + 1617855414155599359169622438006300739878820076978176000*t**8
-     + 84373482152770962948701784318653904925641367879680000*t**7
-     + 3957755050323579727877374951115663907134835261440000*t**6
-     + 116226287458370788144177452933082655366735462400000*t**5
-     + 1671616841564766644643154984087423948318310400000*t**4
-     - 46771814431588362057862541068856442067353600000*t**3)*Dt**4
-    + (
-     - 4437220258150175305153922668180884309359639722612142585047372591696924947793229905920*t**65
-     - 13603136689829916466666846516791479005478742860950772957709222000947407714174395482112*t**64
-     - 23336040345362998270306760461714372271845369552746858609799473868752719280417266466816*t**63
-     - 28770343969699235315429157379927299899220524783361023284133140408341793815317403402240*t**62
-     - 29295936763732059225004343168283905191711001945906692987806796145914851902639805825024*t**61
-     - 26890503621599869321898740335323531769357645875459014014359950872697558071636184465408*t**60
-     - 24605638000016118270456806206963332068712459382893129379008068652727108525371843870720*t**59
-     - 22764733279245348799667857920147845633266832460129950647617484982939710602858230611968*t**58
-     - 20388664916630435117593206300866636003804606174006563255604198740305995430634543022080*t**57
-     - 16762837811846273146400347761140670923951015875256845794166275797104118483056922210304*t**56
-     - 12195616033173022165083964425229185897152701246991311008910215096006025039908950609920*t**55
-     - 7731711061783851626356940628603257441754921300211213269686282146696959367031780925440*t**54
-     - 4224399258809068466104567835897781329007925586139924365058281727155374443170733809664*t**53
-     - 1959206947301989270577338194950423187325014632629469451856014704568991229373233653760*t**52
-     - 745641749046200609971117675758209065487784276996168035420413873038586635575294288640*t**51
-     - 210027290800506469824380946685285798478295199334043874949677169607787628836315760256*t**50
-     - 24011986401901664235188252125215273355393428328265452946126245335160915468233284352*t**49
-     + 18448618411408104139960464440440772359952344530947204085664216008633280104950497432*t**48
-     + 17124406228334806024715833365136569471465175484887728683895542429060292818876085600*t**47
-     + 9109402299926395185317165155639572194211993996075537996589647841126035188094645644*t**46
-     + 3716072872589488992298697078997499386166932640031822679439720600184536065305855120*t**45
-     + 1227933001300999284387681419759979659563348880081327960470961479064559664612226079*t**44
-     + 324226530387115459772673684281618886423457532854145993885887236123021724356358550*t**43
-     + 61328483780959862856588303994119668670847957156126772436013571843384761358413795*t**42
-     + 3672955358368521282141442313365836475347429161851206671402467620629707110824193*t**41
-     - 3145532026172473951409635326552275719286317594954132756481788903735714464733484*t**40
-     - 1785197574689323870922236785752964755275077435986007092714259961110860850506581*t**39
-     - 599712256919799649317685961429824699032478038530476323470593162536143684741961*t**38
-     - 149188971682396127251184213429532474323185206814660505206769162143396674980460*t**37
-     - 28137379562110490608315691947944810330212222119061554703791417720229391724280*t**36
-     - 3887288267103525475570720810545187836013845754073786460658359653320416207843*t**35
-     - 448615253087548981291687602898893044714772762649135748922450096771846255291*t**34
-     - 126197387036773175378973748658649822017860632923626576422525483130701373702*t**33
-     - 68232659902788698689101721884022588994331813815682554632514423661359313975*t**32
-     - 26975485636234120363822697204056909347455207386351651262190182324286470483*t**31
-     - 7034502527510501734740736879235192558628328078099131005086152530238656108*t**30
-     - 877641022632570110276109374131607786036124919856492431674275495162204799*t**29
-     + 212289332056828278305351630785484518601532616670447985685629238459884479*t**28
-     + 178133789457312115825023651183034208299814628780316692678310143299933400*t**27
-     + 68513587426509391600992310340773265105053787956978526233597759335956403*t**26
-     + 18980338314385913027436578020143472812130950816064269843709287602882471*t**25
-     + 4119640471476035618206498794297924441533180610855730407947920341884902*t**24
-     + 657991561711277325112937192020865997361010110693689295721168076566007*t**23
-     + 58152108660627849962386341520332005943099010594514589773918938121995*t**22
-     - 9367532525796808000226381997753385315107363267588137613743600801042*t**21
-     - 5951673682850341272393552897186223123248508556146164146916605955132*t**20
-     - 1870021573335937942265775362482991019860557557057405440194492279695*t**19
-     - 437449788695102142098016781572619343024494239837663145522909778015*t**18
-     - 88846568082606869639573440921800219978548492899746040892870075310*t**17
-     - 15514073515720167019956079870108601287136789720040255069836770199*t**16
-     - 2482728472088112418333463217851477954321378917953635409917182571*t**15
-     - 350446010920555060344037506611695609837730540345760712633399710*t**14
-     - 46133877865993450388169147799247511644637456143098295243087783*t**13
-     - 5353429972590576172902735819527228672601338074438274331941390*t**12
-     - 584274491609073714658539273007056501077937008471603227825440*t**11
-     - 55229177907065627597974001551268208497040716365083471772000*t**10
-     - 4933040999393223464240257718073911519671721406131402796800*t**9
-     - 366681229583812268841858458035075261112522017359998208000*t**8
-     - 25696055020239668082619213802912460936648994882437120000*t**7
-     - 1378537822199995288610304276377497864997160499937280000*t**6
-     - 66952748561627250421254836260679800626790237470720000*t**5
-     - 2000889649486692213803719420633429414780285747200000*t**4
-     - 27662756300685406111193055015812142121510502400000*t**3
-     + 701577216473825430867938116032846631010304000000*t**2)*Dt**3
-    + (
-     -13311660774450525915461768004542652928078919167836427755142117775090774843379689717760*t**64
-     - 38619494888925147228095185970442204923444426217947680233689573325066518381985512030208*t**63
-     - 60738043349941102526726490781474236897930330804352021497505374562788989104394021634048*t**62
-     - 67964392701072296873915757225400637684694148572402160063141772096208445953064181956608*t**61
-     - 65952759371737409256054212381235723527925538055123983997312804111313103478058827120640*t**60
-     - 62651916006424728515744889440353296566437992227660544128535138931500880331370332422144*t**59
-     - 64214506719316835507062946391513424102075253014614435001118090854485771274938174406656*t**58
-     - 65667554263809750176563156490721191796391513281375728068891024541231860708063481167872*t**57
-     - 60864490782776641257921901103370857968103080908767895571092546787865960957291529011200*t**56
-     - 48794919950100399473580062350435835531052235626303093095995034543994765685440417275904*t**55
-     - 33121245393951169051355319176690238157374893922728464493753354742582785049695904006144*t**54
-     - 18876528220494846499512453470545937245953164336350871619110184082494598655499210530816*t**53
-     - 8863652227416076055465649632886981573085877089862500031506877113196959662207533641728*t**52
-     - 3239659287970034816213223143052016281827891481786471860526463778782019461416864227328*t**51
-     - 731221326882706340980594690500516502638132020437397530837631818752955828604408583168*t**50
-     + 96913601056074686974545137902579679911912367783337272194804672073358829964477452800*t**49
-     + 229730022760093735937301604955503108174744556637432442690811340231333876813567650304*t**48
-     + 164086739209565064572643720800715518878005269312975683508987239538815660952990642800*t**47
-     + 85535184908991390956201804643069762370521104026409099737746206738421724952565958656*t**46
-     + 36763962758244391089982316669261271656671192756935610394270472247404851716415601072*t**45
-     + 13482498693642609597450063421257595054466158799562724591782437849073278066444019812*t**44
-     + 4216301197366129469494099185297945622599524159564852053291669194029700376216559940*t**43
-     + 1081683581708188014261826220132303195965267591268619898820795446579035392345376876*t**42
-     + 194876085553394655398449018730666138002499340378782161156588400205338826996972514*t**41
-     + 2066170014956714880412668737533140400917132930455192515901929319772810819378324*t**40
-     - 18428043805465766712198157285167869249825274610307044293824874626745173245332708*t**39
-     - 10621687189467130298067087527776612123653515594750383597904592826978599864101746*t**38
-     - 4166873383450683326837581588869301779968647635126870622353476044036039269714060*t**37
-     - 1304480293765802947074024678304451336464818188356246232041998141794682126557256*t**36
-     - 330654897580009487963984093334903148606302231538414172801479753213093398279782*t**35
-     - 62561357105274117592403070642656706708156628958915909495888020413841048494852*t**34
-     - 5083744423685799013093709799848426551513422650081376113015893396670197441770*t**33
-     + 2319072699132560185000830755946960507104758866640847563417739980731269550074*t**32
-     + 1509145549631956207825539567444063659747841887945015170057563803988374180508*t**31
-     + 547806835926372403610949621207624893410144930548905583162262927316066348286*t**30
-     + 150356434416366562997573124907458305561813535402139892794382862708853221754*t**29
-     + 31865259131462480592266010625330751359653805150735987038659644105128914436*t**28
-     + 4668737998996904321824689817073414119207993085878040137494385582435244370*t**27
-     + 106675960005874575030480721398857729239377409579250318107849180829294634*t**26
-     - 217186370392098244455660134737148084632560286629636233862569962017197364*t**25
-     - 94173210271224504566618542809757279926652571267082168287323975482174078*t**24
-     - 26432754085996140367528731021024914854084254659810456809182073914763562*t**23
-     - 5702131803503873853514109900504160087767767349937323984519271900642348*t**22
-     - 964850396476907530201363829556787095906836685730253547099842493744126*t**21
-     - 108597017295959062522981910461415671487080414032464256241071983224646*t**20
-     - 707138018387031804872080198999867537650551943950981817466338574944*t**19
-     + 4111168717733819811381946523200855972278930423398764864586847225342*t**18
-     + 1406706515615016887308591745365852407240049542394706470145799385612*t**17
-     + 343980255819887868945534460990394715968395127660341613658309651336*t**16
-     + 67010045191968971504517619565923906515767297752284026481640125834*t**15
-     + 11629417304909894379572402667339572701842197537110313498537549920*t**14
-     + 1742028000862544572749838900861580473456889417366499797421819456*t**13
-     + 241216998397301379414548555423200933431862154708481635360744814*t**12
-     + 29136759713911093488718438773149176324863088910656904327275720*t**11
-     + 3298999676517724999977797985692655123894044687456471844549840*t**10
-     + 321282090567084708770063842359098355188527462683523109310000*t**9
-     + 29548233438451576299376226528937577149919769118260783756800*t**8
-     + 2246932671895571818199991210767886232120131227381875200000*t**7
-     + 161423396253555751671423678710607479480631468827443200000*t**6
-     + 8798232021893213374027412558410914259563454774640640000*t**5
-     + 437392069766494836355979387215064357519719158251520000*t**4
-     + 13121430656472734659679608647068093245886457446400000*t**3
-     + 176330552512968062433341251112875984316006400000000*t**2
-     - 4209463298842952585207628696197079786061824000000*t)*Dt**2
-    + (
-     -8874440516300350610307845336361768618719279445224285170094745183393849895586459811840*t**63
-     - 24286386472240363370793221593673315220301749235362027729500987098193875747631891742720*t**62
-     - 35167337814098736920925506934370290487813065331081169313245840927916907848510530912256*t**61
-     - 36175812934369890917174237734873082341460530938674735026983697072883078367318408953856*t**60
-     - 35473524165347443293542321952318000522601662367109994766101936526622595619838964006912*t**59
-     - 37346818305097511807380229979406222561147681038314056593398221313950302825619195166720*t**58
-     - 42693740009983192829555160552509157977891132971704092596544135378315239011068899885056*t**57
-     - 45080601483231681159866683246062238972320024212211855541352240433116176439855522906112*t**56
-     - 40276873906566706364796959829136899193710051809468889018846900428471784811098269155328*t**55
-     - 29882924546196711378487080000314036242211172624938521654311992862301414357142459867136*t**54
-     - 18191618706270145075575892805004518236911380974575386607230381177794611366384203341824*t**53
-     - 8966985220214787671101985270091689876010409488880415097746245828888323608589048365056*t**52
-     - 3405494619900323925931110561971801349553421880445799416352936739506718053665039540224*t**51
-     - 804747594365899845026269055082438488512057023265165206070945352495744039675036325888*t**50
-     + 83268126152532669709950172420132797603585891516472970531346405639484045318115704320*t**49
-     + 234337131489316223667205993891132495954686782633711451280646844726826515966198457344*t**48
-     + 168392565434651997395149033044418858670792872828729088304377470320031928913395941632*t**47
-     + 86118516214042148641518761998609730574978538404039268205390137407602138441398388816*t**46
-     + 34951993140674293322366863663486364057914957740631828219610927938929524959499639904*t**45
-     + 11246062414224363876395112385261173542178042526680671249870548490814694099146599472*t**44
-     + 2570590082574616222434853218590589803897025008214730646000240536888398763702778392*t**43
-     + 147027602710150550125163374163333534901200351536854761270802513063820926345407532*t**42
-     - 241540126235580012706241970739100774434070602266475856550012122344116708154717272*t**41
-     - 167037388590988168993181889781840531338346576092109363939634473529142970888432558*t**40
-     - 70967394597715090405918240656275682747392642874590436167780476457072664420703992*t**39
-     - 22147461546695635636735569894536928466386956319617855562537457374493420195880088*t**38
-     - 4718715530981908186434127090129982229393309421795390883739018912615274785120302*t**37
-     - 231063437634844383707256614532171427730370685985704824414585616793917693283016*t**36
-     + 373810743065678612352335445586349132831329375361322352850751137608433843923896*t**35
-     + 227914107860088090983696688510059459567339016049174728757394722086437874888110*t**34
-     + 84996951200505712823244609150877550260066901531455431289135337883931948432680*t**33
-     + 23025959851619380675736882315837302142029634270481602916149302784786820327354*t**32
-     + 4145744934628857356245056447768449848809197823295982464251647803446090571690*t**31
-     + 105060706295942880095670712601918807331092282377475449952247703580710176576*t**30
-     - 282934127033286564775682537017808158818710105419397036301390020647166700654*t**29
-     - 141693214524298597179793530857153782232463569126788484375723365783290372550*t**28
-     - 44427809096024793367506832553334009556325233929492451935680686388810259120*t**27
-     - 10146105464499334659225911462378408039406128795206810195194940276341006570*t**26
-     - 1519297000627126324173173347547861041447188982523258595939718296031933206*t**25
-     - 20804858574382854374986627710671646344327428124882744436705201752546496*t**24
-     + 80039306735270307921316024262487073452731896411076292217731889063154742*t**23
-     + 33421441104291890028332348169421957646719278494722619332208212819645310*t**22
-     + 8979728147087954427678931656106854663354619948398383040232027915516824*t**21
-     + 1826468690203584370296067453917413110147553021038473088637393790327102*t**20
-     + 267849389519060032152966023828027614405850930001557900945067840394550*t**19
-     + 20268465970524699096325576025588381723931371796837615216826005492612*t**18
-     - 3984533436450269626831398033129064399399418005212955313505962580450*t**17
-     - 2096106615023773404123490270343190339880146958764398228370617656516*t**16
-     - 592965743158312278686285362592575501243178287273916967000417253320*t**15
-     - 124905572979200928979886646643461808581555001175601877974704692758*t**14
-     - 22960021093439324034120496010904325048096293579052106463684126532*t**13
-     - 3584677611051328797871989586584588662618599132839273359420268936*t**12
-     - 514369633395871503711675137858539889448757189045464791479103190*t**11
-     - 63877025832403081016667724182560260654899325847108312780250100*t**10
-     - 7420210598494822844225709128083701483980683662162819391885200*t**9
-     - 737445277683050578413510273851773885598264270243427362923200*t**8
-     - 69198794569067413914266829688158087954957947314074279232000*t**7
-     - 5342307109897280118858156969543359800162679831079360000000*t**6
-     - 390302880490206274872628372043170084580976201800908800000*t**5
-     - 21487168828144092528793514335963093358767486021140480000*t**4
-     - 1085442892292637156419355023269332494613456774758400000*t**3
-     - 32562937540132076310974301998656837255830700032000000*t**2
-     - 428694647045018188621434454293382516048920576000000*t
-     + 9822081030633556032151133624459852834144256000000)*Dt)
 
-DiffOps_z, z, Dz = DifferentialOperators(QQ, 'z')
-chyzak1_dop = (
-    (213389150665220554752000*z**12 - 10296026519596891766784000*z**11 +
-     200057885757776176865280000*z**10 - 1940574581694161851576320000*z**9 +
-     8994973242873027938935680000*z**8 - 10013228426390161817373984000*z**7 -
-     51543188099268387678749502000*z**6 + 54238320642946709844109080000*z**5 +
-     263915013549573215569467000000*z**4 + 308408735241758795421960000000*z**3 +
-     172220211080001126888300000000*z**2 + 48009834126799014178800000000*z +
-     5389705040141512818000000000)*Dz**6 +
-    (3201133633798676683161600*z**11 - 190531011046581094256640000*z**10 +
-     4469054045609470781528064000*z**9 - 52161414033763915600906368000*z**8 +
-     301863545726534821660955688000*z**7 - 611107937995277406352823536200*z**6 -
-     1151622739633762942567519065750*z**5 + 3174559640700237012877279762500*z**4
-     + 7537063031976946306202432250000*z**3 +
-     5976551521879011124233682500000*z**2 + 2124832092752015320038592500000*z +
-     288257663760671095961925000000)*Dz**5 +
-    (-197493353102517071719956480*z**10 + 7675446041099220359162880000*z**9 -
-     121043173861957361636282572800*z**8 + 989813839013583208406938195200*z**7 -
-     4341641379034242564542878108800*z**6 + 8108165175475712904368544945310*z**5
-     + 8086265826295046627593092498125*z**4 -
-     38628205152161046126572407085000*z**3
-     - 59452687393668436047876748325000*z**2 -
-     30272726890752142713437794000000*z
-     - 5289486623712670795599842750000)*Dz**4 +
-    (-2576572854278463486119116800*z**9 + 137171086334090826929883095040*z**8 -
-     2799535109950319511589271147520*z**7 +
-     29625586808198205412409053464960*z**6
-     - 178865122211497895762174942794480*z**5 +
-     563768579061926146070811724662440*z**4 -
-     263229245629094699613339773048775*z**3 -
-     2325216515338618439437020928602250*z**2 -
-     1892868986535543261556995472652500*z -
-     443975878066962431269934147475000)*Dz**3 +
-    (32510603484980591048329789440*z**8 - 1194151252545365997211732500480*z**7 +
-     16809833441633789089573050055680*z**6 -
-     92350201721356744371569280581760*z**5
-     - 108766621251672394586496043264560*z**4 +
-     2916339527592661176322885903051520*z**3 -
-     5913425235106539686432812931802150*z**2 -
-     10835000127456450424493664475839000*z -
-     3743204311158826432236930927055000)*Dz**2 +
-    (205628051009128307145304965120*z**7 - 25421990604988989669504965001216*z**6
-     + 606361997942150806801455943504896*z**5 -
-     6141760282654986152715391672929792*z**4 +
-     27987012918572513876751486535488528*z**3 -
-     49754424680571511972950797738733840*z**2 +
-     54978732390993528795482387345156550*z +
-     61626305072646847828883948195647500)*Dz -
-    (2191308486183838996428352389120*z**6 -
-     73951325877379936401191010189312*z**5 +
-     3629071829430379236923500349251584*z**4 -
-     38364090847724191369158954804748032*z**3 +
-     175754333087675380498581210544395264*z**2 -
-     423475168947727036937419895487740640*z +
-     594802540714259678423325565341211200))
+def _example(name):
+    try:
+        return globals()[name]
+    except KeyError:
+        pass
+    try:
+        build = globals()["_build_" + name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = build()
+    return value
+
+def __getattr__(name):
+    return _example(name)
 
-large_irregular_dop = ((4621860730951414426976009691548526877605888000000000*z**32
-- 834890121311347773958990647645149199093832089600000000*z**31
-+ 71887411723271363917292543590304267463270649036800000000*z**30
-- 3924794785949193728955849597285101280085697605140480000000*z**29
-+ 152453427667616651495126864787564858503094106463404032000000*z**28
-- 4480725820607212866482905093994622440768157554515598376960000*z**27
-+ 103440125438423941492678430520530026083764926555127663296512000*z**26
-- 1921554273322850961177136980747233086700426650353665468006400000*z**25
-+ 29182623543192745623665790740497861131433745494081853952884736000*z**24
-- 365956239033682325321604964421050124829728322908241211563442176000*z**23
-+ 3809101740755860192372035805828402630093491011110223017707995136000*z**22
-- 32931069082083405033155982581027345726991790809303457078623141888000*z**21
-+ 235430403405222388607435820012405129090956827559957282583976359936000*z**20
-- 1375910076825097973022689558499875525451869918939969705690466880512000*z**19
-+ 6418580692488376619225015572683386027004367899299024024700985429632000*z**18
-- 22703380113091899585974369404118345290965499267887262829462660168832000*z**17
-+ 52826033971805184969236950202545493444089596958047689713440778203360000*z**16
-- 29453761233425326104879900560617065314588258867818651555955784660672000*z**15
-- 343002663826900008974587872454791459592134366829189714408349939576904000*z**14
-+ 1521967034915632361650461472026658959117155403303987736632905047989624000*z**13
-- 2635123437697871136370299835016145243192072559884063135991854289939014000*z**12
-- 1733602635328700792249037012025766054381915645656762285109969146574100000*z**11
-+ 18499783627048559856570990471611018384192137206995962279052771216988486000*z**10
-- 31734592681115773183253124079425932809599844092345515096565645131272128000*z**9
-- 17008554601633235425446501789907285916087907570348791052659831439823002000*z**8
-+ 137988449157086997655688692563882953313050522624107663407065126192374812000*z**7
-- 127593154297095129553924578655467136424292746803158275956436704156276542000*z**6
-- 212798337815953043120693924569398843960164468447386013572325668191672768000*z**5
-+ 440892164352540966179387912083308694596102739310775003761450272740822528000*z**4
-+ 79045543677302259767285743819743566291725588369977447190339477058322432000*z**3
-- 599322513175083835856016220613506740924842517445803437297582219230052352000*z**2
-+ 79163613308136746658456715294810889113884217826335457635175661796589568000*z
-+ 351010350628615368876845980097750853702139105414399157450620373185855488000)*Dz**6
-+ (-129526599694591340076977998861208874844013199360000000*z**31
-+ 23991625470414660721450602645635013252729192579072000000*z**30
-- 2113933512609720193382951607624010541048608302563328000000*z**29
-+ 117907357549164338114212771761577301386997992787646873600000*z**28
-- 4672864976762745258123889430661939616350748548764679536640000*z**27
-+ 139997660456528180294331846380188034787388929742233782137651200*z**26
-- 3292884654245957317036066087282775616090333683848851114782883840*z**25
-+ 62324171790307953725546856127170023259402161214268959625618391040*z**24
-- 964947330544403555438211293529277861646114413438691856755593052160*z**23
-+ 12353003293084425187941818076765957015953712482555373226326483271680*z**22
-- 131572756542682060153505919464768857115525573747935373447479166976000*z**21
-+ 1168511786106601251178381654774450191503804382100128970882975757967360*z**20
-- 8635217495041004713490322256244513811542933132178333894677208337198080*z**19
-+ 52703885462380566492139906991580111916815685731458346709754064319749120*z**18
-- 261506726234225134602881869826610942467925412660263324076611446980733760*z**17
-+ 1021892972206171468896813577291530627584155462130194000380510044520837600*z**16
-- 2925649393923624441168537872453750946893541548512635482822553710848984800*z**15
-+ 4820268315542106755961311263525870160407033386861468543551407708647842640*z**14
-+ 3251081541148591682653804880011257594225970553308415417682296265686136540*z**13
-- 47348143298390515745700996742188122752758285164286493023956048843942677770*z**12
-+ 137479563855731203503031657887516916840614806808898271093119489071158791200*z**11
-- 137616521221829049387246437085021414786120071551429899058186930711270363950*z**10
-- 318459994689728915604187679644274770085319445132718096581986550526363381220*z**9
-+ 1281710417922995911724666897173500432922030469726988882045545766815890628730*z**8
-- 1271861170066829588563768189250468778107580352706171337081497735113647934440*z**7
-- 1902073902156977232062446642126501558275276035278588636922379735160055795250*z**6
-+ 5845084262474174022232252261244044894064101351519654631276307842337581592240*z**5
-- 2430740167566986279171071561286751885866823761963053096122212886448107060480*z**4
-- 7788667640322759643450006323146552039839043848258549822619998548140633825280*z**3
-+ 8490600841360323311080447766548493384912397612148250587536434558508776816640*z**2
-+ 3194999785540654329218636603873524539415723992357898909749274037456968089600*z
-- 6178549659141363071309867829532718180527382131955016343885240187440657858560)*Dz**5
-+ (-4193826489635454920481908226764202701440665255936000000*z**30
-+ 659384104953144494114385421490150496495337659904819200000*z**29
-- 49309663059946003240266246258486663531849118868570112000000*z**28
-+ 2333740772714851621858751369129256922533520854355814645760000*z**27
-- 78465032532470068091505860313598376234710252210595696738304000*z**26
-+ 1994049291275184019060863260120194527841272010272053282073477120*z**25
-- 39785429658732876086649746259684617658058935301382864919749197824*z**24
-+ 638960999020694295859592807638344905596655297239219207951923806208*z**23
-- 8401466793285410509287855403966478763009813932998313548330069622784*z**22
-+ 91499556598022842754344275702346864644031689198585093344213782781952*z**21
-- 831908271342063734772499035739445101421851222238932386692652708913152*z**20
-+ 6346521432933807976621950003294289393184058049683901781148241768455168*z**19
-- 40752727419436291915121997814795542546890110510413500911693682410283136*z**18
-+ 220665741771291883807983919428702760728140904760948342686859469593639968*z**17
-- 1008518278560690190818010476288787515159446807789720129663848457980214544*z**16
-+ 3887756039322807571924753448597592522350366700099526646282261949419816304*z**15
-- 12550633157830597511955659613741366911145838983701572310162225123562926784*z**14
-+ 32904814697527357485605326093882714199657892696047382546145100125650048378*z**13
-- 62355622950093752925304059995448314599006310850202934075316155321463719409*z**12
-+ 39479430609687011405695140637361666129303087273020678015409569148292969582*z**11
-+ 268032036399005209187002346931303974247285716110727335451590819400801905413*z**10
-- 1229734965861408387250694738681632441638282135754338841751740969696129725108*z**9
-+ 2397719769814858820905999069485775523244350232840055927387718527383781976121*z**8
-- 503858714023737292478378652491817900839815584359155816007090563199882844618*z**7
-- 8693706698627133992089351438538715046492958382994500835470663659701487839101*z**6
-+ 17804702938692831811609541530292473271495900833213560670516908291178861847526*z**5
-- 2527372759776124853381835027018704748376866713104510231459398528205688795232*z**4
-- 36056646385076991994057308377482756687119049278479536460653232602668997272576*z**3
-+ 36427250195477126775525261993518967268588090386479256945682026379296593952768*z**2
-+ 19693874449199177329458287989133313674942698399607756489051275336600065540096*z
-- 35646981444038723453276700615198600918787566089295147828371989302456757518336)*Dz**4
-+ (30224821967004224834194934821280007049877976514560000000*z**29
-- 5901109966117548354257330459215231450658507324601139200000*z**28
-+ 535203200677618672749463997491385253579507123128107008000000*z**27
-- 30399966099396624486247838761237379392613315043903815024640000*z**26
-+ 1223263814899621885968670465267649671217116183592143137275904000*z**25
-- 37270726212242148908655800359044624698824669519514041502348083200*z**24
-+ 895395401408166609151484264099386803815293814541612576920648024064*z**23
-- 17411916787175302380343721664184012463882904066479007191633564270592*z**22
-+ 278896277552361856256013382543216834141270567557954368306566347472896*z**21
-- 3722744642552040694595526815897805829216343103981838355405306610720768*z**20
-+ 41722916342240582404163687128569953187193007259396284563427273259770880*z**19
-- 394319530364831942035491936279004274091299457908086331519634497590407168*z**18
-+ 3147244823046709120421628388947892408752744461609386988668059125738415104*z**17
-- 21184228290576951240686622470504317362938860743811633817899613925372509152*z**16
-+ 119663124519213139299888528221060873169666462793786017984225577057174245696*z**15
-- 561622568389283678110097699058646144975325521266356804553544553164609544720*z**14
-+ 2149829750358886018604615750860541716878054168177783050410831087338618491584*z**13
-- 6472645827900099395412809330222139217521946314558503005613020509690325997142*z**12
-+ 14084161334236732551121567174769764431451167709248712443768279160289192760736*z**11
-- 16144670937850494938960587077202691171333310065330086561001372223010041025598*z**10
-- 19844236368840309604307606234552748927025581524427205645082444069450332485060*z**9
-+ 139905262276439860520565299527637786235302952256178625096447281088677347608998*z**8
-- 305664724340495089829482349991940262643635454220511917205609217832840366825384*z**7
-+ 246686355215248586976054729053211189432464128409980323200657343284065028364342*z**6
-+ 386035413373525912913488609115604504713442578323604241744310621748451761972844*z**5
-- 1285164481422991799227828755391372583237506016596499248414407335274828745775160*z**4
-+ 1176235021594475927183320730994188194553289437126593901805267242224005239687232*z**3
-+ 464602504460630695434485566784880979716705570824700932187882198422161019925504*z**2
-- 1732422664002149731740089052235015024906047932259444745996724820304236993134592*z
-+ 1018799466936350330065369220491368555752822907462434310489827137114721733574656)*Dz**3
-+ (592865515704428102230721368742266600963550950195200000000*z**28
-- 82211241378048684417973119959806520815797451979803852800000*z**27
-+ 5179975555434053567906991125886831580014013839264668712960000*z**26
-- 192135183351989471429366910585628921020269109483528769241088000*z**25
-+ 4393581913972770168961963614736425785781237244528581274396262400*z**24
-- 50141894070207819234749041316295218978176454535185555217234001920*z**23
-- 458332456930094207718665551552577210147535836620441405049040273408*z**22
-+ 35641924555006449233323256727839106532731626043724076346955156488192*z**21
-- 924231197674941530364013075503950191293209265945503558022379024809984*z**20
-+ 16227694364352743908120396487218361803690905867188662204224865753190400*z**19
-- 217957958598822761493724075546395754232558970027103390511091410543001600*z**18
-+ 2344645166349642768919708108849223933755161233363220396725108508076502016*z**17
-- 20646791833141458550464659128406074267857831910385327225756052493998843264*z**16
-+ 150423512009872139539941488538805327997238053141300317571297399882946847968*z**15
-- 909988448171961901829110436180706420353817412162640103551365780732824332400*z**14
-+ 4560432758235971552868732623606439584318762716413385663570249391020203228360*z**13
-- 18761241082996839721864939587939528869656325630659800868884048737315305641228*z**12
-+ 62132820462376326089663377443843777844173740145034145596261544144828020063992*z**11
-- 159082183162767708683253567194385934572640134965124480603536886015847533133044*z**10
-+ 285017227909748174854564770856177257787421121960837136256773512448602430882560*z**9
-- 231733402185575209732928935690896622456684861258981175902493030673195915725460*z**8
-- 459799808070341152729237842551646899516714201413242452813307025268357253707976*z**7
-+ 2042902244587225555364223557691887087308191374298133401191948234655720709941924*z**6
-- 3459800230111987747134243000973531949103394716849556217024187436333329539638968*z**5
-+ 2216103941820751962391130662296066346489298679156189155438584113540517592974560*z**4
-+ 2528542059656637297452752333696488337097626149748002225940248089313078116191200*z**3
-- 6726613290864118266565038659113535637435235570426850949598771844747946025914624*z**2
-+ 5715671605551754548959171964648020136593272856600196595288530324763702443442176*z
-- 1774119440203727180383718277323992736720152072272168944386843255167540374863872)*Dz**2
-+ (75700048061143838615245684603555734092854780231680000000*z**27
-+ 171496756517788849102244248223532898546525460824798003200000*z**26
-- 23189506738412464751955123509331627228552748370298824294400000*z**25
-+ 1531799521267205966727789644049646225596273307837396571652096000*z**24
-- 66498459852772987847632987316252967699566328923161961503496601600*z**23
-+ 2123117254769551439950376967870429737375058054797563121721378078720*z**22
-- 52778362719359688450936252352206037000256130475637628420226536701952*z**21
-+ 1056583346055079251405393307410617856680452883202286849473135857172480*z**20
-- 17413984715047093357067666956545746109562182272963798901247066493730816*z**19
-+ 239916176311824708118585552502087876880550726241010113538134123256754176*z**18
-- 2792551763598100656065903147428927587235913683510880388357948211808495616*z**17
-+ 27657248064957372824697064283474189535530703011146416615745034878095920640*z**16
-- 234053104626845349181767622348590830353870345121994861547935625052588324736*z**15
-+ 1695348887243593476769878932983763151738400586505599537489266791727366200768*z**14
-- 10504405137852478182454084523412080899000242996202411926890403854607498679008*z**13
-+ 55506806429266607026950041232804520541260929790921347584159605007432025585168*z**12
-- 248705853776944100256848933228108304796969027574414542347492014651265631256160*z**11
-+ 936074118654379542449559953908985854009600364507806049464685607725335423999488*z**10
-- 2915371828470162229992751264281414351315968330883223127214759593376245010449184*z**9
-+ 7325847258597662043976772656046491325760794686650998664570538500243162502264944*z**8
-- 14151735108576434290553132828048735368462585137398871282403765417700429452881504*z**7
-+ 18626464573191254974093764374227685657913936873257005161743946341440736186809440*z**6
-- 8803812753979324834997353522670782677068545204012220420552927443974642167458944*z**5
-- 26623518419751278249115539279751196551037037944480515886536298140811443280371168*z**4
-+ 77668440992660279229944291346328927383968500435102092175006866953800109316222528*z**3
-- 105127188400428033776897941406220974900429620063673931411217730512364846556259008*z**2
-+ 78993955477459987717025372409689576860846422119529475463774349522272195152036992*z
-- 26664319335246028384715398922836832340835838835431151368467008971658170742171648)*Dz
-- 2928653991511444390968588077149718911983337812787200000000*z**26
-+ 31191660855519886926561266556176650667139650733421363200000*z**25
-+ 23333440889365781736501232666970214322997679030714205470720000*z**24
-- 2789624326233220958798931813363169784961061502349076932329472000*z**23
-+ 175053094963709762255720491681608690447723182519674700147195904000*z**22
-- 7231145521323573513480930854513073315539348549736788962178315059200*z**21
-+ 216326992103026799702659727515670232725241698188584094875848827207680*z**20
-- 4962882027148374211374168953438479371317095093904167852334174111662080*z**19
-+ 90675022192448698844014701803501143399841308789438123827170976289259520*z**18
-- 1353863240942817569723907447175901582578381442331830755849697992868290560*z**17
-+ 16815459242756174730401973850085789020228657191281164363055029526959257600*z**16
-- 175855626507136013100171041840913597079762600413490910365513566206610700800*z**15
-+ 1561051042131911672280728144973838013451906935277584258951553195113443405440*z**14
-- 11821579423581305252908698884407455665033316848448136181690639694847593308160*z**13
-+ 76575173717544710855440040102244131196641050091431518748178774667574993219680*z**12
-- 424563365625353210026099017375299660685130776453729420427495686476888212161600*z**11
-+ 2012390622586102294254725961518847795485507447769363129849041780415973497139200*z**10
-- 8128631491247291094855779677620077082261445496668015030741053337635677024315520*z**9
-+ 27828805417729020293172817296853049068823121615168533232368140825843186678162080*z**8
-- 80085572890186216186238287036652031196701332227847285118262429309468214237135040*z**7
-+ 191414959509727095424937954446134891878185747295484715841720487415246103220081600*z**6
-- 373448332445086362188481946999716185565915340693505354667847719062792758881792000*z**5
-+ 579828272085091452305977998727064747877942985206319037511020428352527146135015360*z**4
-- 689336758413079100390714686265212653373082027588831809524627339126312836001200640*z**3
-+ 589254912781899178191259063683684769748151409157504050945974628750956574040421120*z**2
-- 322222095782617401107314270163466274507822510946133149523197255205611266100630400*z
-+ 84544499988587861233277458064634659416710963970109229791076790401592336911678720)
+__all__ = ["IVP", "melczer1_singularities"] + [name[len("_build_"):] for name in list(globals())
+                                          if name.startswith("_build_")]
 
-vandove1_dop = (
-    (21025869743887779611255086936606133610945*z**43 +
-     537071342355488337816397142254361959288755*z**42 -
-     94401467240274372586076586195903929964173949*z**41 -
-     3224026827981455148890307303593051960810778015*z**40 -
-     11691304539722989814310925516216358667305799744*z**39 +
-     176712075730836781804313194025383464696105558384*z**38 +
-     1821002740941250093090302525284898819555149207424*z**37 +
-     10407911280182716336365536203001516962942564037376*z**36 +
-     26690320466149995337814149143053234882096214676992*z**35 -
-     68320752156843982521322520127614610377937747949056*z**34 -
-     944323010799794787028509149093433163529691164895744*z**33 -
-     5441727726044684355381015927248094386448235566276096*z**32 -
-     20386380090665086868040859504835081870091073365106688*z**31 -
-     23407835145170254773619140245202246280323965020798976*z**30 +
-     223173051007785228762624303121180467505914986245455872*z**29 +
-     1462571140259884023792038867557269190948837641278947328*z**28 +
-     4168423685960502083689949691925251445075084755474513920*z**27 +
-     3968321855003093933568592622845735884615770257592090624*z**26 -
-     17323994045541822891629175075176750258532900800861110272*z**25 -
-     94925012601298405268869792661445083668208997645646757888*z**24 -
-     254432196150950327738101051646698180085259663023225700352*z**23 -
-     435940823606980115287123264471499578228110421790368464896*z**22 -
-     395642115569327912611965107442762058569308478462287151104*z**21 +
-     315497868018455217265802071140082462199866931850936057856*z**20 +
-     2174767531431120152402829788918339652710662636993425440768*z**19 +
-     5313931687336594901446132457923278366853464261420721897472*z**18 +
-     9184467309406367683866603210718780822438321794408899411968*z**17 +
-     12610420309663096352820801592508668838611005311423929647104*z**16 +
-     14342818081171459775929564537319680156690126406259098779648*z**15 +
-     13776958450187689516874924574965940943614245931902958567424*z**14 +
-     11284671810744912757996455702504896487552745239063388225536*z**13 +
-     7918014611745316282500373725305169734003392225878673981440*z**12 +
-     4765125025152640437929730034231551217409285414271265538048*z**11 +
-     2456356688736864964589897924368377051665252698894375059456*z**10 +
-     1080640092662729938091000383640830766008789679665896751104*z**9 +
-     403262213337709823047431129463223299745359594847329058816*z**8 +
-     126501540558459078109691254518436879646594696234494066688*z**7 +
-     32935877868428475043946897056128856953213313519133392896*z**6 +
-     6990591120945975588450916863969134414393457054561861632*z**5 +
-     1178799569106878150268380705391773645204477995143659520*z**4 +
-     151937898265876848124698628881154460971766435272458240*z**3 +
-     14061401646232139953907871226766048088665048242716672*z**2 +
-     832087977741892966427740011175705408161821195501568*z +
-     23652794104299968303456916474329042883412758626304)*Dz**4 +
-    (462569134365531151447611912605334939440790*z**42 +
-     17640749385331874961360477120354618066918960*z**41 -
-     1705547856828046875685188942884729532265033146*z**40 -
-     64185556945772639691321876254638083970582767324*z**39 -
-     209722379316259645789574877209607143229772173144*z**38 +
-     3165666438013833005898657929596823735443682142288*z**37 +
-     36126282806845693865574234767028305884869839523936*z**36 +
-     249703890522908424375576604067480759516189432250048*z**35 +
-     921640403295813361487925035189721753238706727426432*z**34 +
-     818434826823235626436001923043220906210275274246912*z**33 -
-     11929131561929825841391560535391677891824891115531776*z**32 -
-     112929594066474340245164363435155997633559530159938560*z**31 -
-     573930674568018328739485472863950205853514847706142720*z**30 -
-     1409737839954786838102365937330977420642492572526964736*z**29 +
-     1324341234947137572566670787502137886804558062134206464*z**28 +
-     23739300519735793461089004202213933095010430762148839424*z**27 +
-     91312363493791790840964287999792214595699645402300317696*z**26 +
-     180538341797299628299789897474728109245701251904028868608*z**25 +
-     68964076213544314943972901555096119118809785950035509248*z**24 -
-     828854310696116047257584059918266943640935615467785551872*z**23 -
-     3366474590580194069680055408741099364656648226597822791680*z**22 -
-     7970619249959040363045100396828262128325551352178483920896*z**21 -
-     13395804480044731286128923952997554239249848958195666518016*z**20 -
-     15880209097602275723512531454994226647256894378705762123776*z**19 -
-     10248370917380863548716197189256605969560445806732457803776*z**18 +
-     6574896522135995392019081449765310498614164290991646834688*z**17 +
-     31861775084392816242833372093286031829871916181329113251840*z**16 +
-     56918901413470053580048988185617474558883576276738176450560*z**15 +
-     71778681792206102271096395667108074434085836467375091744768*z**14 +
-     71396759703401558396901217388106528481033097971996502786048*z**13 +
-     58258223770064646536900059815256482015352489681113797623808*z**12 +
-     39667206882605060328589832245080628759974280726258166792192*z**11 +
-     22698956755743910000726754771184814630339120024166938443776*z**10 +
-     10931734925185753673284479910120505891295511329907236929536*z**9 +
-     4418184337822220252199877289953586153900101937179085766656*z**8 +
-     1488425531158810654876469026048768904013276383118413004800*z**7 +
-     413332775654828180778330118770484672091001540172713033728*z**6 +
-     93043890772386727998848523756754854628399185266930089984*z**5 +
-     16561544928692877553545399212205710139796766044037578752*z**4 +
-     2244258639985142804427106310045105247599428512736346112*z**3 +
-     217618301549713332359151838717734506153578915386359808*z**2 +
-     13453059455682673243921998051140008405729786151829504*z +
-     398494468369771856960811022833171815648747958829056)*Dz**3 +
-    (3153880461583166941688263040490920041641750*z**41 +
-    162130131634815947820900747830538283877290050*z**40 -
-    8977008887459628788767870292294413411588255590*z**39 -
-    390033592086369962200127359713958985964795968490*z**38 -
-    1090875902121032033559154536975862801258596691344*z**37 +
-    16641957643532784149091436351880597254098403899720*z**36 +
-    219865832189560637664470729106762413742117542522784*z**35 +
-    1792036562172598185218900481082000410282551439729312*z**34 +
-    8044147670800618630877997351547195830370319552755200*z**33 +
-    19087936065088611467782990771314970658533557336157056*z**32 -
-    24027122492178438456746753205942654592726558013253120*z**31 -
-    680134878203694019211665906396364458134864451512580608*z**30 -
-    4388028264643083060391086732486567231300922762534490112*z**29 -
-    14151735523227899102572961767662748674118702962373416960*z**28 -
-    12399330243712553330745278742490545710307025467137597440*z**27 +
-    97945826664100185370947266867979619385441561834258391040*z**26 +
-    535577312261685634169399781933146044736715021130138386432*z**25 +
-    1456945221332324532189170579964633650660271041836106153984*z**24 +
-    2276310191231776688685600575105751989351651552112781557760*z**23 +
-    571203285580459634136770110039474934466508461957075173376*z**22 -
-    8430661977911598284445290711721730202194309737561456640000*z**21 -
-    29932503389781944486274216908484408086139943186180714004480*z**20 -
-    64340899882980402707525147639501460754545599940223939117056*z**19 -
-    101800270742404623951585737896892621924056898656386930442240*z**18 -
-    123249015646287203935014289528458707795411212452006018940928*z**17 -
-    111536421879884780876937747554684402443436255624657947852800*z**16 -
-    65594069269667774229209113239049447203378723862928619995136*z**15 -
-    4191796946739472951528183498763528042522250697456887005184*z**14 +
-    46078729711122076681952818507309562666748918752087994531840*z**13 +
-    68400894701258397403788148889742970769884094315353698467840*z**12 +
-    63751449441242786723054790277243130983171465977898844815360*z**11 +
-    44964289904164156911222594363328304983984165992916366393344*z**10 +
-    25300459101048281151133049130183515195378006239861756919808*z**9 +
-    11570136180590635356479703882835752571171013140261204131840*z**8 +
-    4317727700381206800171663902848339974898484664285750362112*z**7 +
-    1308345116142687220093377447235929234956747121928217559040*z**6 +
-    317785415437401559368456248323815163330305058209183825920*z**5 +
-    60507180697821736538871092627551366613049363077674303488*z**4 +
-    8710608655302343741408875523252107763519092731727052800*z**3 +
-    892305492200345525694664072852844352104283870936956928*z**2 +
-    58007047913679124075075211948800832553167384173608960*z +
-    1799929014614743756791063221193967369073416149663744)*Dz**2 +
-    (7569313107799600660051831297178208099940200*z**40 +
-    496390334289249487037447983705122927461785200*z**39 -
-    14789990408814100049978386386474780326991495660*z**38 -
-    816613609191987300726202222901063093214600609360*z**37 -
-    1774660173877508982423491123725447696048220827152*z**36 +
-    27418527839909325165280568000968724301601596597120*z**35 +
-    458545830288976181957658556382988965641716957179712*z**34 +
-    4358580369014308481169943186831708085252781208635648*z**33 +
-    22202525964940205564830615693474568098539271098394368*z**32 +
-    71701642188111226116467479361030655444411826158756864*z**31 +
-    59850639800799310764228527610989402249686043989926912*z**30 -
-    1421584917293721457363023176640128463765352140620623872*z**29 -
-    11410387592989449948709855632025095118033710170559049728*z**28 -
-    43781489211798022495673770135126667879735759542552117248*z**27 -
-    80857180041108239811053787371096729275243000171081220096*z**26 +
-    60184651453648120112088527485756272896990025124247830528*z**25 +
-    913608156062934619358979950140102819739949843976060207104*z**24 +
-    3286527181878233302568194757836496076052467086981141364736*z**23 +
-    7334932157974462731916332653741068532609793486853361893376*z**22 +
-    10513586254605655483726588714582383388781775874064583229440*z**21 +
-    5621234440240557965350252398333063278011643657269316419584*z**20 -
-    17768348106044135944926978173416116573745553417197307559936*z**19 -
-    65867474236648370881982870209515388383157650737400029118464*z**18 -
-    130798610963433968459731847886529414161323631445524824981504*z**17 -
-    188618723107954926430492879302418356386776704741835907530752*z**16 -
-    212003114828151230207973026370847753355018967800070941966336*z**15 -
-    189548892645884334492038318439391370113267988966516052721664*z**14 -
-    134150841466931334063815769602440521150682795382194114134016*z**13 -
-    72520527110978195469528061424102279519226313729309163913216*z**12 -
-    26507165396150975710367247262223802832315925403770491502592*z**11 -
-    2690774324502642520943446603835354908731345803988827111424*z**10 +
-    4583780380332041638448481566269415667192424427277210615808*z**9 +
-    4211267604338932851552846402540883508280043603448354045952*z**8 +
-    2213678948630537860401436176907077313515150305170829606912*z**7 +
-    836537615776136322818266892891908025203676863386773094400*z**6 +
-    238587684316523535240047103521536692127045858358709977088*z**5 +
-    51489640650213487931748383378599819024141276047420162048*z**4 +
-    8210499442352846460301440485304853976965670346405445632*z**3 +
-    916800362030570007190579327882855090252192580445929472*z**2 +
-    64206307220320701466979026282646180442538676362149888*z +
-    2127225595878252930296285917577647942701526472982528)*Dz +
-    5046208738533067106701220864785472066626800*z**39 +
-    408708703121893783329260633158616154529060800*z**38 -
-    4994207780110793094844481194449737190714787020*z**37 -
-    459877700430033845356263833091387791715737111580*z**36 -
-    604529200324465871116020281987016720752366940288*z**35 +
-    8974484811932508451377639701168036364174109793760*z**34 +
-    250810620816377399866622386425817833560481908820864*z**33 +
-    2814868204072151970093177264452202154819820599049472*z**32 +
-    15770043143289585772158334543338519444546806394640896*z**31 +
-    60081240357934004365867683962763158656797735746617344*z**30 +
-    98593879223928989870558031769123800683021704018790400*z**29 -
-    860076429337875697975052148943984934090884950362548224*z**28 -
-    8301647506738393447611198203556485359861386010565763072*z**27 -
-    36098438372934160729928526180311986523715870853230084096*z**26 -
-    90314534308026344186480736164127593266750019083925716992*z**25 -
-    92193706118146942159383587903232205566002181236972912640*z**24 +
-    272072262696245853071582127397809365088206375221304885248*z**23 +
-    1655791485481320194379453278530547553644827429811002015744*z**22 +
-    4788453977665300377595416635379870469581046364766311022592*z**21 +
-    9511908671274789076417074847665955212094916860091639791616*z**20 +
-    13440180812533805502041043475784805791082043392646667304960*z**19 +
-    11781678833684844489735496945559408053234698268223511461888*z**18 -
-    11322704809810447708835223709954885461090245619876888576*z**17 -
-    21700362351484636191663978885983147403302413677401586270208*z**16 -
-    46084242088155968538939343303496177004935716845924261036032*z**15 -
-    62613466204752310437978872139479265831452296494962693898240*z**14 -
-    64530636528283573270092423828761623247694796032328123547648*z**13 -
-    53146880049758256183959420637451158464327870773800042758144*z**12 -
-    35714312020856573197889450649715253834398390483738439974912*z**11 -
-    19732260439286687782645701021723525617709420162606887337984*z**10 -
-    8962337617788906622984354084261481075290207915068054568960*z**9 -
-    3324856757942578961389531136482856859468139963298258878464*z**8 -
-    994127863830460643550708545827871629755829599952156229632*z**7 -
-    234141564927980478090088132176262873946240446081758396416*z**6 -
-    41755830026207951542547564204253333388144994933631090688*z**5 -
-    5222684548237372887812766167942049939008357336906465280*z**4 -
-    374127800039813393794579538517870520896676853515812864*z**3 -
-    715679698626450227151163048501275661570953153871872*z**2 +
-    2348203067116583373055774642175689752692461796327424*z +
-    146091866025238619101386610380037914092502226305024)
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
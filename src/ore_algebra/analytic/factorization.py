@@ -290,6 +290,8 @@ Other examples::
 #
 # http://www.gnu.org/licenses/
 
+import functools
+
 from ore_algebra import guess
 from ore_algebra.analytic.accuracy import PrecisionError
 from ore_algebra.analytic.differential_operator import DifferentialOperator
@@ -301,16 +303,20 @@ from ore_algebra.analytic.monodromy import _monodromy_matrices
 from ore_algebra.analytic.utilities import as_embedded_number_field_elements
 from ore_algebra.examples import ssw
 from sage.arith.functions import lcm
-from sage.arith.misc import algdep, gcd
-from sage.functions.other import binomial, factorial
+from sage.arith.misc import algdep, gcd, random_prime
+from sage.functions.other import factorial
+from sage.libs.pari import pari
 from sage.matrix.constructor import matrix
 from sage.matrix.matrix_dense import Matrix_dense
 from sage.matrix.special import block_matrix, identity_matrix, diagonal_matrix
+from sage.misc.cachefunc import cached_function
 from sage.misc.misc_c import prod
 from sage.modules.free_module_element import (vector,
                                               FreeModuleElement_generic_dense)
+from sage.rings.finite_rings.finite_field_constructor import GF
 from sage.rings.integer_ring import ZZ
 from sage.rings.qqbar import QQbar
+from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing
 from sage.rings.power_series_ring import PowerSeriesRing
 from sage.rings.rational_field import QQ
 from sage.rings.real_mpfr import RealField
@@ -348,11 +354,21 @@ def right_factor(dop, verbose=False):
     if verbose:
         print("### Trying to factor an operator of order", r)
 
-    s0, sings = QQ.zero(), DifferentialOperator(dop)._singularities(QQbar)
-    while s0 in sings:
+    # Only the integer singularities can get in the way of s0; look them up
+    # in a set rather than comparing s0 with every singular point in QQbar
+    sings = DifferentialOperator(dop)._singularities()
+    int_sings = set(s.try_integer() for s in sings)
+    s0 = QQ.zero()
+    while s0 in int_sings:
         s0 = s0 + QQ.one()
+    # The degree bound is invariant under the change of variable z -> z + s0,
+    # and computing it before the shift reuses the factorization of the
+    # leading coefficient computed above
+    bound = _degree_bound_for_right_factor(dop)
+    if verbose:
+        print("Degree bound for right factor =", bound)
     dop = dop.annihilator_of_composition(z + s0).monic()
-    R = right_factor_via_monodromy(dop, verbose=verbose)
+    R = right_factor_via_monodromy(dop, bound=bound, verbose=verbose)
 
     if R is None:
         return None
@@ -386,7 +402,7 @@ def is_provably_irreducible(dop, verbose=False, prec=None, max_prec=100000):
     except PrecisionError:
         pass
 
-    return is_provably_irreducible(dop, verbose=verbose, prec=prec<<1)
+    return is_provably_irreducible(dop, verbose=verbose, prec=prec<<1, max_prec=max_prec)
 
 def is_provably_minimal_annihilator(dop, initial_conditions, verbose=False, prec=None, max_prec=100000):
     r"""
@@ -448,47 +464,56 @@ def right_factor_via_monodromy(dop, order=None, bound=None, alg_degree=None, pre
     if precision is None:
         precision = 50*(r + 1)
 
-    if verbose:
-        print("Current order of truncation =", order)
-        print("Current working precision =", precision, "(before monodromy computation)")
-        print("Current algebraic degree =", alg_degree)
-        print("Starting to compute the monodromy matrices")
+    while True:
 
-    try:
-        mono, it = [], _monodromy_matrices(dop, 0, eps=Radii.one()>>precision)
-        for _, mat, scal in it:
-            if not scal:
-                local_loss = max(0, precision - accuracy(mat))
-                if local_loss > loss:
-                    loss = local_loss
+        if verbose:
+            print("Current order of truncation =", order)
+            print("Current working precision =", precision, "(before monodromy computation)")
+            print("Current algebraic degree =", alg_degree)
+            print("Starting to compute the monodromy matrices")
+
+        try:
+            # The monodromy matrices are computed lazily, and we stop as soon
+            # as they suffice to conclude. (Computing them in a separate
+            # thread is not an option: the underlying Sage/Arb/PARI code is
+            # not thread-safe and does not release the GIL.)
+            mono, it = [], _monodromy_matrices(dop, 0, eps=Radii.one()>>precision)
+            mono_acc = None # accuracy of mono, maintained incrementally
+            for _, mat, scal in it:
+                if not scal:
+                    mat_acc = accuracy(mat)
+                    mono_acc = mat_acc if mono_acc is None else min(mono_acc, mat_acc)
+                    local_loss = max(0, precision - mat_acc)
+                    if local_loss > loss:
+                        loss = local_loss
+                        if verbose:
+                            print("loss =", loss)
+                    mono.append(mat)
                     if verbose:
-                        print("loss =", loss)
-                mono.append(mat)
-                if verbose:
-                    print(len(mono), "matrices computed")
-                conclusive_method ="One_Dimensional"
-                R = one_dimensional_eigenspaces(dop, mono, order, bound, alg_degree, verbose)
-                if R =="NotGoodConditions":
-                    conclusive_method ="Simple_Eigenvalue"
-                    R = simple_eigenvalue(dop, mono, order, bound, alg_degree, verbose)
+                        print(len(mono), "matrices computed")
+                    conclusive_method ="One_Dimensional"
+                    R = one_dimensional_eigenspaces(dop, mono, order, bound, alg_degree, verbose, mono_acc)
                     if R =="NotGoodConditions":
-                        conclusive_method ="Multiple_Eigenvalue"
-                        R = multiple_eigenvalue(dop, mono, order, bound, alg_degree, verbose)
-                if R !="Inconclusive":
-                    if verbose:
-                        print("Concluded with " + conclusive_method + " method")
-                    return R
-        if mono == []:
-            return right_factor_when_monodromy_is_trivial(dop, order, verbose)
-
-
-    except (ZeroDivisionError, PrecisionError):
-        precision += max(150, precision - loss)
-        return right_factor_via_monodromy(dop, order, bound, alg_degree, precision, loss, verbose)
-
-    precision += max(150, precision - loss)
-    order = min( bound*(r + 1) + 1, order<<1 )
-    return right_factor_via_monodromy(dop, order, bound, alg_degree + 1, precision, loss, verbose)
+                        conclusive_method ="Simple_Eigenvalue"
+                        R = simple_eigenvalue(dop, mono, order, bound, alg_degree, verbose, mono_acc)
+                        if R =="NotGoodConditions":
+                            conclusive_method ="Multiple_Eigenvalue"
+                            R = multiple_eigenvalue(dop, mono, order, bound, alg_degree, verbose)
+                    if R !="Inconclusive":
+                        if verbose:
+                            print("Concluded with " + conclusive_method + " method")
+                        return R
+            if mono == []:
+                return right_factor_when_monodromy_is_trivial(dop, order, verbose)
+
+
+        except (ZeroDivisionError, PrecisionError):
+            precision = _next_working_precision(precision, loss)
+            continue
+
+        precision = _next_working_precision(precision, loss)
+        order = min( bound*(r + 1) + 1, order<<1 )
+        alg_degree += 1
 
 def right_factor_when_monodromy_is_trivial(dop, order, verbose=False):
     r"""
@@ -502,42 +527,60 @@ def right_factor_when_monodromy_is_trivial(dop, order, verbose=False):
         sage: dawson.dop, right_factor_when_monodromy_is_trivial(dawson.dop, 10)
         (Dx^2 + 2*x*Dx + 2, 1/2*Dx + x)
     """
-    if verbose:
-        print("Galois algebra is trivial: symbolic HP approximants method at order", order)
     K, r = dop.base_ring().base_ring(), dop.order()
-    S = PowerSeriesRing(K, default_prec=order + r)
-    f = dop.local_basis_expansions(QQ.zero(), order + r)[0]
-    f = _formal_finite_sum_to_power_series(f, S)
-
-    der = [ f.truncate() ]
-    for _ in range(r - 1):
-        der.append( der[-1].derivative() )
-    mat = matrix(r, 1, der)
-    min_basis = mat.minimal_approximant_basis(max(order//r, 1))
-    rdeg = min_basis.row_degrees()
-    i0 = min(range(len(rdeg)), key = lambda i: rdeg[i])
-    R = dop.parent()(list(min_basis[i0]))
-    if dop%R == 0:
-        return R
+    min_basis, prev_sigma = None, 0
+    while True:
+        if verbose:
+            print("Galois algebra is trivial: symbolic HP approximants method at order", order)
+        S = PowerSeriesRing(K, default_prec=order + r)
+        f = _local_basis_expansions(dop, order + r)[0]
+        f = _formal_finite_sum_to_power_series(f, S)
+
+        der = [ f.truncate() ]
+        for _ in range(r - 1):
+            der.append( der[-1].derivative() )
+        mat = matrix(r, 1, der)
+        sigma = max(order//r, 1)
+        if min_basis is None:
+            min_basis = mat.minimal_approximant_basis(sigma)
+        elif sigma > prev_sigma:
+            # The expansions computed at the new order extend the previous
+            # ones: extend the previous basis using an approximant basis of
+            # the residual (with the row degrees of the former as shifts)
+            # instead of starting from scratch
+            delta = sigma - prev_sigma
+            res = (min_basis*mat).apply_map(
+                    lambda c: c.shift(-prev_sigma).truncate(delta))
+            shifts = min_basis.row_degrees()
+            min_basis = res.minimal_approximant_basis(delta, shifts)*min_basis
+        prev_sigma = sigma
+        rdeg = min_basis.row_degrees()
+        i0 = min(range(len(rdeg)), key = lambda i: rdeg[i])
+        R = dop.parent()(list(min_basis[i0]))
+        if _may_right_divide(dop, R) and dop%R == 0:
+            return R
 
-    order = order<<1
-    return right_factor_when_monodromy_is_trivial(dop, order, verbose)
+        order = order<<1
 
-def one_dimensional_eigenspaces(dop, mono, order, bound, alg_degree, verbose=False):
+def one_dimensional_eigenspaces(dop, mono, order, bound, alg_degree, verbose=False, prec=None):
     """
     OUTPUT:
     
     A nontrivial right factor of ``dop``, or ``None``, or ``NotGoodConditions``,
     or ``Inconclusive``
     """
-    mat = _random_combination(mono)
+    mat = _random_combination(mono, prec)
     id = mat.parent().one()
     Spaces = gen_eigenspaces(mat)
     conclusive = True
     goodconditions = True
     for space in Spaces:
-        eigvalue = space["eigenvalue"]
-        eigspace = ker(mat - eigvalue*id)
+        # for simple eigenvalues, gen_eigenspaces() has already computed the
+        # very same kernel
+        if space["multiplicity"] == 1:
+            eigspace = space["basis"]
+        else:
+            eigspace = ker(mat - space["eigenvalue"]*id)
         if len(eigspace) > 1:
             goodconditions = False
             break
@@ -552,14 +595,14 @@ def one_dimensional_eigenspaces(dop, mono, order, bound, alg_degree, verbose=Fal
         return None
     return "Inconclusive"
 
-def simple_eigenvalue(dop, mono, order, bound, alg_degree, verbose=False):
+def simple_eigenvalue(dop, mono, order, bound, alg_degree, verbose=False, prec=None):
     """
     output: a nontrivial right factor R of dop, or None, or ``NotGoodConditions``,
     or ``Inconclusive``
 
     Assumption: dop is monic.
     """
-    mat = _random_combination(mono)
+    mat = _random_combination(mono, prec)
     id = mat.parent().one()
     Spaces = gen_eigenspaces(mat)
     goodconditions = False
@@ -572,8 +615,9 @@ def simple_eigenvalue(dop, mono, order, bound, alg_degree, verbose=False):
                 return R
             adj_dop = myadjoint(dop)
             Q = _transition_matrix_for_adjoint(dop)
-            adj_mat = Q * mat.transpose() * (~Q)
-            adj_mono = [ Q * m.transpose() * (~Q) for m in mono ]
+            Qinv = ~Q # invert once for all the conjugations
+            adj_mat = Q * mat.transpose() * Qinv
+            adj_mono = [ Q * m.transpose() * Qinv for m in mono ]
             eigspace = ker(adj_mat - space['eigenvalue']*id)
             if eigspace == []:
                 return "Inconclusive"
@@ -640,15 +684,21 @@ def annihilator(dop, ic, order=None, bound=None, alg_degree=None, mono=None, ver
             K = K.composite_fields(base_field)[0]
             symb_ic = [K(x) for x in symb_ic]
         S = PowerSeriesRing(K, default_prec=order + d)
-        sol_basis = dop.local_basis_expansions(QQ.zero(), order + d)
-        sol_basis = [ _formal_finite_sum_to_power_series(sol, S) for sol in sol_basis ]
-        f = vector(symb_ic) * vector(sol_basis)
+        sol_basis = _local_basis_expansions(dop, order + d)
+        # Combine the coefficient sequences of the solutions with a single
+        # vector-matrix product instead of operations on power series
+        mat = matrix(K, len(sol_basis), order + d)
+        for i, sol in enumerate(sol_basis):
+            for constant, monomial in sol:
+                if monomial.n < order + d:
+                    mat[i, monomial.n] += constant
+        f = S(list(vector(K, symb_ic) * mat))
         
         if K == QQ and base_field == QQ:
             v = f.valuation()
             try:
                 R = _substitution_map(guess(f.list()[v:], OA, order=d), -v)
-                if 0 < R.order() < r and dop%R == 0:
+                if 0 < R.order() < r and _may_right_divide(dop, R) and dop%R == 0:
                     return R
             except ValueError:
                 pass
@@ -665,7 +715,7 @@ def annihilator(dop, ic, order=None, bound=None, alg_degree=None, mono=None, ver
                 i0 = min(range(len(rdeg)), key=lambda i: rdeg[i])
                 R, _ = DifferentialOperator(dop).extend_scalars(K.gen())
                 R = R.parent()(list(min_basis[i0]))
-                if dop%R == 0:
+                if _may_right_divide(dop, R) and dop%R == 0:
                     return R
 
     if order > r*(bound + 1) and verbose:
@@ -678,6 +728,28 @@ def annihilator(dop, ic, order=None, bound=None, alg_degree=None, mono=None, ver
 ### Tools ######################################################################
 ################################################################################
 
+def _bounded_cache_per_operator(maxsize):
+    r"""
+    Decorator memoizing a function of a single operator for the last
+    ``maxsize`` distinct operators, compared by parent and value.
+
+    Unlike ``cached_function``, this does not keep every operator seen during
+    the session alive.
+    """
+    def decorator(fun):
+        @functools.lru_cache(maxsize=maxsize)
+        def cached(parent, dop):
+            return fun(dop)
+        @functools.wraps(fun)
+        def wrapper(dop):
+            return cached(dop.parent(), dop)
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
+# Repeated factors lead to identical operators at several nodes of the
+# factorization tree
+@_bounded_cache_per_operator(maxsize=32)
 def _try_rational(dop):
     r"""
     Return a right-hand factor of ``dop`` when it has rational solutions.
@@ -706,20 +778,31 @@ def _try_rational(dop):
 
     return None
 
+def _lc_factors_without_content(dop):
+    r"""
+    Irreducible factors of the leading coefficient of ``dop`` that do not
+    cancel with the content of ``dop``, read from the factorization cached on
+    ``DifferentialOperator(dop)``.
+    """
+    dop = DifferentialOperator(dop)
+    lc = dop.leading_coefficient()//gcd(dop.list())
+    return [ (pol, m) for pol, m in dop._lc_factors() if pol.divides(lc) ]
+
 def _largest_modulus_of_exponents(dop):
 
     z = dop.base_ring().gen()
+    facs = _lc_factors_without_content(dop)
     dop = DifferentialOperator(dop)
-    lc = dop.leading_coefficient()//gcd(dop.list())
 
     out = 0
-    for pol, _ in list(lc.factor()) + [ (1/z, None) ]:
-        local_exponents = dop.indicial_polynomial(pol).roots(QQbar, multiplicities=False)
+    for pol, _ in facs + [ (1/z, None) ]:
+        local_exponents = dop._local_exponents(pol)
         local_largest_modulus = max([x.abs().ceil() for x in local_exponents], default=QQbar.zero())
         out = max(local_largest_modulus, out)
 
     return out
 
+@_bounded_cache_per_operator(maxsize=32)
 def _degree_bound_for_right_factor(dop):
     """
     ALGORITHM:
@@ -730,29 +813,83 @@ def _degree_bound_for_right_factor(dop):
 
     r = dop.order() - 1
     #S = len(dop.desingularize().leading_coefficient().roots(QQbar)) # too slow (example: QPP)
-    S = len(DifferentialOperator(dop).leading_coefficient().roots(QQbar))
+    # number of singular points, not counting the factors of the leading
+    # coefficient that cancel with the content of dop
+    S = sum(pol.degree() for pol, _ in _lc_factors_without_content(dop))
     E = _largest_modulus_of_exponents(dop)
     bound = r**2*(S + 1)*E + r*S + r**2*(r - 1)*(S - 1)/2
 
     return ZZ(bound)
 
-def _random_combination(mono):
-    prec, C = accuracy(mono), mono[0].base_ring()
+def _next_working_precision(precision, loss):
+    # The loss observed on the monodromy matrices barely depends on the
+    # working precision: choose the next one so that the matrices come out
+    # with at least the current working precision plus some margin, instead
+    # of retrying with an increment smaller than the loss.
+    return precision + max(150, precision - loss, loss + 50)
+
+def _random_combination(mono, prec=None):
+    # prec, when given, must be the accuracy of mono
+    if prec is None:
+        prec = accuracy(mono)
+    C = mono[0].base_ring()
     if prec < 10:
         raise PrecisionError
     ran = lambda : C(QQ.random_element(prec), QQ.random_element(prec))
-    return sum(ran()*mat for mat in mono)
+    # A single (1 x len(mono))*(len(mono) x r^2) product instead of len(mono)
+    # scalar multiplications and additions of matrices
+    r = mono[0].nrows()
+    coeffs = matrix(C, 1, len(mono), [ran() for _ in mono])
+    stacked = matrix(C, [mat.list() for mat in mono])
+    return matrix(C, r, r, (coeffs*stacked).list())
 
 
-myadjoint = lambda dop: sum((-dop.parent().gen())**i*pi for i, pi in enumerate(dop.list()))
+def _may_right_divide(dop, R):
+    r"""
+    Cheap test to be run before the exact division ``dop % R``.
+
+    Return ``False`` if right divisions modulo two independent random primes
+    both show that ``R`` does not right-divide ``dop``, and ``True``
+    otherwise. A negative answer modulo one prime can be wrong when the prime
+    divides a denominator of the exact quotient, so ``False`` is only returned
+    when two primes agree (making it wrong with negligible probability), while
+    ``True`` is always a correct answer to pass to the exact test. Only
+    operators with rational coefficients are actually tested.
+    """
+    Pol = R.parent().base_ring()
+    if Pol.is_field():
+        Pol = Pol.ring()
+    if Pol.base_ring() is not QQ or dop.base_ring().base_ring() is not QQ:
+        return True
+    for _ in range(2):
+        p = random_prime(2**31, lbound=2**30)
+        OAp = R.parent().change_ring(Pol.change_ring(GF(p)).fraction_field())
+        def reduce(L):
+            L = L.numerator()
+            den = lcm(c.denominator() for pol in L for c in pol)
+            return OAp([ (den*pol).change_ring(ZZ) for pol in L ])
+        Rp = reduce(R)
+        if Rp.order() < R.order() or (reduce(dop) % Rp).is_zero():
+            return True
+    return False
+
+def myadjoint(dop):
+    # sum((-Dz)^i*p_i) by Horner's rule, so that each step is a single
+    # multiplication by a first-order operator
+    minus_Dz = -dop.parent().gen()
+    output = dop.parent().zero()
+    for pi in reversed(dop.list()):
+        output = minus_Dz*output + pi
+    return output
 
 def _diffop_companion_matrix(dop):
-    r = dop.order()
+    r, coeffs = dop.order(), dop.list()
     A = block_matrix([[matrix(r - 1 , 1, [0]*(r - 1)), identity_matrix(r - 1)],\
-                      [ -matrix([[-dop.list()[0]]]) ,\
-                        -matrix(1, r - 1, dop.list()[1:-1] )]], subdivide=False)
+                      [ -matrix([[-coeffs[0]]]) ,\
+                        -matrix(1, r - 1, coeffs[1:-1] )]], subdivide=False)
     return A
 
+@_bounded_cache_per_operator(maxsize=16)
 def _transition_matrix_for_adjoint(dop):
     """
     Return an invertible constant matrix ``Q`` such that: if ``M`` is the
@@ -767,13 +904,17 @@ def _transition_matrix_for_adjoint(dop):
     """
     AT = _diffop_companion_matrix(dop).transpose()
     r = dop.order()
-    B = [identity_matrix(dop.base_ring(), r)]
+    # Only the last rows of the matrices B[k] = B[k-1]' - B[k-1]*AT (with
+    # B[0] = 1) are needed, and they satisfy the same recurrence
+    row = identity_matrix(dop.base_ring(), r)[-1]
+    rows = [row]
     for k in range(1, r):
-        Bk = B[k - 1].derivative() - B[k - 1] * AT
-        B.append(Bk)
-    P = matrix([ B[k][-1] for k in range(r) ])
+        row = vector([c.derivative() for c in row]) - row * AT
+        rows.append(row)
+    P = matrix(rows)
     Delta = diagonal_matrix(QQ, [1/factorial(i) for i in range(r)])
     Q = Delta * P(0) * Delta
+    Q.set_immutable() # shared by all callers through the cache
     return Q
 
 
@@ -806,15 +947,17 @@ def _guess_symbolic_coefficients(vec, alg_degree, verbose=False):
     if verbose:
         print("Trying to guess symbolic coefficients")
 
-    # fast attempt that works well if rational
-    v1, v2 = [], []
+    # fast attempt that works well if rational (stopping at the first entry
+    # that is not recognized consistently)
+    v1 = []
     for x in vec:
         if not x.imag().contains_zero(): break
         x, err = x.real().mid(), x.rad()
         err1, err2 = err, 2*err/3
-        v1.append(x.nearby_rational(max_error=x.parent()(err1)))
-        v2.append(x.nearby_rational(max_error=x.parent()(err2)))
-    if len(v1) == len(vec) and v1 == v2:
+        q = x.nearby_rational(max_error=x.parent()(err1))
+        if q != x.nearby_rational(max_error=x.parent()(err2)): break
+        v1.append(q)
+    if len(v1) == len(vec):
         if verbose:
             print("Found rational coefficients")
         return v1, QQ
@@ -822,11 +965,20 @@ def _guess_symbolic_coefficients(vec, alg_degree, verbose=False):
     p = accuracy(vec)
     if p<30: return "NothingFound", None
     for d in range(2, alg_degree + 1):
-        v1, v2 = [], []
+        # first try to recognize all the coefficients at once
+        symb_vec = _guess_in_common_number_field(vec, d, p)
+        if symb_vec is not None:
+            K, symb_vec = as_embedded_number_field_elements(symb_vec)
+            if all(symb_vec[i] in x for i, x in enumerate(vec)):
+                if verbose:
+                    print("Found algebraic coefficients in a number field of degree", K.degree())
+                return symb_vec, K
+        v1 = []
         for x in vec:
-            v1.append(algdep(x.mid(), degree=d, known_bits=p-10))
-            v2.append(algdep(x.mid(), degree=d, known_bits=p-20))
-        if v1 == v2:
+            pol = algdep(x.mid(), degree=d, known_bits=p-10)
+            if pol != algdep(x.mid(), degree=d, known_bits=p-20): break
+            v1.append(pol)
+        if len(v1) == len(vec):
             symb_vec = []
             for i, x in enumerate(vec):
                 roots = v1[i].roots(QQbar, multiplicities=False)
@@ -842,7 +994,49 @@ def _guess_symbolic_coefficients(vec, alg_degree, verbose=False):
 
     return "NothingFound", None
 
-_frobenius_norm = lambda m: sum([x.abs().mid()**2 for x in m.list()]).sqrt()
+def _guess_in_common_number_field(vec, d, p):
+    r"""
+    Try to recognize the entries of the ball vector ``vec`` (of accuracy ``p``)
+    as elements of a number field of degree at most ``d`` generated by a fixed
+    linear combination of them.
+
+    This only takes two calls to ``algdep`` (on the linear combination) and
+    two small integer relation searches per entry, instead of two calls to
+    ``algdep`` per entry. Return a list of algebraic numbers, or ``None`` if
+    nothing reasonable is found.
+    """
+    mids = [x.mid() for x in vec]
+    c = sum((i + 1)*x for i, x in enumerate(mids))
+    pol = algdep(c, degree=d, known_bits=p-10)
+    if pol != algdep(c, degree=d, known_bits=p-20):
+        return None
+    pol = min((fac for fac, _ in pol.factor()), key=lambda fac: abs(fac(c)))
+    k = pol.degree()
+    if k < 2:
+        return None
+    roots = pol.roots(QQbar, multiplicities=False)
+    alpha = min(roots, key=lambda rt: abs(rt - c))
+    # express each entry on the basis 1, c, ..., c^(k-1), keeping only small
+    # relations that are found consistently at two levels of precision
+    powers = [c**j for j in range(k)]
+    max_bits = (p - 20)//(k + 1) - 8
+    def relation(x, known_bits):
+        rel = [ZZ(a) for a in pari([x] + powers).lindep(int(known_bits*0.30103))]
+        if not rel or rel[0].is_zero():
+            return None
+        if rel[0] < 0:
+            rel = [-a for a in rel]
+        if max(a.abs() for a in rel).nbits() > max_bits:
+            return None
+        return rel
+    Pol = PolynomialRing(QQ, 'y')
+    symb_vec = []
+    for x in mids:
+        rel = relation(x, p - 10)
+        if rel is None or rel != relation(x, p - 20):
+            return None
+        symb_vec.append(Pol([-a/rel[0] for a in rel[1:]])(alpha))
+    return symb_vec
 
 def _formal_finite_sum_to_power_series(f, PSR):
     """
@@ -853,12 +1047,59 @@ def _formal_finite_sum_to_power_series(f, PSR):
     if isinstance(f, list):
         return [ _formal_finite_sum_to_power_series(g, PSR) for g in f ]
 
-    out = PSR.zero()
+    # build the dense list of coefficients and convert it in one go
+    coeffs = []
     for constant, monomial in f:
         if constant != 0:
-            out += constant*PSR.gen()**monomial.n
+            n = monomial.n
+            if n >= len(coeffs):
+                coeffs.extend([0]*(n + 1 - len(coeffs)))
+            coeffs[n] += constant
 
-    return out
+    return PSR(coeffs)
+
+def _local_basis_expansions(dop, order):
+    """
+    Same as ``dop.local_basis_expansions(0, order)``, except that the longest
+    expansions computed so far for ``dop`` are reused (and truncated) when
+    possible.
+
+    ASSUMPTIONS:
+
+    ``0`` is an ordinary point of ``dop``.
+    """
+    wrapper = DifferentialOperator(dop)
+    cached = getattr(wrapper, "_factorization_basis", None)
+    if cached is None or cached[0] < order:
+        # The callers double the truncation order when they retry: when the
+        # cached expansions are too short, compute at least twice as many
+        # terms so that the next retry is likely to find them in the cache
+        new_order = order if cached is None else max(order, 2*cached[0])
+        cached = (new_order, dop.local_basis_expansions(QQ.zero(), new_order))
+        wrapper._factorization_basis = cached
+    if cached[0] == order:
+        return cached[1]
+    return [ tuple(term for term in sol if term[1].n < order)
+             for sol in cached[1] ]
+
+@cached_function
+def _falling_factorial_coefficients(n):
+    r"""
+    Return the lists of coefficients of T(T-1)...(T-k+1) for k = 0, ..., n
+    (i.e., the signed Stirling numbers of the first kind).
+
+    EXAMPLES::
+
+        sage: from ore_algebra.analytic.factorization import _falling_factorial_coefficients
+        sage: _falling_factorial_coefficients(3)
+        ((1,), (0, 1), (0, -1, 1), (0, 2, -3, 1))
+    """
+    T = PolynomialRing(ZZ, 'T').gen()
+    ff, rows = T.parent().one(), []
+    for k in range(n + 1):
+        rows.append(tuple(ff.list()))
+        ff *= T - k
+    return tuple(rows)
 
 def _euler_representation(dop):
     r"""
@@ -866,20 +1107,19 @@ def _euler_representation(dop):
     the Euler operator z*Dz.
     """
     z, n = dop.base_ring().gen(), dop.order()
-    output = [ dop[0] ] + [0]*n
-    l = [0] # coefficients of T(T-1)...(T-k+1) (initial: k=0)
-
+    rows = _falling_factorial_coefficients(n)
+    # Accumulate the numerators over the common denominator z^n, so that only
+    # one division per coefficient takes place in the fraction field
+    zpow = [z**0]
+    for _ in range(n):
+        zpow.append(zpow[-1]*z)
+    num = [0]*(n + 1)
     for k in range(1, n+1):
-
-        newl = [0]
-        newl.extend((-k+1)*l[i]+l[i-1]for i in range(1, len(l)))
-        l = newl + [1]
-
-        ck = dop[k]
+        ck = dop[k]*zpow[n - k]
         for j in range(1, k+1):
-            output[j] += ck*z**(-k)*l[j]
+            num[j] += rows[k][j]*ck
 
-    return output
+    return [ dop[0] ] + [ num[j]/zpow[n] for j in range(1, n+1) ]
 
 def _substitution_map(dop, e):
     r"""
@@ -905,26 +1145,42 @@ def _substitution_map(dop, e):
         sage: dop(f.parent().gen()^3*f)
         O(t^21)
     """
-    l = _euler_representation(DifferentialOperator(dop))
+    # dop is typically a freshly guessed operator: clearing denominators is all
+    # _euler_representation needs, no need to build a full wrapper
+    l = _euler_representation(dop.numerator())
+    n = len(l)
+    epow = [e**0]
+    for _ in range(1, n):
+        epow.append(epow[-1]*e)
+    binom = [1] # binomial(i, k) for k = 0, ..., i
     for i, c in enumerate(l):
         for k in range(i):
-            l[k] += binomial(i, k)*e**(i - k)*c
+            l[k] += binom[k]*epow[i - k]*c
+        binom = [1] + [binom[k - 1] + binom[k] for k in range(1, i + 1)] + [1]
+    # Horner scheme (the coefficients stay on the left)
     T = dop.base_ring().gen()*dop.parent().gen()
-    output = sum(c*T**i for i, c in enumerate(l))
+    output = dop.parent().zero()
+    for c in reversed(l):
+        output = output*T + c
 
     return output
 
 def _factor(dop, verbose=False):
 
-    R = right_factor(dop, verbose)
-    if R is None:
-        return [dop]
-    OA = R.parent()
-    OA = OA.change_ring(OA.base_ring().fraction_field())
-    Q = OA(dop)//R
-    fac_left = _factor(Q, verbose)
-    fac_right = _factor(R, verbose)
-    return fac_left + fac_right
+    # Depth-first traversal of the factorization tree, left factors first,
+    # using an explicit worklist instead of recursion
+    fac, todo = [], [dop]
+    while todo:
+        dop = todo.pop()
+        R = right_factor(dop, verbose)
+        if R is None:
+            fac.append(dop)
+            continue
+        OA = R.parent()
+        OA = OA.change_ring(OA.base_ring().fraction_field())
+        Q = OA(dop)//R
+        todo.extend([R, Q])
+    return fac
 
 def _tests_ssw(): # to test all ssw examples
     b = True
@@ -893,7 +893,10 @@ def invariant_subspace(Mats, *, verbose=False):
     if len(Mats)==1:
         mat = Mats[0]
         Spaces = gen_eigenspaces(mat)
-        v = ker(mat - Spaces[0]['eigenvalue']*(mat.parent().one()))[0]
+        if Spaces[0]['multiplicity'] == 1:
+            v = Spaces[0]['basis'][0]
+        else:
+            v = ker(mat - Spaces[0]['eigenvalue']*(mat.parent().one()))[0]
         orb = orbit(Mats, v)
         if len(orb) == n:
             raise Exception("problem with invariant_subspace computation: case 'one matrix'")
@@ -943,11 +946,11 @@ def invariant_subspace(Mats, *, verbose=False):
 
 def _reduced_row_echelon_form(mat):
     R, p = row_echelon_form(mat, pivots=True)
-    rows = list(R)
-    for j in p.keys():
-        for i in range(p[j]):
-            rows[i] = rows[i] - rows[i][j]*rows[p[j]]
-    return matrix(rows)
+    # one rank-one update of the rows above each pivot
+    for j, i in p.items():
+        if i > 0:
+            R[:i,:] = R[:i,:] - R[:i,j]*R[i,:]
+    return R
 
 def _clean(pol):
 
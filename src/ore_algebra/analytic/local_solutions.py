@@ -735,7 +735,7 @@ class LocalExpansions(LocalBasisMapper):
     def __init__(self, dop, order=None, *, ctx=dctx):
         super().__init__(dop, ctx=ctx)
         if order is None:
-            ind = dop.indicial_polynomial(dop.base_ring().gen())
+            ind = dop._indicial_polynomial(dop.base_ring().gen())
             self.order = max(dop.order(), ind.dispersion()) + 3
         else:
             self.order = order
@@ -1183,14 +1183,18 @@ class Path(SageObject):
         gr += plot.line([z.iv().mid() for z in self.vert])
         gr.set_aspect_ratio(1)
         if disks:
+            # Add the primitives to gr in place: summing Graphics objects would
+            # copy the list of primitives for each new circle
             for step in self.steps():
                 z = step.start.iv().mid()
-                gr += plot.circle((z.real(), z.imag()),
-                                  step.start.dist_to_sing().lower(),
-                                  linestyle='dotted', color='red')
-                gr += plot.circle((z.real(), z.imag()),
-                                  step.length().lower(),
-                                  linestyle='dashed')
+                center = (z.real(), z.imag())
+                for circle in [
+                        plot.circle(center, step.start.dist_to_sing().lower(),
+                                    linestyle='dotted', color='red'),
+                        plot.circle(center, step.length().lower(),
+                                    linestyle='dashed')]:
+                    for prim in circle:
+                        gr.add_primitive(prim)
         return gr
 
     @cached_method
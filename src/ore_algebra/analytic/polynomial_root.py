@@ -8,7 +8,8 @@ from sage.rings.integer_ring import Z as ZZ
 from sage.rings.rational_field import Q as QQ
 from sage.rings.qqbar import QQbar
 from sage.rings.cif import CIF
-from sage.rings.complex_arb import CBF
+from sage.rings.complex_arb import CBF, ComplexBallField
+from sage.rings.complex_interval_field import ComplexIntervalField
 from sage.rings.number_field.number_field import NumberField, NumberField_quadratic
 from sage.rings.number_field.number_field_element import NumberFieldElement
 from sage.rings.polynomial.complex_roots import complex_roots
@@ -72,12 +73,49 @@ class PolynomialRoot(SageObject):
             return tgt(self.all_roots[self.index])
         alg = self.as_algebraic()
         if alg._value.prec() < prec:
-            # avoid the loop in AlgebraicNumber_base._more_precision()...
-            alg._value = alg._descr._interval_fast(prec)
+            # Avoid the loop in AlgebraicNumber_base._more_precision()...
+            # Callers typically increase the working precision geometrically,
+            # so refine (by interval Newton, starting from the current
+            # enclosure) to at least twice the previous precision.
+            prec1 = max(prec, 2*alg._value.prec())
+            alg._value = alg._descr._interval_fast(prec1)
+            # The refined enclosure is still an isolating interval; keep it
+            # (as a complex interval, like the other entries) so that later
+            # calls at lower precision do not go through alg.
+            iv = ComplexIntervalField(prec1)(alg._value)
+            if iv in self.all_roots[self.index]:
+                self.all_roots[self.index] = iv
         return tgt(alg._value)
 
     _acb_ = _complex_mpfr_field_ = _complex_mpfi_ = as_ball
 
+    def refine_all(self, prec):
+        r"""
+        Try to refine the enclosures of all the roots of ``self.pol`` to
+        precision ``prec`` using a single call to Arb's root finder.
+
+        Leaves the enclosures unchanged if this fails for any reason.
+        """
+        olds = self.all_roots
+        try:
+            balls = self.pol.roots(ComplexBallField(prec),
+                                   multiplicities=False)
+        except (TypeError, ValueError, NotImplementedError):
+            return
+        if len(balls) != len(olds):
+            return
+        Intervals = ComplexIntervalField(prec)
+        new = list(olds)
+        for b in balls:
+            iv = Intervals(b)
+            idx = [i for i, old in enumerate(olds) if iv.overlaps(old)]
+            # Each ball contains a root, so if it only meets one of the old
+            # isolating intervals, it encloses the same root.
+            if len(idx) != 1:
+                return
+            new[idx[0]] = iv
+        olds[:] = new
+
     def __complex__(self):
         return complex(self.all_roots[self.index])
 
@@ -315,6 +353,18 @@ class PolynomialRoot(SageObject):
         assert len(indices) == 1
         return cls(pol, list(roots), indices[0])
 
+def refine_roots(roots, prec):
+    r"""
+    Refine the enclosures of a collection of PolynomialRoot objects to
+    precision ``prec``, processing all roots of each polynomial at once.
+    """
+    todo = {}
+    for rt in roots:
+        if rt.all_roots[rt.index].prec() < prec:
+            todo.setdefault(id(rt.all_roots), rt)
+    for rt in todo.values():
+        rt.refine_all(prec)
+
 def roots_of_irred(pol):
     if pol.degree() == 1:
         pol = pol.monic()
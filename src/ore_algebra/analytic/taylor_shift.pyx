@@ -0,0 +1,73 @@
+# cython: language=c++
+# cython: language_level=3
+# distutils: extra_compile_args = -std=c++11
+r"""
+Taylor shifts of the coefficients of differential operators over ℚ
+"""
+
+from sage.libs.flint.fmpz cimport *
+from sage.libs.flint.fmpq_poly cimport *
+from sage.libs.flint.fmpz_poly cimport *
+
+from sage.rings.integer cimport Integer
+from sage.rings.polynomial.polynomial_rational_flint cimport Polynomial_rational_flint
+
+def qq(list pols, Integer num, Integer den, long deg):
+    r"""
+    Compute den^deg·p(x + num/den) for each p in pols.
+
+    The elements of pols must be polynomials over ℚ of degree at most deg, and
+    den must be positive.
+    """
+    cdef Polynomial_rational_flint pol, res
+    cdef fmpz_poly_t s
+    cdef fmpz_t c, pw, _num, _den
+    cdef long i, e
+    cdef list out = []
+
+    fmpz_poly_init(s)
+    fmpz_init(c)
+    fmpz_init(pw)
+    fmpz_init(_num)
+    fmpz_init(_den)
+    fmpz_set_mpz(_num, num.value)
+    fmpz_set_mpz(_den, den.value)
+
+    try:
+        for p in pols:
+            pol = <Polynomial_rational_flint?> p
+            res = pol._new()
+            e = fmpq_poly_degree(pol._poly)
+            if e < 0:
+                out.append(res)
+                continue
+            assert e <= deg
+            fmpq_poly_get_numerator(s, pol._poly)
+            # s(y) ← den^e·s(y/den)
+            fmpz_one(pw)
+            for i in range(e, -1, -1):
+                fmpz_poly_get_coeff_fmpz(c, s, i)
+                fmpz_mul(c, c, pw)
+                fmpz_poly_set_coeff_fmpz(s, i, c)
+                fmpz_mul(pw, pw, _den)
+            # s(y) ← s(y + num)
+            fmpz_poly_taylor_shift(s, s, _num)
+            # s(x) ← den^(deg-e)·s(den·x)
+            fmpz_pow_ui(pw, _den, deg - e)
+            for i in range(e + 1):
+                fmpz_poly_get_coeff_fmpz(c, s, i)
+                fmpz_mul(c, c, pw)
+                fmpz_poly_set_coeff_fmpz(s, i, c)
+                fmpz_mul(pw, pw, _den)
+            fmpq_poly_set_fmpz_poly(res._poly, s)
+            fmpq_poly_scalar_div_fmpz(res._poly, res._poly,
+                                      fmpq_poly_denref(pol._poly))
+            out.append(res)
+    finally:
+        fmpz_clear(_den)
+        fmpz_clear(_num)
+        fmpz_clear(pw)
+        fmpz_clear(c)
+        fmpz_poly_clear(s)
+
+    return out
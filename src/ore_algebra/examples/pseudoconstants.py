@@ -38,7 +38,11 @@ from sage.rings.integer import Integer
 from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing
 from sage.rings.rational_field import Q as QQ
 from ore_algebra import OreAlgebra
+import hashlib
+import importlib.util
+import marshal
 import os
+import sys
 
 path = os.path.dirname(__file__)
 
@@ -47,12 +51,60 @@ x = Pol.gen()
 Dif = OreAlgebra(Pol.fraction_field(), "Dx")
 Dx = Dif.gen()
 
-with open(os.path.join(path, "pseudoconstant_L9.sage")) as f:
-    lines = f.readlines()
+def _compiled_sage_file(filename):
+    r"""
+    Preparse and compile the Sage expression stored in ``filename``.
 
-L9 = Dif(eval("".join(preparse(l[:-1]) for l in lines)))
+    The code object is cached in ``__pycache__`` (when possible, and unless
+    ``sys.dont_write_bytecode`` is set), along with a hash of the source, so
+    that subsequent imports skip both the preparser and the Python parser.
+    """
+    with open(filename, "rb") as f:
+        src = f.read()
+    key = hashlib.sha256(importlib.util.MAGIC_NUMBER + src).digest()
+    tag = sys.implementation.cache_tag
+    if tag is None:
+        cache = None
+    else:
+        # not a .pyc file: use a name of our own
+        dirname, basename = os.path.split(filename)
+        cache = os.path.join(dirname, "__pycache__",
+                             f"{basename}.{tag}.marshal")
+    if cache is not None:
+        try:
+            with open(cache, "rb") as f:
+                if f.read(len(key)) == key:
+                    return marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+    lines = src.decode().splitlines()
+    code = compile("".join(preparse(l) for l in lines), filename, "eval")
+    if cache is not None and not sys.dont_write_bytecode:
+        try:
+            os.makedirs(os.path.dirname(cache), exist_ok=True)
+            tmp = f"{cache}.{os.getpid()}"
+            with open(tmp, "wb") as f:
+                f.write(key)
+                marshal.dump(code, f)
+            os.replace(tmp, cache)
+        except OSError:
+            pass
+    return code
 
-with open(os.path.join(path, "pseudoconstant_L9_pc.sage")) as f:
-    lines = f.readlines()
+_sage_files = {
+    "L9": "pseudoconstant_L9.sage",
+    "L9_pc": "pseudoconstant_L9_pc.sage",
+}
 
-L9_pc = Dif(eval("".join(preparse(l[:-1]) for l in lines)))
+def __getattr__(name):
+    # L9 and L9_pc are only loaded on first access
+    try:
+        filename = _sage_files[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    dop = Dif(eval(_compiled_sage_file(os.path.join(path, filename))))
+    globals()[name] = dop
+    return dop
+
+def __dir__():
+    return sorted(set(globals()) | set(_sage_files))
@@ -477,23 +477,32 @@ class UnivariateOreOperatorOverUnivariateRing(UnivariateOreOperator):
                       for i in range(len(coeffs)) if coeffs[i] != 0}
             flip = 1
 
+        # Vertices of the lower convex hull of the points (i, flip*j), in
+        # increasing order of i (Andrew's monotone chain)
+        hull = []
+        for (i2, j2) in points:
+            j2 = flip*j2
+            while len(hull) >= 2:
+                (i0, j0), (i1, j1) = hull[-2], hull[-1]
+                if (j1 - j0)*(i2 - i0) >= (j2 - j0)*(i1 - i0):
+                    hull.pop()
+                else:
+                    break
+            hull.append((i2, j2))
+
+        # One linear pass over the points to collect those lying on each edge
         output = []
         k = 0
-        infty = max([j for _, j in points]) + 2
-        while k < len(points) - 1:
-            (i1, j1) = points[k]
-            m = infty
+        for (i1, j1), (i2, j2) in zip(hull, hull[1:]):
+            m = (j2 - j1)/(i2 - i1)
             poly = coeffs[i1]
-            for l in range(k + 1, len(points)):
-                (i2, j2) = points[l]
-                m2 = flip*(j2 - j1)/(i2 - i1)
-                if m2 == m:
-                    k = l
-                    poly += coeffs[i2]*x**(i2 - i1)
-                elif m2 < m:
-                    m = m2
-                    k = l
-                    poly = coeffs[i1] + coeffs[i2]*x**(i2 - i1)
+            k += 1
+            while points[k][0] < i2:
+                (i, j) = points[k]
+                if flip*j - j1 == m*(i - i1):
+                    poly += coeffs[i]*x**(i - i1)
+                k += 1
+            poly += coeffs[i2]*x**(i2 - i1)
             output.append((m, poly))
 
         return output